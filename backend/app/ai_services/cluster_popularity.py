@@ -0,0 +1,121 @@
+import logging
+import numpy as np
+from bson import ObjectId
+from datetime import datetime
+from typing import Dict, List, Tuple
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from scipy import sparse
+
+from app.ai_services.interaction_matrix import InteractionMatrix
+from app.ai_services.popularity import PopularityScores
+from app.utils.constants import CLUSTER_WRITE_CHUNK_SIZE
+from app.utils.response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+class ClusterPopularJobs:
+    """
+    Tabel materialisasi job populer per cluster (koleksi `cluster_popular_jobs`).
+
+    Satu dokumen per pasangan (cluster_id, job_id) berisi total view seluruh anggota cluster
+    (`view_count`) dan skor popularitas yang meluruh terhadap waktu (`score`, lihat PopularityScores).
+    Tabel dibangun ulang setiap clustering selesai dan di-increment setiap ada log view baru,
+    sehingga rekomendasi cukup membaca top job satu cluster lewat index (cluster_id, score).
+    View yang masuk selama rebuild berjalan bisa tertimpa dan baru ikut terhitung di rebuild berikutnya.
+    """
+
+    def __init__(self, database: AsyncIOMotorDatabase):
+        self.collection = database.cluster_popular_jobs
+        self.applier_collection = database.appliers
+        self.interaction_matrix = InteractionMatrix.get_instance(database)
+        self.popularity = PopularityScores.get_instance(database)
+
+    async def rebuild(self) -> int:
+        """
+        Membangun ulang tabel dari matriks interaksi dan cluster_id applier saat ini.
+        Dokumen ditulis dengan upsert lalu dokumen dari generasi sebelumnya dihapus,
+        jadi tabel tidak pernah kosong selama rebuild.
+
+        Returns:
+            int: Jumlah pasangan (cluster, job) yang tersimpan
+        """
+        assignments = {}
+        cursor = self.applier_collection.find({"cluster_id": {"$ne": None}}, {"cluster_id": 1})
+        async for applier in cursor:
+            assignments[str(applier["_id"])] = applier["cluster_id"]
+
+        await self.interaction_matrix.refresh()
+        entries = self._cluster_job_counts(assignments)
+        scores = await self.popularity.rebuild(assignments)
+
+        generation = datetime.now()
+        operations = [
+            UpdateOne(
+                {"cluster_id": cluster_id, "job_id": ObjectId(job_id)},
+                {"$set": {
+                    "view_count": view_count,
+                    "score": scores.get((cluster_id, job_id), 0.0),
+                    "generation": generation
+                }},
+                upsert=True
+            )
+            for cluster_id, job_id, view_count in entries
+        ]
+        for i in range(0, len(operations), CLUSTER_WRITE_CHUNK_SIZE):
+            await self.collection.bulk_write(operations[i:i + CLUSTER_WRITE_CHUNK_SIZE], ordered=False)
+        await self.collection.delete_many({"generation": {"$ne": generation}})
+        await ResponseCache.get_instance().invalidate("recommendations")
+
+        logger.info(f"Cluster popular jobs rebuilt: {len(entries)} entries for {len(set(assignments.values()))} clusters")
+        return len(entries)
+
+    def _cluster_job_counts(self, assignments: Dict[str, int]) -> List[Tuple[int, str, int]]:
+        """Menjumlahkan baris matriks interaksi per cluster (cluster x job = keanggotaan x applier x job)"""
+        matrix = self.interaction_matrix.matrix
+        user_index = self.interaction_matrix.user_index
+        cluster_labels = sorted(set(assignments.values()))
+        cluster_position = {cluster_id: i for i, cluster_id in enumerate(cluster_labels)}
+
+        rows, cols = [], []
+        for user_id, cluster_id in assignments.items():
+            if user_id in user_index:
+                rows.append(cluster_position[cluster_id])
+                cols.append(user_index[user_id])
+
+        membership = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+            shape=(len(cluster_labels), matrix.shape[0])
+        )
+        sums = (membership @ matrix).tocoo()
+
+        job_ids = self.interaction_matrix.job_ids
+        return [
+            (cluster_labels[row], job_ids[col], int(count))
+            for row, col, count in zip(sums.row, sums.col, sums.data)
+            if count > 0
+        ]
+
+    async def record_view(self, applier_id: str, job_id: str, weight: float):
+        """Menambahkan satu view (dengan bobot popularitasnya) ke job di cluster milik applier (jika applier punya cluster)"""
+        applier = await self.applier_collection.find_one({"_id": ObjectId(applier_id)}, {"cluster_id": 1})
+        if not applier or applier.get("cluster_id") is None:
+            return
+
+        await self.collection.update_one(
+            {"cluster_id": applier["cluster_id"], "job_id": ObjectId(job_id)},
+            {"$inc": {"view_count": 1, "score": weight}},
+            upsert=True
+        )
+
+    async def get_top_jobs(self, cluster_id: int, limit: int, min_views: int = 0) -> List[dict]:
+        """
+        Mendapatkan job dengan skor popularitas tertinggi dalam satu cluster.
+
+        Returns:
+            list: Dokumen {"job_id", "view_count", "score"} terurut dari skor tertinggi
+        """
+        return await self.collection.find(
+            {"cluster_id": cluster_id, "view_count": {"$gte": min_views}},
+            {"_id": 0, "job_id": 1, "view_count": 1, "score": 1}
+        ).sort("score", -1).limit(limit).to_list(length=None)
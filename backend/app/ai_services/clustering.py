@@ -0,0 +1,183 @@
+import numpy as np
+from scipy import sparse
+from sklearn.cluster import DBSCAN, KMeans, MiniBatchKMeans
+from sklearn.decomposition import TruncatedSVD
+from sklearn.metrics import pairwise_distances_argmin
+from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.neighbors import NearestNeighbors
+from sklearn.preprocessing import normalize
+
+# Mode DBSCAN yang tersedia:
+# - "neighbors": graph tetangga sparse dalam radius eps (memori sebanding dengan jumlah tetangga)
+# - "precomputed": matriks jarak cosine n x n penuh (memori O(n^2), hanya untuk data kecil)
+DBSCAN_MODES = ("neighbors", "precomputed")
+
+def dbscan_precomputed(user_matrix, eps: float, min_samples: int) -> np.ndarray:
+    """
+    DBSCAN dengan matriks jarak cosine penuh (n x n).
+
+    Args:
+        user_matrix: Matriks fitur applier (dense atau sparse)
+        eps (float): Jarak cosine maksimal antar tetangga
+        min_samples (int): Jumlah tetangga minimal untuk core point
+
+    Returns:
+        np.ndarray: Label cluster per baris (-1 untuk noise)
+    """
+    similarity_matrix = cosine_similarity(user_matrix)
+    # Clip karena pembulatan float32 bisa menghasilkan jarak negatif yang sangat kecil
+    distance_matrix = np.clip(1 - similarity_matrix, 0, None)
+
+    clustering = DBSCAN(eps=eps, min_samples=min_samples, metric='precomputed')
+    return clustering.fit_predict(distance_matrix)
+
+def dbscan_neighbors(user_matrix, eps: float, min_samples: int) -> np.ndarray:
+    """
+    DBSCAN di atas graph tetangga sparse.
+
+    Vektor dinormalisasi L2 sehingga jarak cosine = ||a - b||^2 / 2, dan tetangga dalam
+    jarak cosine eps sama dengan tetangga dalam radius euclidean sqrt(2 * eps). Untuk input
+    sparse, NearestNeighbors menghitung jarak per blok (brute force) dan hanya menyimpan
+    pasangan di dalam radius. Untuk input dense berdimensi rendah (mis. hasil reduksi
+    dimensi), yang dipakai adalah ball tree.
+
+    Args:
+        user_matrix: Matriks fitur applier (dense atau sparse)
+        eps (float): Jarak cosine maksimal antar tetangga
+        min_samples (int): Jumlah tetangga minimal untuk core point
+
+    Returns:
+        np.ndarray: Label cluster per baris (-1 untuk noise)
+    """
+    normalized = normalize(user_matrix, norm="l2")
+    radius = np.sqrt(2 * eps)
+    algorithm = "brute" if sparse.issparse(normalized) else "ball_tree"
+
+    neighbors = NearestNeighbors(radius=radius, algorithm=algorithm)
+    neighbors.fit(normalized)
+    graph = neighbors.radius_neighbors_graph(normalized, mode="distance")
+
+    # Ubah jarak euclidean kembali ke jarak cosine agar eps punya arti yang sama dengan mode precomputed
+    graph.data = graph.data ** 2 / 2
+
+    clustering = DBSCAN(eps=eps, min_samples=min_samples, metric='precomputed')
+    return clustering.fit_predict(graph)
+
+def dbscan_labels(user_matrix, eps: float, min_samples: int, mode: str = "neighbors") -> np.ndarray:
+    """Menjalankan DBSCAN sesuai mode yang dipilih"""
+    if mode == "precomputed":
+        return dbscan_precomputed(user_matrix, eps, min_samples)
+    if mode == "neighbors":
+        return dbscan_neighbors(user_matrix, eps, min_samples)
+    raise ValueError(f"Unknown DBSCAN mode: {mode}")
+
+def kmeans_labels(user_matrix, n_clusters: int) -> np.ndarray:
+    """Menjalankan KMeans full-batch pada matriks fitur applier"""
+    kmeans = KMeans(n_clusters=n_clusters, random_state=42)
+    return kmeans.fit_predict(user_matrix)
+
+def minibatch_kmeans_fit(user_matrix, n_clusters: int, batch_size: int):
+    """
+    Fit MiniBatchKMeans dari awal pada seluruh applier.
+
+    Returns:
+        tuple: (label per baris, centroid, jumlah anggota per centroid)
+    """
+    kmeans = MiniBatchKMeans(n_clusters=n_clusters, batch_size=batch_size, random_state=42, n_init=3)
+    labels = kmeans.fit_predict(user_matrix)
+    counts = np.bincount(labels, minlength=n_clusters).astype(np.float64)
+    return labels, kmeans.cluster_centers_.astype(np.float32), counts
+
+def minibatch_kmeans_update(
+    user_matrix,
+    centroids: np.ndarray,
+    counts: np.ndarray,
+    batch_size: int,
+    previous_matrix=None,
+    previous_labels: np.ndarray = None
+):
+    """
+    Meng-assign applier ke centroid terdekat lalu menggeser centroid per mini-batch
+    (update mini-batch k-means: centroid = rata-rata berbobot centroid lama dan anggota baru).
+
+    Kontribusi lama applier yang berubah (baris pada refresh sebelumnya dan label-nya) dikeluarkan
+    dulu dari centroid, jadi setiap applier hanya dihitung satu kali di counts.
+
+    Args:
+        user_matrix: Baris applier yang baru/berubah (kolom sejajar dengan centroid)
+        centroids (np.ndarray): Centroid tersimpan (k x jumlah job)
+        counts (np.ndarray): Jumlah anggota di tiap centroid
+        batch_size (int): Jumlah baris per mini-batch
+        previous_matrix: Baris yang sama pada refresh sebelumnya (None jika tidak ada)
+        previous_labels (np.ndarray): Label refresh sebelumnya per baris (-1 untuk applier baru)
+
+    Returns:
+        tuple: (label per baris, centroid baru, jumlah anggota baru)
+    """
+    centroids = centroids.astype(np.float64, copy=True)
+    counts = counts.astype(np.float64, copy=True)
+    n_clusters = centroids.shape[0]
+    labels = np.empty(user_matrix.shape[0], dtype=np.int64)
+
+    if previous_matrix is not None:
+        remove_contributions(previous_matrix, previous_labels, centroids, counts)
+
+    for start in range(0, user_matrix.shape[0], batch_size):
+        batch = user_matrix[start:start + batch_size]
+        batch_labels = pairwise_distances_argmin(batch, centroids)
+        labels[start:start + batch.shape[0]] = batch_labels
+
+        membership = sparse.csr_matrix(
+            (np.ones(len(batch_labels)), (batch_labels, np.arange(len(batch_labels)))),
+            shape=(n_clusters, batch.shape[0])
+        )
+        sums = membership @ batch
+        sums = sums.toarray() if sparse.issparse(sums) else np.asarray(sums)
+        batch_counts = np.bincount(batch_labels, minlength=n_clusters).astype(np.float64)
+
+        updated = batch_counts > 0
+        total = counts[updated] + batch_counts[updated]
+        centroids[updated] = (counts[updated, None] * centroids[updated] + sums[updated]) / total[:, None]
+        counts[updated] = total
+
+    return labels, centroids.astype(np.float32), counts
+
+def remove_contributions(previous_matrix, previous_labels: np.ndarray, centroids: np.ndarray, counts: np.ndarray):
+    """Mengeluarkan baris lama dari centroid (in-place): jumlah anggota dikurangi, rata-rata dihitung ulang"""
+    n_clusters = centroids.shape[0]
+    row_nnz = previous_matrix.getnnz(axis=1) if sparse.issparse(previous_matrix) else np.count_nonzero(previous_matrix, axis=1)
+    rows = np.flatnonzero((previous_labels >= 0) & (row_nnz > 0))
+    if not rows.size:
+        return
+
+    row_labels = previous_labels[rows]
+    membership = sparse.csr_matrix(
+        (np.ones(rows.size), (row_labels, np.arange(rows.size))),
+        shape=(n_clusters, rows.size)
+    )
+    removed_sums = membership @ previous_matrix[rows]
+    removed_sums = removed_sums.toarray() if sparse.issparse(removed_sums) else np.asarray(removed_sums)
+    removed_counts = np.bincount(row_labels, minlength=n_clusters).astype(np.float64)
+
+    remaining = counts - removed_counts
+    # Centroid yang kehilangan semua anggotanya dibiarkan di posisi lama
+    updated = (removed_counts > 0) & (remaining > 0)
+    centroids[updated] = (
+        counts[updated, None] * centroids[updated] - removed_sums[updated]
+    ) / remaining[updated, None]
+    counts[:] = np.maximum(remaining, 0)
+
+def svd_fit_transform(user_matrix, n_components: int):
+    """
+    Fit proyeksi TruncatedSVD (randomized) langsung pada matriks sparse.
+
+    Returns:
+        tuple: (matriks tereduksi n x n_components, komponen proyeksi n_components x jumlah job)
+    """
+    svd = TruncatedSVD(n_components=n_components, algorithm="randomized", random_state=42)
+    reduced = svd.fit_transform(user_matrix)
+    return reduced.astype(np.float32), svd.components_.astype(np.float32)
+
+def svd_transform(user_matrix, components: np.ndarray) -> np.ndarray:
+    """Memproyeksikan matriks applier dengan komponen SVD yang tersimpan"""
+    return np.asarray(user_matrix @ components.T, dtype=np.float32)
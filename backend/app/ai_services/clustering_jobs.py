@@ -0,0 +1,105 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from app.config.db import Database
+from app.ai_services.recommendation_service import RecommendationService
+from app.models.recommendation_model import ClusteringJobResponse
+from app.utils.constants import CLUSTERING_JOB_HISTORY
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ("pending", "running")
+
+class ClusteringJobManager:
+    """
+    Menjalankan refresh cluster applier sebagai job background.
+
+    Submit langsung mengembalikan job, fitting dijalankan di process pool (lihat
+    RecommendationService._run_in_pool) dan status job bisa dicek lewat job_id.
+    Request yang sama saat job masih pending/running digabung ke job yang sudah ada,
+    dan job yang berbeda dijalankan bergantian karena sama-sama menulis cluster_id.
+    """
+    instance: Optional["ClusteringJobManager"] = None
+
+    def __init__(self):
+        self.jobs: "OrderedDict[str, ClusteringJobResponse]" = OrderedDict()
+        self._run_lock = asyncio.Lock()
+        self._tasks = set()
+
+    @classmethod
+    def get_instance(cls) -> "ClusteringJobManager":
+        """Mendapatkan instance ClusteringJobManager yang dipakai bersama dalam satu proses"""
+        if cls.instance is None:
+            cls.instance = cls()
+        return cls.instance
+
+    def submit(self, algorithm: str, params: Dict) -> ClusteringJobResponse:
+        """
+        Mendaftarkan job refresh cluster baru, atau mengembalikan job aktif dengan parameter yang sama.
+
+        Args:
+            algorithm (str): "dbscan" atau "kmeans"
+            params (dict): Parameter untuk fungsi clustering
+
+        Returns:
+            ClusteringJobResponse: Job yang dibuat atau job aktif yang digabung
+        """
+        for job in self.jobs.values():
+            if job.status in ACTIVE_STATUSES and job.algorithm == algorithm and job.params == params:
+                logger.info(f"Coalesced {algorithm} refresh into running job {job.job_id}")
+                return job
+
+        job = ClusteringJobResponse(job_id=uuid.uuid4().hex, algorithm=algorithm, params=params)
+        self.jobs[job.job_id] = job
+        self._evict_finished_jobs()
+
+        task = asyncio.create_task(self._run(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    def get_job(self, job_id: str) -> Optional[ClusteringJobResponse]:
+        """Mendapatkan job berdasarkan job_id"""
+        return self.jobs.get(job_id)
+
+    def list_jobs(self) -> List[ClusteringJobResponse]:
+        """Mendapatkan semua job, yang terbaru lebih dulu"""
+        return list(reversed(self.jobs.values()))
+
+    async def _run(self, job: ClusteringJobResponse):
+        async with self._run_lock:
+            job.status = "running"
+            job.started_at = datetime.now()
+            start = time.perf_counter()
+            try:
+                service = RecommendationService(Database.get_db())
+                if job.algorithm == "dbscan":
+                    result = await service.cluster_users_DBSCAN(**job.params)
+                else:
+                    result = await service.cluster_users_KMeans(**job.params)
+
+                if result is None:
+                    job.status = "failed"
+                    job.error = "No view data to cluster"
+                else:
+                    job.status = "completed"
+                    job.result = result
+            except Exception as e:
+                logger.error(f"Error in clustering job {job.job_id}: {e}")
+                job.status = "failed"
+                job.error = str(e)
+            finally:
+                job.finished_at = datetime.now()
+                job.duration_seconds = round(time.perf_counter() - start, 3)
+                logger.info(f"Clustering job {job.job_id} {job.status} in {job.duration_seconds}s")
+
+    def _evict_finished_jobs(self):
+        """Membuang job selesai yang paling lama jika history melebihi batas"""
+        finished = [job_id for job_id, job in self.jobs.items() if job.status not in ACTIVE_STATUSES]
+        for job_id in finished[:max(0, len(self.jobs) - CLUSTERING_JOB_HISTORY)]:
+            del self.jobs[job_id]
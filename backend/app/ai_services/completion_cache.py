@@ -0,0 +1,123 @@
+import hashlib
+import json
+import logging
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+
+from app.utils.cache import TTLCache
+from app.utils.constants import LLM_COMPLETION_CACHE_SIZE, LLM_COMPLETION_CACHE_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+class MongoCompletionStore:
+    """
+    Penyimpanan persisten untuk CompletionCache di koleksi MongoDB, dipakai bersama antar worker
+    dan bertahan antar restart. Entri kedaluwarsa lewat TTL index pada created_at
+    (lihat database_indexes.py).
+    """
+    name = "mongodb"
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def get(self, key: str) -> Optional[str]:
+        document = await self.collection.find_one({"_id": key}, {"content": 1})
+        return None if document is None else document["content"]
+
+    async def set(self, key: str, content: str, model: str):
+        await self.collection.replace_one(
+            {"_id": key},
+            {"content": content, "model": model, "created_at": datetime.now()},
+            upsert=True
+        )
+
+    async def clear(self):
+        await self.collection.delete_many({})
+
+class CompletionCache:
+    """
+    Cache balasan chat completion untuk GroqAPI.
+
+    Key = SHA-256 dari (model, system prompt, prompt, temperature, response_format). Hanya dipakai
+    untuk panggilan dengan temperature 0 (balasan deterministik), misalnya semua prompt parsing
+    resume. Entri disimpan di LRU in-memory (TTL), dan jika `store` diberikan (MongoCompletionStore)
+    juga di MongoDB sebagai lapisan kedua. Error dari store tidak menggagalkan panggilan LLM.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = LLM_COMPLETION_CACHE_SIZE,
+        ttl: float = LLM_COMPLETION_CACHE_TTL_SECONDS,
+        store: Optional[MongoCompletionStore] = None
+    ):
+        self.memory = TTLCache(maxsize, ttl)
+        self.store = store
+        self.hits: Counter = Counter()
+        self.misses = 0
+        self.errors = 0
+
+    @staticmethod
+    def key(
+        model: str,
+        system_prompt: Optional[str],
+        prompt: str,
+        temperature: float,
+        response_format: Optional[dict] = None
+    ) -> str:
+        payload = json.dumps(
+            [model, system_prompt or "", prompt, float(temperature), response_format],
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """Mendapatkan balasan tersimpan, None jika belum ada"""
+        content = self.memory.get(key)
+        if content is not None:
+            self.hits["memory"] += 1
+            return content
+
+        if self.store is not None:
+            try:
+                content = await self.store.get(key)
+            except Exception as e:
+                self._store_error("get", e)
+            if content is not None:
+                self.hits[self.store.name] += 1
+                self.memory.set(key, content)
+                return content
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, content: str, model: str):
+        """Menyimpan balasan ke memory dan store (jika ada)"""
+        self.memory.set(key, content)
+        if self.store is not None:
+            try:
+                await self.store.set(key, content, model)
+            except Exception as e:
+                self._store_error("set", e)
+
+    async def clear(self):
+        self.memory.clear()
+        if self.store is not None:
+            await self.store.clear()
+
+    def metrics(self) -> dict:
+        """Jumlah hit (per lapisan), miss, dan hit ratio"""
+        hits = sum(self.hits.values())
+        return {
+            "store": self.store.name if self.store is not None else None,
+            "entries": len(self.memory),
+            "hits": dict(self.hits),
+            "misses": self.misses,
+            "hit_ratio": round(hits / (hits + self.misses), 4) if hits + self.misses else 0.0,
+            "errors": self.errors,
+        }
+
+    def _store_error(self, operation: str, error: Exception):
+        self.errors += 1
+        logger.warning(f"LLM completion cache {operation} failed: {error}")
@@ -0,0 +1,276 @@
+import asyncio
+import logging
+import numpy as np
+from bson import ObjectId
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from scipy import sparse
+
+from app.utils.constants import INTERACTION_SYNC_BATCH_SIZE, INTERACTION_WATERMARK_LAG_SECONDS
+
+logger = logging.getLogger(__name__)
+
+STATE_ID = "interaction_matrix"
+
+class InteractionMatrix:
+    """
+    Matriks interaksi applier x job (sparse CSR) yang diperbarui secara inkremental.
+
+    Jumlah view per pasangan (applier, job) disimpan di koleksi `applier_job_interactions`,
+    sedangkan watermark (`_id` dan `timestamp` log terakhir yang sudah diproses) disimpan di
+    koleksi `recommendation_state`. Setiap refresh hanya membaca log_views yang lebih baru dari
+    watermark, jadi biayanya sebanding dengan jumlah view baru, bukan seluruh history.
+
+    Watermark tertinggal INTERACTION_WATERMARK_LAG_SECONDS dari waktu sekarang, karena ObjectId
+    dari beberapa worker tidak terurut pasti dalam satu detik. Setiap refresh adalah batch bernomor
+    (batch_seq) dengan rentang log yang dicatat di state sebelum jumlah view ditulis. Update jumlah
+    view hanya berlaku untuk dokumen yang belum memuat batch tersebut, jadi jika proses mati di
+    tengah jalan, batch yang sama diulang saat load tanpa menghitung view dua kali.
+    """
+    instance: Optional["InteractionMatrix"] = None
+
+    def __init__(self, database: AsyncIOMotorDatabase):
+        self.db = database
+        self.log_views_collection = database.log_views
+        self.interaction_collection = database.applier_job_interactions
+        self.state_collection = database.recommendation_state
+
+        self.user_index: Dict[str, int] = {}
+        self.user_ids: List[str] = []
+        self.job_index: Dict[str, int] = {}
+        self.job_ids: List[str] = []
+        self.matrix = sparse.csr_matrix((0, 0), dtype=np.float32)
+
+        self.last_log_id: Optional[ObjectId] = None
+        self.last_timestamp: Optional[datetime] = None
+        self.batch_seq = 0
+        self.loaded = False
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def get_instance(cls, database: AsyncIOMotorDatabase) -> "InteractionMatrix":
+        """Mendapatkan instance InteractionMatrix yang dipakai bersama dalam satu proses"""
+        if cls.instance is None:
+            cls.instance = cls(database)
+        return cls.instance
+
+    async def refresh(self) -> int:
+        """
+        Memasukkan log_views baru (setelah watermark) ke dalam matriks.
+
+        Returns:
+            int: Jumlah log view baru yang diproses
+        """
+        async with self._lock:
+            if not self.loaded:
+                await self._load()
+
+            cutoff = ObjectId.from_datetime(datetime.now(timezone.utc) - timedelta(seconds=INTERACTION_WATERMARK_LAG_SECONDS))
+            query = self._range_query(self.last_log_id, None)
+            query["_id"]["$lt"] = cutoff
+            last_log = await self.log_views_collection.find_one(query, {"_id": 1}, sort=[("_id", -1)])
+            if last_log is None:
+                return 0
+
+            batch = {"seq": self.batch_seq + 1, "since_log_id": self.last_log_id, "until_log_id": last_log["_id"]}
+            await self.state_collection.update_one({"_id": STATE_ID}, {"$set": {"pending_batch": batch}}, upsert=True)
+
+            pair_counts, new_views, last_timestamp = await self._read_batch(batch)
+            await self._persist(batch, pair_counts, last_timestamp)
+            self._apply(pair_counts)
+            self.batch_seq = batch["seq"]
+            self.last_log_id = batch["until_log_id"]
+            self.last_timestamp = last_timestamp or self.last_timestamp
+
+            logger.info(
+                f"Interaction matrix refreshed: {new_views} new views, "
+                f"shape={self.matrix.shape}, nnz={self.matrix.nnz}"
+            )
+            return new_views
+
+    def features(self) -> Tuple[List[str], sparse.csr_matrix]:
+        """
+        Mendapatkan matriks fitur applier untuk clustering.
+        Nilai view dinormalisasi ke rentang 0-1 dengan membaginya dengan view terbanyak.
+
+        Returns:
+            tuple: (list applier ID sesuai urutan baris, matriks CSR ternormalisasi)
+        """
+        user_matrix = self.matrix.copy()
+        if user_matrix.nnz:
+            max_views = user_matrix.data.max()
+            logger.info(f"Maximum view count: {max_views}")
+            user_matrix.data /= max_views
+        return list(self.user_ids), user_matrix
+
+    def aligned_rows(self, user_ids: List[str], job_ids: List[str]) -> Tuple[List[str], sparse.csr_matrix, List[str]]:
+        """
+        Mengambil baris applier tertentu dengan urutan kolom mengikuti job_ids yang diberikan
+        (mis. urutan kolom centroid tersimpan). Job yang belum ada di job_ids ditambahkan di akhir.
+
+        Args:
+            user_ids (list): Applier ID yang ingin diambil (yang tidak ada di matriks dilewati)
+            job_ids (list): Urutan kolom yang diinginkan
+
+        Returns:
+            tuple: (applier ID yang ditemukan, matriks CSR jumlah view, urutan kolom lengkap)
+        """
+        found_user_ids = [user_id for user_id in user_ids if user_id in self.user_index]
+        rows = self.matrix[[self.user_index[user_id] for user_id in found_user_ids]]
+        aligned, job_ids = self.align_columns(rows, job_ids)
+        return found_user_ids, aligned, job_ids
+
+    def align_columns(self, matrix: sparse.csr_matrix, job_ids: List[str]) -> Tuple[sparse.csr_matrix, List[str]]:
+        """
+        Menyusun ulang kolom matriks (urutan kolom = self.job_ids) agar mengikuti job_ids yang diberikan.
+        Job yang belum ada di job_ids ditambahkan di akhir.
+
+        Returns:
+            tuple: (matriks CSR dengan kolom yang sudah disejajarkan, urutan kolom lengkap)
+        """
+        job_ids = list(job_ids)
+        position = {job_id: i for i, job_id in enumerate(job_ids)}
+        # Kolom hanya pernah ditambah di akhir, jadi kolom ke-i matriks lama tetap self.job_ids[i]
+        current_job_ids = self.job_ids[:matrix.shape[1]]
+        for job_id in current_job_ids:
+            if job_id not in position:
+                position[job_id] = len(job_ids)
+                job_ids.append(job_id)
+
+        column_map = np.array([position[job_id] for job_id in current_job_ids], dtype=np.int64)
+        aligned = sparse.csr_matrix(
+            (matrix.data, column_map[matrix.indices], matrix.indptr),
+            shape=(matrix.shape[0], len(job_ids))
+        )
+        aligned.sort_indices()
+        return aligned, job_ids
+
+    @staticmethod
+    def _range_query(since_log_id: Optional[ObjectId], until_log_id: Optional[ObjectId]) -> dict:
+        query = {"_id": {}}
+        if since_log_id is not None:
+            query["_id"]["$gt"] = since_log_id
+        if until_log_id is not None:
+            query["_id"]["$lte"] = until_log_id
+        return query
+
+    async def _read_batch(self, batch: dict) -> Tuple[Dict[Tuple[str, str], int], int, Optional[datetime]]:
+        """Menghitung jumlah view per pasangan (applier, job) di rentang log satu batch"""
+        cursor = self.log_views_collection.find(
+            self._range_query(batch["since_log_id"], batch["until_log_id"]),
+            {"applier_id": 1, "job_id": 1, "timestamp": 1}
+        ).sort("_id", 1).batch_size(INTERACTION_SYNC_BATCH_SIZE)
+
+        pair_counts = defaultdict(int)
+        new_views = 0
+        last_timestamp = None
+        async for log in cursor:
+            pair_counts[(str(log["applier_id"]), str(log["job_id"]))] += 1
+            last_timestamp = log.get("timestamp", last_timestamp)
+            new_views += 1
+        return pair_counts, new_views, last_timestamp
+
+    def _apply(self, pair_counts: Dict[Tuple[str, str], int]):
+        """Menambahkan jumlah view baru ke matriks, memperluas baris/kolom bila perlu"""
+        rows, cols, data = [], [], []
+        for (user_id, job_id), count in pair_counts.items():
+            rows.append(self._row_for(user_id))
+            cols.append(self._col_for(job_id))
+            data.append(count)
+
+        shape = (len(self.user_ids), len(self.job_ids))
+        delta = sparse.csr_matrix((data, (rows, cols)), shape=shape, dtype=np.float32)
+        self.matrix.resize(shape)
+        self.matrix = (self.matrix + delta).tocsr()
+
+    def _row_for(self, user_id: str) -> int:
+        if user_id not in self.user_index:
+            self.user_index[user_id] = len(self.user_ids)
+            self.user_ids.append(user_id)
+        return self.user_index[user_id]
+
+    def _col_for(self, job_id: str) -> int:
+        if job_id not in self.job_index:
+            self.job_index[job_id] = len(self.job_ids)
+            self.job_ids.append(job_id)
+        return self.job_index[job_id]
+
+    async def _load(self):
+        """Memuat matriks dan watermark yang tersimpan di database"""
+        state = await self.state_collection.find_one({"_id": STATE_ID})
+        if state is None or "batch_seq" not in state:
+            # Tanpa watermark (atau state format lama yang bisa menghitung ulang view), isi koleksi
+            # interaksi tidak bisa dipercaya. Bangun ulang dari awal.
+            await self.interaction_collection.delete_many({})
+            await self.state_collection.delete_one({"_id": STATE_ID})
+            self.loaded = True
+            return
+
+        pending = state.get("pending_batch")
+        if pending is not None and pending["seq"] > state["batch_seq"]:
+            # Refresh sebelumnya berhenti di tengah penulisan: ulangi batch yang sama (idempoten)
+            pair_counts, _, last_timestamp = await self._read_batch(pending)
+            await self._persist(pending, pair_counts, last_timestamp or state.get("last_timestamp"))
+            logger.warning(f"Replayed interrupted interaction batch {pending['seq']}")
+            state = await self.state_collection.find_one({"_id": STATE_ID})
+
+        rows, cols, data = [], [], []
+        cursor = self.interaction_collection.find(
+            {}, {"applier_id": 1, "job_id": 1, "count": 1}
+        ).batch_size(INTERACTION_SYNC_BATCH_SIZE)
+        async for doc in cursor:
+            rows.append(self._row_for(str(doc["applier_id"])))
+            cols.append(self._col_for(str(doc["job_id"])))
+            data.append(doc["count"])
+
+        shape = (len(self.user_ids), len(self.job_ids))
+        self.matrix = sparse.csr_matrix((data, (rows, cols)), shape=shape, dtype=np.float32)
+        self.last_log_id = state.get("last_log_id")
+        self.last_timestamp = state.get("last_timestamp")
+        self.batch_seq = state["batch_seq"]
+        self.loaded = True
+
+        logger.info(f"Interaction matrix loaded: shape={self.matrix.shape}, nnz={self.matrix.nnz}")
+
+    async def _persist(self, batch: dict, pair_counts: Dict[Tuple[str, str], int], last_timestamp: Optional[datetime]):
+        """
+        Menyimpan penambahan view dan watermark baru ke database.
+        Jumlah view hanya ditambah pada dokumen yang belum pernah ditulis oleh batch ini (field batch < seq).
+        """
+        seq = batch["seq"]
+        operations = [
+            UpdateOne(
+                {"applier_id": ObjectId(user_id), "job_id": ObjectId(job_id)},
+                [{"$set": {
+                    "count": {"$cond": [
+                        {"$lt": [{"$ifNull": ["$batch", 0]}, seq]},
+                        {"$add": [{"$ifNull": ["$count", 0]}, count]},
+                        "$count"
+                    ]},
+                    "batch": {"$max": [{"$ifNull": ["$batch", 0]}, seq]}
+                }}],
+                upsert=True
+            )
+            for (user_id, job_id), count in pair_counts.items()
+        ]
+        for i in range(0, len(operations), INTERACTION_SYNC_BATCH_SIZE):
+            await self.interaction_collection.bulk_write(
+                operations[i:i + INTERACTION_SYNC_BATCH_SIZE], ordered=False
+            )
+
+        await self.state_collection.update_one(
+            {"_id": STATE_ID},
+            {
+                "$set": {
+                    "batch_seq": seq,
+                    "last_log_id": batch["until_log_id"],
+                    "last_timestamp": last_timestamp,
+                    "updated_at": datetime.now()
+                },
+                "$unset": {"pending_batch": ""}
+            },
+            upsert=True
+        )
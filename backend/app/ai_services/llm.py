@@ -1,15 +1,104 @@
 import httpx
+import logging
+from collections import Counter
+from importlib.util import find_spec
+from typing import Any, Callable, Optional
+
+from app.ai_services.completion_cache import CompletionCache
+from app.utils.constants import (
+    GROQ_TIMEOUT_SECONDS,
+    GROQ_CONNECT_TIMEOUT_SECONDS,
+    GROQ_MAX_CONNECTIONS,
+    GROQ_MAX_KEEPALIVE_CONNECTIONS,
+    GROQ_KEEPALIVE_EXPIRY_SECONDS
+)
+
+logger = logging.getLogger(__name__)
 
 class GroqAPI:
-    def __init__(self, api_key: str, base_url: str = "https://api.groq.com/openai/v1/chat/completions"):
+    """
+    Client Groq chat completions.
+
+    Satu httpx.AsyncClient dipakai untuk semua request (connection pool + keep-alive), jadi
+    handshake TCP/TLS hanya terjadi saat koneksi baru dibuka. HTTP/2 dipakai jika package `h2`
+    terinstall (atau bisa dipaksa lewat parameter http2). Client dibuat saat pertama dipakai
+    dan harus ditutup dengan close() (dipanggil di shutdown aplikasi lewat Container).
+    Jika `cache` diberikan, balasan untuk panggilan dengan temperature 0 diambil dari CompletionCache.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.groq.com/openai/v1/chat/completions",
+        timeout: float = GROQ_TIMEOUT_SECONDS,
+        connect_timeout: float = GROQ_CONNECT_TIMEOUT_SECONDS,
+        max_connections: int = GROQ_MAX_CONNECTIONS,
+        max_keepalive_connections: int = GROQ_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = GROQ_KEEPALIVE_EXPIRY_SECONDS,
+        http2: Optional[bool] = None,
+        cache: Optional[CompletionCache] = None
+    ):
         self.api_key = api_key
         self.url = base_url
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        h2_installed = find_spec("h2") is not None
+        if http2 and not h2_installed:
+            logger.warning("HTTP/2 requested for GroqAPI but package `h2` is not installed, using HTTP/1.1")
+        self.http2 = h2_installed if http2 is None else bool(http2 and h2_installed)
+        self._client: Optional[httpx.AsyncClient] = None
+        self.cache = cache
+        # Total token yang dilaporkan API (prompt_tokens, completion_tokens, total_tokens)
+        self.usage: Counter = Counter()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Client yang dipakai bersama, dibuat ulang jika sudah ditutup"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2
+            )
+        return self._client
+
+    async def close(self):
+        """Menutup semua koneksi di pool"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def get_response(
+        self, 
+        prompt: str, 
+        system_prompt: str = None, 
+        model: str = "llama-3.3-70b-versatile", 
+        temperature: float = 0.4, 
+        response_format: Optional[dict] = None,
+        validate: Optional[Callable[[str], Any]] = None
+    ):
+        """
+        Mengirim satu chat completion dan mengembalikan isi pesan balasan.
+        response_format={"type": "json_object"} memaksa balasan berupa JSON valid (JSON mode).
+        Balasan untuk temperature 0 di-cache jika GroqAPI memiliki cache. Jika `validate` diberikan,
+        balasan hanya di-cache saat validate(balasan) tidak melempar exception (mis. JSON yang bisa diproses).
+        """
+        cache_key = None
+        if self.cache is not None and temperature == 0:
+            cache_key = self.cache.key(model, system_prompt, prompt, temperature, response_format)
+            content = await self.cache.get(cache_key)
+            if content is not None:
+                return content
 
-    async def get_response(self,  prompt: str, system_prompt: str = None, model: str = "llama-3.3-70b-versatile", temperature: float = 0.4):
         messages = []
 
         if system_prompt:
@@ -21,8 +110,25 @@ class GroqAPI:
             "messages": messages,
             "temperature": temperature
         }
+        if response_format:
+            data["response_format"] = response_format
+
+        response = await self.client.post(self.url, json=data)
+        result = response.json()
+        for key, value in (result.get("usage") or {}).items():
+            if isinstance(value, int):
+                self.usage[key] += value
+        content = result['choices'][0]['message']['content']
+        if cache_key is not None and self._is_valid(content, validate):
+            await self.cache.set(cache_key, content, model)
+        return content
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(self.url, headers=self.headers, json=data)
-            result = response.json()
-            return result['choices'][0]['message']['content']
\ No newline at end of file
+    @staticmethod
+    def _is_valid(content: str, validate: Optional[Callable[[str], Any]]) -> bool:
+        if validate is None:
+            return True
+        try:
+            validate(content)
+            return True
+        except Exception:
+            return False
@@ -0,0 +1,118 @@
+import io
+import logging
+import numpy as np
+from bson import BSON, Binary, ObjectId
+from datetime import datetime
+from typing import Dict, Optional
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.utils.constants import MODEL_CHUNK_SIZE_BYTES, MODEL_STATE_MAX_BYTES
+
+logger = logging.getLogger(__name__)
+
+# Batas aman dokumen metadata (batas BSON MongoDB 16 MB)
+MAX_METADATA_BYTES = 15 * 1024 * 1024
+
+class ModelStore:
+    """
+    Menyimpan state model rekomendasi (array numpy + metadata).
+
+    Metadata disimpan di koleksi recommendation_models, sedangkan isi array dipecah menjadi
+    chunk berukuran MODEL_CHUNK_SIZE_BYTES di koleksi recommendation_model_chunks, agar array besar
+    (misalnya komponen SVD n_components x jumlah job) tidak melewati batas 16 MB satu dokumen BSON.
+    Chunk ditulis dengan versi baru sebelum dokumen metadata diganti, jadi pembaca selalu melihat
+    versi lama yang utuh atau versi baru yang utuh.
+    """
+
+    def __init__(self, database: AsyncIOMotorDatabase):
+        self.collection = database.recommendation_models
+        self.chunk_collection = database.recommendation_model_chunks
+
+    async def save(self, name: str, arrays: Dict[str, np.ndarray], **metadata):
+        """
+        Menyimpan array model beserta metadata-nya.
+
+        Args:
+            name (str): Nama model (dipakai sebagai _id dokumen)
+            arrays (dict): Nama array -> np.ndarray
+            **metadata: Field tambahan yang disimpan apa adanya
+
+        Raises:
+            ValueError: Jika total ukuran array melebihi MODEL_STATE_MAX_BYTES atau metadata melebihi batas BSON
+        """
+        serialized = {key: self._to_bytes(value) for key, value in arrays.items()}
+        total_bytes = sum(len(data) for data in serialized.values())
+        if total_bytes > MODEL_STATE_MAX_BYTES:
+            raise ValueError(
+                f"Model state '{name}' is {total_bytes / 2**20:.0f} MB, "
+                f"larger than the {MODEL_STATE_MAX_BYTES / 2**20:.0f} MB limit"
+            )
+
+        version = ObjectId()
+        document = {
+            "arrays": {
+                key: {"chunks": -(-len(data) // MODEL_CHUNK_SIZE_BYTES), "bytes": len(data)}
+                for key, data in serialized.items()
+            },
+            "version": version,
+            "updated_at": datetime.now(),
+            **metadata
+        }
+        if len(BSON.encode({"_id": name, **document})) > MAX_METADATA_BYTES:
+            raise ValueError(f"Metadata of model state '{name}' exceeds the BSON document limit")
+
+        for key, data in serialized.items():
+            for index, offset in enumerate(range(0, len(data), MODEL_CHUNK_SIZE_BYTES)):
+                await self.chunk_collection.insert_one({
+                    "model": name,
+                    "version": version,
+                    "array": key,
+                    "index": index,
+                    "data": Binary(data[offset:offset + MODEL_CHUNK_SIZE_BYTES])
+                })
+
+        await self.collection.replace_one({"_id": name}, document, upsert=True)
+        await self.chunk_collection.delete_many({"model": name, "version": {"$ne": version}})
+        logger.info(f"Saved model state '{name}' ({total_bytes / 2**20:.1f} MB)")
+
+    async def load(self, name: str) -> Optional[dict]:
+        """
+        Memuat state model yang tersimpan.
+
+        Returns:
+            dict: Dokumen model dengan field "arrays" berisi np.ndarray, atau None jika belum ada
+        """
+        document = await self.collection.find_one({"_id": name})
+        if document is None:
+            return None
+
+        arrays = {}
+        for key, value in document.get("arrays", {}).items():
+            if isinstance(value, bytes):
+                # Format lama: array disimpan langsung di dokumen metadata
+                arrays[key] = self._from_bytes(value)
+                continue
+            chunks = self.chunk_collection.find(
+                {"model": name, "version": document.get("version"), "array": key}
+            ).sort("index", 1)
+            data = b"".join([chunk["data"] async for chunk in chunks])
+            if len(data) != value["bytes"]:
+                raise ValueError(f"Model state '{name}' array '{key}' is incomplete")
+            arrays[key] = self._from_bytes(data)
+        document["arrays"] = arrays
+        return document
+
+    async def delete(self, name: str):
+        """Menghapus state model"""
+        await self.collection.delete_one({"_id": name})
+        await self.chunk_collection.delete_many({"model": name})
+
+    @staticmethod
+    def _to_bytes(array: np.ndarray) -> bytes:
+        buffer = io.BytesIO()
+        np.save(buffer, array, allow_pickle=False)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _from_bytes(data: bytes) -> np.ndarray:
+        return np.load(io.BytesIO(data), allow_pickle=False)
@@ -16,20 +16,29 @@ class OCR:
         self.overlay = overlay
 
     async def ocr_space_file(self, filename: str):
+        with open(filename, 'rb') as f:
+            return await self._ocr_space_upload(filename, f)
+
+    async def ocr_space_bytes(self, content: bytes, filename: str = 'resume.pdf'):
+        """ OCR.space API request dengan isi file di memory (tanpa file sementara).
+        filename: Nama file yang dikirim, ekstensinya dipakai OCR.space untuk menentukan tipe file.
+        """
+        return await self._ocr_space_upload(filename, content)
+
+    async def _ocr_space_upload(self, filename: str, file):
         payload = {
             'isOverlayRequired': self.overlay,
             'apikey': self.api_key,
             'language': self.language,
         }
 
-        with open(filename, 'rb') as f:
-            files = {'file': (filename, f, 'application/octet-stream')}
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    'https://api.ocr.space/parse/image',
-                    data=payload,
-                    files=files
-                )
+        files = {'file': (filename, file, 'application/octet-stream')}
+        async with httpx.AsyncClient() as client:
+            response = await client.post(
+                'https://api.ocr.space/parse/image',
+                data=payload,
+                files=files
+            )
 
         response_json = response.json()
         if response.status_code != 200:
@@ -1,70 +1,378 @@
+import asyncio
 import fitz
 import json 
 import re
 import os
 import logging
-from typing import List
+from concurrent.futures.process import BrokenProcessPool
+from fastapi import HTTPException, status
+from functools import partial
+from typing import Any, Callable, List, Optional, Tuple
 
 from app.ai_services.llm import GroqAPI
 from app.models.resume_model import *
 from app.utils.constants import LOCATION_KEYWORDS, SKILL_PARSING_QUERY, LOCATION_PARSING_QUERY, EDUCATION_PARSING_QUERY, EXPERIENCE_PARSING_QUERY, ACHIEVEMENT_PARSING_QUERY, DESCRIPTION_PARSING_QUERY
+from app.utils.constants import RESUME_PARSE_CONCURRENCY, RESUME_SECTION_TIMEOUT_SECONDS, RESUME_ONE_SHOT_PARSING_QUERY, RESUME_PARSING_WORKERS
+from app.utils.process_pool import ProcessPool
 
 logger = logging.getLogger("resume_parser_module")
 
+SECTION_KEYWORDS = {
+    "skills": ["skill", "skills", "kemampuan", "keahlian", "technical skills", "kecakapan", "ability", "abilities",
+               "skills and abilities"],
+    "achievements": ["achievement", "achievements", "pencapaian", "prestasi", "penghargaan", "certification", "sertifikat", "certifications"],
+    "educations": ["education", "educations", "pendidikan", "riwayat pendidikan"],
+    "experiences": ["experience", "experiences", "pengalaman", "work history", "riwayat pekerjaan", "riwayat jabatan", "organization"
+                    "organisasi", "organizations", "organizational", "work experience", "work experiences"]
+}
+
+def extract_pdf_text(filepath: Optional[str] = None, content: Optional[bytes] = None) -> str:
+    """Ekstrak semua teks dari file PDF (dari memory jika content diberikan, selain itu dari filepath)."""
+    try:
+        if content is not None:
+            doc = fitz.open(stream=content, filetype="pdf")
+        else:
+            doc = fitz.open(filepath)
+        with doc:
+            text = ''
+            for page in doc:
+                text += page.get_text()
+        return text
+    except Exception as e:
+        raise Exception(f"Error extracting text from PDF: {str(e)}")
+
+# Karakter yang boleh muncul setelah keyword header (setelah spasi/tab opsional)
+HEADER_TERMINATOR = r'[ \t]*(?::|●|•|\*|-|–|\.|\s|$)'
+
+class SectionHeaderMatcher:
+    """
+    Pencari header section resume yang dikompilasi sekali untuk satu set keyword.
+
+    Aturan header sama seperti regex per keyword yang dulu dibuat di _identify_sections
+    (lihat keyword_pattern), tetapi teks hanya dipindai satu kali: regex gabungan (semua keyword
+    dalam satu alternation, MULTILINE) mencari baris yang mungkin berisi header, lalu hanya
+    baris tersebut dicek dengan pattern per keyword yang sudah dikompilasi.
+    """
+
+    def __init__(self, section_keywords: dict):
+        self.keyword_patterns = [
+            (section_name, self.keyword_pattern(keyword))
+            for section_name, keywords in section_keywords.items()
+            for keyword in keywords
+        ]
+        # Keyword panjang didahulukan agar alternation tidak berhenti di prefix keyword lain
+        keywords = sorted({keyword for _, keywords in section_keywords.items() for keyword in keywords}, key=len, reverse=True)
+        self.candidate_pattern = re.compile(
+            rf'^[ \t]*(?:\S{{0,3}}[ \t]*)?(?:{"|".join(re.escape(keyword) for keyword in keywords)}){HEADER_TERMINATOR}',
+            re.IGNORECASE | re.MULTILINE
+        )
+
+    @staticmethod
+    def keyword_pattern(keyword: str) -> re.Pattern:
+        """Pattern satu keyword, dicocokkan (match) tepat di awal baris"""
+        # Aturan keyword, ditulis biar Rama nggak lupa yang dia coding sendiri
+        return re.compile(
+            # Keyword harus muncul di awal baris (posisi match)
+            rf'[ \t]*'
+            # Maksimal 3 huruf sebelum keyword
+            rf'(?:\S{{0,3}}[ \t]*)?'
+            # Ini adalah keyword yang kita cari
+            rf'({re.escape(keyword)})'
+            # Setelah keyword boleh ada karakter lain
+            rf'{HEADER_TERMINATOR}',
+            re.IGNORECASE
+        )
+
+    def find_headers(self, text: str) -> List[Tuple[int, str, int, int]]:
+        """
+        Mencari semua header section yang memenuhi kriteria.
+
+        Returns:
+            List (posisi keyword, nama section, awal baris, akhir baris), belum diurutkan
+        """
+        headers = []
+        # Posisi akhir match terakhir per keyword. Pattern lama memakai finditer dari "\n" sebelum
+        # baris, jadi header yang memakan "\n" di akhir barisnya membuat baris berikutnya tidak
+        # bisa cocok untuk keyword yang sama. Perilaku ini dipertahankan agar hasilnya identik.
+        last_end = [0] * len(self.keyword_patterns)
+
+        for candidate in self.candidate_pattern.finditer(text):
+            line_start = candidate.start()
+            line_end = text.find('\n', line_start)
+            if line_end == -1:
+                line_end = len(text)
+            full_line = text[line_start:line_end].strip()
+            # Hanya ambil bagian yang memenuhi kriteria:
+            # 1. Ada di awal baris atau ada sedikit karakter sebelum keyword
+            # 2. Memiliki 3 kata atau kurang
+            short_line = len(full_line.split()) <= 4
+            search_start = max(0, line_start - 1)
+
+            for index, (section_name, pattern) in enumerate(self.keyword_patterns):
+                if search_start < last_end[index]:
+                    continue
+                match = pattern.match(text, line_start)
+                if match is None:
+                    continue
+                last_end[index] = match.end()
+                pos = match.start(1)
+                if short_line and len(text[line_start:pos].strip()) <= 3:
+                    headers.append((pos, section_name, line_start, line_end))
+        return headers
+
+SECTION_HEADER_MATCHER = SectionHeaderMatcher(SECTION_KEYWORDS)
+
+def identify_sections(text: str, matcher: SectionHeaderMatcher = SECTION_HEADER_MATCHER) -> dict:
+    """
+    Mengidentifikasi bagian-bagian resume berdasarkan kata kunci.
+    Hanya mempertimbangkan kata kunci yang muncul sebagai kata depan bagian khusus, bukan yang ada dalam kalimat.
+    Menggabungkan teks dari bagian yang sama.
+    
+    Returns:
+        dict: Dictionary yang memetakan nama bagian ke posisi (start, end) dalam teks
+    """
+    section_positions = matcher.find_headers(text)
+    section_positions.sort()
+    
+    if not section_positions:
+        return {"personal": [(0, len(text))]}
+    
+    sections = {}
+    for i, (pos, section_name, line_start, line_end) in enumerate(section_positions):
+        start = line_end + 1
+        
+        if i + 1 < len(section_positions):
+            # Awal baris header berikutnya
+            end = section_positions[i+1][2]
+        else:
+            end = len(text)
+        
+        if section_name not in sections:
+            sections[section_name] = []
+        sections[section_name].append((start, end))
+    
+    sections["personal"] = [(0, section_positions[0][2])]
+    
+    return sections
+
+def extract_and_identify_sections(
+    filepath: Optional[str] = None,
+    content: Optional[bytes] = None,
+    text: Optional[str] = None
+) -> Tuple[str, dict]:
+    """Ekstraksi teks (jika text kosong) dan identifikasi section sekaligus, dijalankan di process pool"""
+    if text is None:
+        text = extract_pdf_text(filepath, content)
+    return text, identify_sections(text)
+
+
 class ResumeParser:
     """Parsing otomatis resume PDF dengan menggunakan AI."""
     
-    def __init__(self, filepath: str = None, text: str = None):
+    def __init__(
+        self, 
+        filepath: str = None, 
+        text: str = None, 
+        content: bytes = None,
+        groq: Optional[GroqAPI] = None,
+        max_concurrency: int = RESUME_PARSE_CONCURRENCY,
+        section_timeout: float = RESUME_SECTION_TIMEOUT_SECONDS,
+        sections: Optional[dict] = None
+    ):
         """
         Inisialisasi ResumeParser dengan file PDF atau teks resume.
+        Ekstraksi teks dan identifikasi section berjalan sinkron di sini; dari dalam event loop
+        gunakan ResumeParser.create agar pekerjaan CPU-bound tersebut dijalankan di process pool.
         
         Args:
             filepath: Path ke file PDF resume
             text: Teks hasil OCR apabila PDF tidak terbaca            
+            content: Isi file PDF di memory (dipakai sebagai ganti filepath, tanpa file sementara)
+            groq: Client GroqAPI yang dipakai bersama (dibuat baru jika kosong)
+            max_concurrency: Maksimal panggilan LLM yang berjalan bersamaan untuk resume ini
+            section_timeout: Batas waktu (detik) satu panggilan LLM
+            sections: Hasil identify_sections untuk text (jika sudah dihitung, tidak dihitung ulang)
         """
-        self.groq = GroqAPI(api_key=os.getenv("GROQ_API_KEY"))
+        self.groq = groq or GroqAPI(api_key=os.getenv("GROQ_API_KEY"))
+        self.llm_semaphore = asyncio.Semaphore(max_concurrency)
+        self.section_timeout = section_timeout
+        # Bagian yang gagal/timeout pada parse terakhir (hasilnya kosong dan sebaiknya tidak di-cache)
+        self.failed_sections: List[str] = []
         self.filepath = filepath if filepath else None
-        self.text = self._extract_text() if filepath else text
+        self.content = content
+        self.text = self._extract_text() if filepath or content is not None else text
         
-        self.section_keywords = {
-            "skills": ["skill", "skills", "kemampuan", "keahlian", "technical skills", "kecakapan", "ability", "abilities",
-                       "skills and abilities"],
-            "achievements": ["achievement", "achievements", "pencapaian", "prestasi", "penghargaan", "certification", "sertifikat", "certifications"],
-            "educations": ["education", "educations", "pendidikan", "riwayat pendidikan"],
-            "experiences": ["experience", "experiences", "pengalaman", "work history", "riwayat pekerjaan", "riwayat jabatan", "organization"
-                            "organisasi", "organizations", "organizational", "work experience", "work experiences"]
-        }
+        self.section_keywords = SECTION_KEYWORDS
        
         self.all_keywords = [kw for section_kws in self.section_keywords.values() for kw in section_kws]
         
         self.location_keywords = LOCATION_KEYWORDS
-        self.sections = self._identify_sections()
+        self.sections = sections if sections is not None else self._identify_sections()
 
-    def _extract_text(self) -> str:
-        """Ekstrak semua teks dari file PDF."""
+    @classmethod
+    async def create(
+        cls,
+        filepath: str = None,
+        text: str = None,
+        content: bytes = None,
+        **kwargs
+    ) -> "ResumeParser":
+        """
+        Membuat ResumeParser tanpa memblokir event loop: fitz.open, get_text per halaman, dan
+        identifikasi section dijalankan di process pool "resume_parsing" (RESUME_PARSING_WORKERS proses).
+        File di filepath harus tetap ada sampai fungsi ini selesai.
+
+        Jika worker crash saat memproses upload (pool menjadi BrokenProcessPool), pool dibuang dan
+        dibuat ulang pada pemanggilan berikutnya; hanya upload ini yang gagal dengan HTTP 400,
+        sama seperti PDF yang tidak bisa dibaca.
+        """
+        executor = ProcessPool.get_executor("resume_parsing", RESUME_PARSING_WORKERS)
+        loop = asyncio.get_running_loop()
+        source_text = None if filepath or content is not None else (text or "")
         try:
-            doc = fitz.open(self.filepath)
-            text = ''
-            for page in doc:
-                text += page.get_text()
-            return text
+            text, sections = await loop.run_in_executor(
+                executor, partial(extract_and_identify_sections, filepath, content, source_text)
+            )
+        except BrokenProcessPool as e:
+            ProcessPool.reset("resume_parsing", executor)
+            logger.error(f"Resume parsing worker crashed: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Failed to process resume file"
+            )
         except Exception as e:
-            raise Exception(f"Error extracting text from PDF: {str(e)}")
+            logger.error(f"Error extracting resume text: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Failed to process resume file"
+            )
+        return cls(text=text, sections=sections, **kwargs)
 
-    async def parse(self) -> ParserResponse:
+    def _extract_text(self) -> str:
+        """Ekstrak semua teks dari file PDF (dari memory jika content diberikan, selain itu dari filepath)."""
+        return extract_pdf_text(self.filepath, self.content)
+
+    async def parse(self, mode: str = "sections") -> ParserResponse:
         """
         Fungsi Parsing Resume 
+
+        Mode "sections": satu prompt per bagian, semua bagian diproses bersamaan (dibatasi
+        llm_semaphore). Bagian yang gagal atau timeout dikembalikan kosong tanpa membatalkan bagian lain.
+        Mode "one_shot": semua bagian dikirim dalam satu prompt dengan output JSON, lebih hemat
+        token dan round trip. Jika balasannya gagal diproses, parsing diulang dengan mode "sections".
         
         Returns:
             ParserResponse: Structured resume data
         """
+        self.failed_sections = []
+        if mode == "one_shot":
+            try:
+                return await self._parse_one_shot()
+            except Exception as e:
+                logger.warning(f"One-shot resume parsing failed, falling back to per-section parsing: {e!r}")
+
+        personal_information, skills, achievements, educations, experiences = await asyncio.gather(
+            self._guarded("personal information", self._extract_personal_info(self.sections), PersonalInformation()),
+            self._guarded("skills", self._clean_skill_section(), []),
+            self._guarded("achievements", self._clean_achievement_section(), []),
+            self._guarded("educations", self._clean_education_section(), []),
+            self._guarded("experiences", self._clean_experience_section(), [])
+        )
         return ParserResponse(
-            personal_information=await self._extract_personal_info(self.sections),
-            skills=await self._clean_skill_section(),
-            achievements=await self._clean_achievement_section(),
-            educations=await self._clean_education_section(),
-            experiences=await self._clean_experience_section()
+            personal_information=personal_information,
+            skills=skills,
+            achievements=achievements,
+            educations=educations,
+            experiences=experiences
+        )
+
+    async def _parse_one_shot(self) -> ParserResponse:
+        """Parsing semua bagian resume dengan satu panggilan LLM (RESUME_ONE_SHOT_PARSING_QUERY)"""
+        personal_fields = self._extract_personal_fields(self.sections)
+        section_texts = {
+            section_name: "\n".join(self._extract_section_content(section_name, self.sections))
+            for section_name in ("skills", "achievements", "educations", "experiences")
+        }
+        if personal_fields is None:
+            description_text = location_text = ""
+        else:
+            description_text = personal_fields.pop("description")
+            location_text = personal_fields.pop("location")
+
+        query = RESUME_ONE_SHOT_PARSING_QUERY.format(
+            description_text=description_text,
+            location_text=location_text,
+            skills_text=section_texts["skills"],
+            achievements_text=section_texts["achievements"],
+            educations_text=section_texts["educations"],
+            experiences_text=section_texts["experiences"]
         )
+        # Bagian yang tidak ada di resume selalu kosong, sama seperti mode "sections"
+        builders = {
+            "skills": self._build_skills,
+            "achievements": self._build_achievements,
+            "educations": self._build_educations,
+            "experiences": self._build_experiences,
+        }
+
+        def validate(response: str):
+            # Balasan hanya di-cache jika semua bagian yang ada di resume bisa diproses
+            parsed = json.loads(response)
+            for section_name, build in builders.items():
+                if section_texts[section_name]:
+                    build(parsed.get(section_name) or [])
+
+        parsed = json.loads(await self._complete(query, response_format={"type": "json_object"}, validate=validate))
+        results = {}
+        for section_name, build in builders.items():
+            results[section_name] = []
+            if section_texts[section_name]:
+                try:
+                    results[section_name] = build(parsed.get(section_name) or [])
+                except Exception as e:
+                    logger.error(f"Failed to parse {section_name} from one-shot JSON: {e!r}")
+                    self.failed_sections.append(section_name)
+
+        if personal_fields is None:
+            personal_information = PersonalInformation()
+        else:
+            personal_information = PersonalInformation(
+                **personal_fields,
+                description=str(parsed.get("description") or ""),
+                location=str(parsed.get("location") or "")
+            )
+        return ParserResponse(personal_information=personal_information, **results)
+
+    async def _complete(
+        self,
+        query: str,
+        response_format: Optional[dict] = None,
+        validate: Optional[Callable[[str], Any]] = None
+    ) -> str:
+        """
+        Satu panggilan LLM dengan batas concurrency dan timeout.
+        `validate` diteruskan ke GroqAPI: balasan hanya di-cache jika validate tidak melempar
+        exception, jadi bagian yang gagal diproses tetap memanggil LLM lagi saat di-retry.
+        """
+        async with self.llm_semaphore:
+            return await asyncio.wait_for(
+                self.groq.get_response(query, temperature=0, response_format=response_format, validate=validate),
+                self.section_timeout
+            )
+
+    @staticmethod
+    def _json_section_parser(section_name: str, build: Callable[[list], list]) -> Callable[[str], list]:
+        """Parser balasan JSON satu bagian: json.loads lalu builder bagian tersebut"""
+        return lambda response: build(json.loads(response).get(section_name, []))
+
+    async def _guarded(self, section_name: str, coroutine, default):
+        """Menjalankan satu bagian parsing, error apa pun (termasuk timeout) menghasilkan default"""
+        try:
+            return await coroutine
+        except Exception as e:
+            logger.error(f"Failed to parse {section_name} section: {e!r}")
+            self.failed_sections.append(section_name)
+            return default
     
     async def _clean_skill_section(self) -> List[ApplierSkills]:
         skills_text = self._extract_section_content("skills", self.sections)
@@ -73,14 +381,14 @@ class ResumeParser:
         combined_text = "\n".join(skills_text)
 
         query = SKILL_PARSING_QUERY.format(resume_text=combined_text)
-        response = await self.groq.get_response(query, temperature=0)
+        parse = self._json_section_parser("skills", self._build_skills)
+        response = await self._complete(query, validate=parse)
 
         try:
-            parsed = json.loads(response)
-            skills = parsed.get("skills", [])
-            return [ApplierSkills(skill=skill_name) for skill_name in skills]
+            return parse(response)
         except Exception as e:
             logger.error(f"Failed to parse skills JSON: {e}")
+            self.failed_sections.append("skills")
             return []
     
     async def _clean_achievement_section(self) -> List[ApplierAchievements]:
@@ -90,14 +398,14 @@ class ResumeParser:
         combined_text = "\n".join(achievements_text)
 
         query = ACHIEVEMENT_PARSING_QUERY.format(resume_text=combined_text)
-        response = await self.groq.get_response(query, temperature=0)
+        parse = self._json_section_parser("achievements", self._build_achievements)
+        response = await self._complete(query, validate=parse)
 
         try:
-            parsed = json.loads(response)
-            achievements = parsed.get("achievements", [])
-            return [ApplierAchievements(achievement=achievement["achievement"], date=achievement["date"]) for achievement in achievements]
+            return parse(response)
         except Exception as e:
             logger.error(f"Failed to parse achievements JSON: {e}")
+            self.failed_sections.append("achievements")
             return []
     
     async def _clean_education_section(self) -> List[ApplierEducation]:
@@ -107,21 +415,14 @@ class ResumeParser:
         combined_text = "\n".join(educations_text)
 
         query = EDUCATION_PARSING_QUERY.format(resume_text=combined_text)
-        response = await self.groq.get_response(query, temperature=0)
+        parse = self._json_section_parser("educations", self._build_educations)
+        response = await self._complete(query, validate=parse)
 
         try:
-            parsed = json.loads(response)
-            educations = parsed.get("educations", [])
-            return [ApplierEducation(
-                institution=education["institution"],
-                degree=education["degree"],
-                field_of_study=education["field_of_study"],
-                start_date=education["start_date"],
-                end_date=education["end_date"],
-                gpa = str(education.get("gpa"))
-            ) for education in educations]
+            return parse(response)
         except Exception as e:
             logger.error(f"Failed to parse education JSON: {e}")
+            self.failed_sections.append("educations")
             return []
     
     async def _clean_experience_section(self) -> List[ApplierExperience]:
@@ -131,97 +432,50 @@ class ResumeParser:
         combined_text = "\n".join(experiences_text)
 
         query = EXPERIENCE_PARSING_QUERY.format(resume_text=combined_text)
-        response = await self.groq.get_response(query, temperature=0)
+        parse = self._json_section_parser("experiences", self._build_experiences)
+        response = await self._complete(query, validate=parse)
 
         try:
-            parsed = json.loads(response)
-            experiences = parsed.get("experiences", [])
-            return [ApplierExperience(
-                company=experience["company"],
-                location=experience["location"],
-                position=experience["position"],
-                start_date=experience["start_date"],
-                end_date=experience["end_date"],
-                responsibilities=experience["responsibilities"]
-            ) for experience in experiences]
+            return parse(response)
         except Exception as e:
             logger.error(f"Failed to parse experience JSON: {e}")
+            self.failed_sections.append("experiences")
             return []
+
+    @staticmethod
+    def _build_skills(skills: list) -> List[ApplierSkills]:
+        return [ApplierSkills(skill=skill_name) for skill_name in skills]
+
+    @staticmethod
+    def _build_achievements(achievements: list) -> List[ApplierAchievements]:
+        return [ApplierAchievements(achievement=achievement["achievement"], date=achievement["date"]) for achievement in achievements]
+
+    @staticmethod
+    def _build_educations(educations: list) -> List[ApplierEducation]:
+        return [ApplierEducation(
+            institution=education["institution"],
+            degree=education["degree"],
+            field_of_study=education["field_of_study"],
+            start_date=education["start_date"],
+            end_date=education["end_date"],
+            gpa = str(education.get("gpa"))
+        ) for education in educations]
+
+    @staticmethod
+    def _build_experiences(experiences: list) -> List[ApplierExperience]:
+        return [ApplierExperience(
+            company=experience["company"],
+            location=experience["location"],
+            position=experience["position"],
+            start_date=experience["start_date"],
+            end_date=experience["end_date"],
+            responsibilities=experience["responsibilities"]
+        ) for experience in experiences]
  
     def _identify_sections(self) -> dict:
-        """
-        Mengidentifikasi bagian-bagian resume berdasarkan kata kunci.
-        Hanya mempertimbangkan kata kunci yang muncul sebagai kata depan bagian khusus, bukan yang ada dalam kalimat.
-        Menggabungkan teks dari bagian yang sama.
-        
-        Returns:
-            dict: Dictionary yang memetakan nama bagian ke posisi (start, end) dalam teks
-        """
-        section_positions = []
-        
-        for section_name, keywords in self.section_keywords.items():
-            for keyword in keywords:
-                # Aturan keyword, ditulis biar Rama nggak lupa yang dia coding sendiri
-                pattern = re.compile(
-                    # Keyword harus muncul di awal atau setelah line break
-                    rf'(?:^|\n)[ \t]*'
-                    # Maksimal 3 huruf sebelum keyword
-                    rf'(?:\S{{0,3}}[ \t]*)?'
-                    # Ini adalah keyword yang kita cari
-                    rf'({re.escape(keyword)})'
-                    # Setelah keyword boleh ada karakter lain
-                    rf'[ \t]*(?::|●|•|\*|-|–|\.|\s|$)',
-                    re.IGNORECASE
-                )
-                
-                for match in pattern.finditer(self.text):
-                    pos = match.start(1)
-                    
-                    line_start = max(0, self.text.rfind('\n', 0, pos) + 1)
-                    line_end = self.text.find('\n', pos)
-                    if line_end == -1:
-                        line_end = len(self.text)
-                    full_line = self.text[line_start:line_end].strip()
-                    
-                    word_count = len(full_line.split())
-                    
-                    # Hanya ambil bagian yang memenuhi kriteria:
-                    # 1. Ada di awal baris atau ada sedikit karakter sebelum keyword
-                    # 2. Memiliki 3 kata atau kurang
-                    if len(self.text[line_start:pos].strip()) <= 3 and word_count <= 4:
-                        section_positions.append((pos, section_name))
-        
-        section_positions.sort()
-        
-        if not section_positions:
-            return {"personal": [(0, len(self.text))]}
-        
-        sections = {}
-        for i, (pos, section_name) in enumerate(section_positions):
-            header_end = self.text.find('\n', pos)
-            if header_end == -1: 
-                header_end = len(self.text)
-            start = header_end + 1
-            
-            if i + 1 < len(section_positions):
-                next_header_pos = section_positions[i+1][0]
-                next_line_start = max(0, self.text.rfind('\n', 0, next_header_pos) + 1)
-                end = next_line_start
-            else:
-                end = len(self.text)
-            
-            if section_name not in sections:
-                sections[section_name] = []
-            sections[section_name].append((start, end))
-        
-        if section_positions:
-            first_section_pos = section_positions[0][0]
-            first_line_start = max(0, self.text.rfind('\n', 0, first_section_pos) + 1)
-            sections["personal"] = [(0, first_line_start)]
-        else:
-            sections["personal"] = [(0, len(self.text))]
-        
-        return sections
+        """Mengidentifikasi bagian-bagian resume (lihat identify_sections)"""
+        matcher = SECTION_HEADER_MATCHER if self.section_keywords is SECTION_KEYWORDS else SectionHeaderMatcher(self.section_keywords)
+        return identify_sections(self.text, matcher)
 
     async def _extract_personal_info(self, sections: dict) -> PersonalInformation:
         """
@@ -233,8 +487,23 @@ class ResumeParser:
         Returns:
             PersonalInformation: Structured personal information
         """
-        if "personal" not in sections or not sections["personal"]:
+        fields = self._extract_personal_fields(sections)
+        if fields is None:
             return PersonalInformation()
+
+        description, location = await asyncio.gather(
+            self._guarded("description", self._complete(DESCRIPTION_PARSING_QUERY.format(resume_text=fields["description"])), ""),
+            self._guarded("location", self._complete(LOCATION_PARSING_QUERY.format(resume_text=fields["location"])), "")
+        )
+        return PersonalInformation(**dict(fields, description=description, location=location))
+
+    def _extract_personal_fields(self, sections: dict) -> Optional[dict]:
+        """
+        Ekstrak nama, email, dan telepon dari bagian personal, beserta teks mentah deskripsi dan
+        lokasi yang masih perlu dibersihkan LLM. None jika resume tidak punya bagian personal.
+        """
+        if "personal" not in sections or not sections["personal"]:
+            return None
             
         start, end = sections["personal"][0]
         personal_text = self.text[start:end]
@@ -272,16 +541,13 @@ class ResumeParser:
         
         location = self._extract_location(personal_text)
 
-        description = await self.groq.get_response(DESCRIPTION_PARSING_QUERY.format(resume_text=description), temperature=0)
-        location = await self.groq.get_response(LOCATION_PARSING_QUERY.format(resume_text=location), temperature=0)
-
-        return PersonalInformation(
-            name=name,
-            email=email,
-            phone=phone,
-            description=description,
-            location=location
-        )
+        return {
+            "name": name,
+            "email": email,
+            "phone": phone,
+            "description": description,
+            "location": location
+        }
     
     def _extract_location(self, text: str) -> str:
         """
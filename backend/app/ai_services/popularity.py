@@ -0,0 +1,171 @@
+import asyncio
+import logging
+import math
+from bson import ObjectId
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+from app.utils.constants import (
+    POPULARITY_HALF_LIFE_HOURS,
+    POPULARITY_WINDOW_DAYS,
+    INTERACTION_SYNC_BATCH_SIZE,
+    CLUSTER_WRITE_CHUNK_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+STATE_ID = "popularity"
+# Rebase dilakukan jika bobot view terbaru sudah mencapai e^30 (~3 bulan dengan half-life 72 jam)
+REBASE_EXPONENT = 30.0
+
+def to_hour_bucket(timestamp: datetime) -> int:
+    """Mengubah timestamp ke nomor bucket per jam (jam sejak unix epoch). Datetime naive dianggap UTC."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return int(timestamp.timestamp() // 3600)
+
+class PopularityScores:
+    """
+    Skor popularitas dengan peluruhan eksponensial per bucket jam, untuk setiap job
+    (`jobs.popularity_score`) dan setiap pasangan cluster-job (`cluster_popular_jobs.score`).
+
+    Satu view di bucket t disimpan dengan bobot exp(λ * (t - epoch)), bukan 1. Skor efektif
+    pada waktu sekarang adalah skor tersimpan * exp(-λ * (sekarang - epoch)), dan faktor ini sama
+    untuk semua job, jadi urutan bisa langsung memakai skor tersimpan (baca O(1) lewat index)
+    dan view baru cukup di-$inc dengan bobotnya (O(1)). Karena bobot terus membesar, epoch
+    sesekali digeser dan semua skor dikali faktor yang sama ($mul), sehingga update tetap amortised O(1).
+    """
+    instance: Optional["PopularityScores"] = None
+
+    def __init__(self, database: AsyncIOMotorDatabase):
+        self.log_views_collection = database.log_views
+        self.job_collection = database.jobs
+        self.cluster_collection = database.cluster_popular_jobs
+        self.state_collection = database.recommendation_state
+
+        self.decay_rate = math.log(2) / POPULARITY_HALF_LIFE_HOURS
+        self.epoch: Optional[int] = None
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def get_instance(cls, database: AsyncIOMotorDatabase) -> "PopularityScores":
+        """Mendapatkan instance PopularityScores yang dipakai bersama dalam satu proses"""
+        if cls.instance is None:
+            cls.instance = cls(database)
+        return cls.instance
+
+    async def weight(self, timestamp: datetime) -> float:
+        """
+        Bobot satu view pada timestamp tertentu (relatif terhadap epoch saat ini).
+        Timestamp berasal dari client, jadi bucket di masa depan dibatasi ke jam sekarang agar
+        satu view tidak bisa memicu rebase epoch ke masa depan (yang membuat semua skor menjadi ~0).
+        """
+        weights = await self.weights([timestamp])
+        return weights[0]
+
+    async def weights(self, timestamps: Iterable[datetime]) -> List[float]:
+        """
+        Bobot sekumpulan view relatif terhadap satu epoch yang sama. Epoch dicek (dan di-rebase bila
+        perlu) sekali sebelum semua bobot dihitung, sehingga rebase tidak bisa terjadi di tengah
+        perhitungan dan mencampur bobot dari dua epoch berbeda.
+        """
+        now_bucket = to_hour_bucket(datetime.now(timezone.utc))
+        await self._ensure_epoch(now_bucket)
+        return [self._weight_at(to_hour_bucket(timestamp), now_bucket) for timestamp in timestamps]
+
+    async def initialize(self):
+        """Membangun skor job dari log_views jika skor belum pernah dibuat (mis. data lama)"""
+        if await self.state_collection.find_one({"_id": STATE_ID}) is None:
+            await self.rebuild()
+
+    async def rebuild(self, assignments: Optional[Dict[str, int]] = None) -> Dict[Tuple[int, str], float]:
+        """
+        Menghitung ulang skor dari log_views dalam jendela POPULARITY_WINDOW_DAYS terakhir
+        (memakai index timestamp). Skor job langsung disimpan, skor per cluster dikembalikan
+        untuk ditulis oleh pemanggil bersama tabel cluster_popular_jobs.
+
+        Args:
+            assignments (dict): Applier ID -> cluster_id (kosong jika hanya skor job yang dibutuhkan)
+
+        Returns:
+            dict: (cluster_id, job ID) -> skor
+        """
+        assignments = assignments or {}
+        since = datetime.now(timezone.utc) - timedelta(days=POPULARITY_WINDOW_DAYS)
+        cursor = self.log_views_collection.find(
+            {"timestamp": {"$gte": since}}, {"applier_id": 1, "job_id": 1, "timestamp": 1}
+        ).batch_size(INTERACTION_SYNC_BATCH_SIZE)
+
+        # Epoch dipastikan sekali di awal agar semua skor memakai epoch yang sama
+        now_bucket = to_hour_bucket(datetime.now(timezone.utc))
+        await self._ensure_epoch(now_bucket)
+
+        job_scores = defaultdict(float)
+        cluster_scores = defaultdict(float)
+        bucket_weights = {}
+        async for log in cursor:
+            bucket = to_hour_bucket(log["timestamp"])
+            if bucket not in bucket_weights:
+                bucket_weights[bucket] = self._weight_at(bucket, now_bucket)
+            weight = bucket_weights[bucket]
+
+            job_id = str(log["job_id"])
+            job_scores[job_id] += weight
+            cluster_id = assignments.get(str(log["applier_id"]))
+            if cluster_id is not None:
+                cluster_scores[(cluster_id, job_id)] += weight
+
+        await self._write_job_scores(job_scores)
+
+        logger.info(f"Popularity scores rebuilt: {len(job_scores)} jobs, {len(cluster_scores)} cluster-job pairs")
+        return dict(cluster_scores)
+
+    async def _write_job_scores(self, job_scores: Dict[str, float]):
+        """Menyimpan skor job, lalu mengosongkan skor job yang tidak punya view di dalam jendela"""
+        operations = [
+            UpdateOne({"_id": ObjectId(job_id)}, {"$set": {"popularity_score": score}})
+            for job_id, score in job_scores.items()
+        ]
+        stale = self.job_collection.find({"popularity_score": {"$gt": 0}}, {"_id": 1})
+        async for job in stale:
+            if str(job["_id"]) not in job_scores:
+                operations.append(UpdateOne({"_id": job["_id"]}, {"$set": {"popularity_score": 0.0}}))
+
+        for i in range(0, len(operations), CLUSTER_WRITE_CHUNK_SIZE):
+            await self.job_collection.bulk_write(operations[i:i + CLUSTER_WRITE_CHUNK_SIZE], ordered=False)
+
+    def _weight_at(self, bucket: int, now_bucket: int) -> float:
+        """Bobot bucket terhadap epoch saat ini; bucket di masa depan dibatasi ke jam sekarang"""
+        return math.exp(self.decay_rate * (min(bucket, now_bucket) - self.epoch))
+
+    async def _ensure_epoch(self, bucket: int):
+        """Memuat epoch (atau membuatnya), dan menggeser epoch jika bobot bucket ini sudah terlalu besar"""
+        async with self._lock:
+            if self.epoch is None:
+                state = await self.state_collection.find_one({"_id": STATE_ID})
+                if state is None:
+                    await self._save_epoch(bucket)
+                else:
+                    self.epoch = state["epoch"]
+
+            if self.decay_rate * (bucket - self.epoch) > REBASE_EXPONENT:
+                await self._rebase(bucket)
+
+    async def _rebase(self, new_epoch: int):
+        """Menggeser epoch dan menskalakan semua skor tersimpan dengan faktor yang sama"""
+        factor = math.exp(-self.decay_rate * (new_epoch - self.epoch))
+        await self.job_collection.update_many({"popularity_score": {"$gt": 0}}, {"$mul": {"popularity_score": factor}})
+        await self.cluster_collection.update_many({"score": {"$gt": 0}}, {"$mul": {"score": factor}})
+        await self._save_epoch(new_epoch)
+        logger.info(f"Popularity epoch rebased to hour bucket {new_epoch}")
+
+    async def _save_epoch(self, epoch: int):
+        self.epoch = epoch
+        await self.state_collection.update_one(
+            {"_id": STATE_ID},
+            {"$set": {"epoch": epoch, "updated_at": datetime.now()}},
+            upsert=True
+        )
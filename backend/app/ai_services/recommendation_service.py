@@ -1,16 +1,45 @@
+import asyncio
 import logging
+import time
 import numpy as np
 from bson import ObjectId
 from collections import defaultdict, Counter
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from sklearn.cluster import DBSCAN, KMeans
-# from sklearn.decomposition import PCA
-from sklearn.metrics.pairwise import cosine_similarity
+from pymongo import UpdateOne
+from scipy import sparse
+from sklearn.preprocessing import normalize
 
-from app.utils.constants import POPULAR_VIEWS_THRESHOLD
+from app.ai_services.clustering import (
+    dbscan_labels,
+    kmeans_labels,
+    minibatch_kmeans_fit,
+    minibatch_kmeans_update,
+    svd_fit_transform,
+    svd_transform,
+)
+from app.ai_services.cluster_popularity import ClusterPopularJobs
+from app.ai_services.interaction_matrix import InteractionMatrix
+from app.ai_services.model_store import ModelStore
+from app.ai_services.popularity import PopularityScores
+from app.models.recommendation_model import ClusterRefreshResult, ClusterWriteSummary, DimensionReductionStats
+from app.utils.constants import (
+    POPULAR_VIEWS_THRESHOLD,
+    CLUSTER_WRITE_CHUNK_SIZE,
+    CLUSTERING_WORKERS,
+    INTERACTION_SYNC_BATCH_SIZE,
+    STREAMING_KMEANS_BATCH_SIZE,
+    SVD_REFIT_NEW_JOB_RATIO,
+    MODEL_STATE_MAX_BYTES,
+)
+from app.utils.process_pool import ProcessPool
 
 logger = logging.getLogger(__name__)
 
+STREAMING_KMEANS_MODEL = "kmeans_streaming"
+SVD_PROJECTION_MODEL = "svd_projection"
+
 class RecommendationService:
     def __init__(self, database: AsyncIOMotorDatabase):
         self.db = database
@@ -18,144 +47,331 @@ class RecommendationService:
         self.applier_collection = database.appliers
         self.job_collection = database.jobs
         self.threshold_view_count = POPULAR_VIEWS_THRESHOLD
+        self.interaction_matrix = InteractionMatrix.get_instance(database)
+        self.model_store = ModelStore(database)
+        self.cluster_popularity = ClusterPopularJobs(database)
+        self.popularity = PopularityScores.get_instance(database)
     
-    async def cluster_users_DBSCAN(self, eps=0.5, min_samples=5):
-        try:
-            all_users = set()
-            all_jobs = set()
-            user_job_view_counts = defaultdict(lambda: defaultdict(int))
-            
-            logs = await self.log_views_collection.find().to_list(length=100000)
-            
-            for log in logs:
-                user_id = str(log["applier_id"])
-                job_id = str(log["job_id"])
-                all_users.add(user_id)
-                all_jobs.add(job_id)
-                user_job_view_counts[user_id][job_id] += 1
-            
-            job_index = {j: i for i, j in enumerate(sorted(all_jobs))}
-            user_vectors = []
-            user_ids = []
-            
-            max_views = 0
-            for user_id, job_counts in user_job_view_counts.items():
-                for job_id, count in job_counts.items():
-                    max_views = max(max_views, count)
-            
-            logger.info(f"Maximum view count: {max_views}")
-            
-            for user_id, job_counts in user_job_view_counts.items():
-                vector = np.zeros(len(all_jobs))
-                for job_id, count in job_counts.items():
-                    # Option 1: Raw count
-                    # vector[job_index[job_id]] = count
-                    
-                    # Option 2: Normalized count (0-1 range)
-                    vector[job_index[job_id]] = count / max_views
-                    
-                    # Option 3: Log transformation to reduce impact of outliers
-                    # vector[job_index[job_id]] = np.log1p(count)
-                
-                user_vectors.append(vector)
-                user_ids.append(user_id)
-            
-            if not user_vectors:
-                logger.warning("No user vectors generated. Check if there's enough view data.")
-                return False
-            
-            user_matrix = np.vstack(user_vectors)
-            # n_components = min(10, user_matrix.shape[1]) # Untuk implementasi PCA (Jika data banyak)
-            # pca = PCA(n_components=n_components)
-            # reduced_matrix = pca.fit_transform(user_matrix)
-            # logger.info(f"Reduced matrix: {reduced_matrix}")
+    async def cluster_users_DBSCAN(self, eps=0.5, min_samples=5, mode="neighbors", n_components=None, refit_projection=False):
+        user_ids, user_matrix = await self._get_user_matrix()
+        
+        if not user_ids:
+            logger.warning("No user vectors generated. Check if there's enough view data.")
+            return None
+        
+        # Reduksi dimensi (opsional) dengan proyeksi TruncatedSVD yang disimpan antar refresh
+        reduced_matrix, reduction = await self._reduce_dimensions(user_matrix, n_components, refit_projection)
 
-            # similarity_matrix = cosine_similarity(reduced_matrix)
-            similarity_matrix = cosine_similarity(user_matrix)
-            # logger.info(f"Similarity matrix: {similarity_matrix}")
-            distance_matrix = 1 - similarity_matrix
-            
-            clustering = DBSCAN(eps=eps, min_samples=min_samples, metric='precomputed')
-            clusters = clustering.fit_predict(distance_matrix)
-            
-            for i, user_id in enumerate(user_ids):
-                cluster_id = int(clusters[i]) if clusters[i] >= 0 else None
-                await self.applier_collection.update_one(
-                    {"_id": ObjectId(user_id)},
-                    {"$set": {
-                        "cluster_id": cluster_id
-                    }}
+        # Mode "neighbors" hanya menyimpan pasangan tetangga dalam radius eps,
+        # mode "precomputed" membangun matriks jarak n x n penuh
+        start = time.perf_counter()
+        clusters = await self._run_in_pool(dbscan_labels, reduced_matrix, eps, min_samples, mode)
+        fit_seconds = time.perf_counter() - start
+        cluster_ids = [int(cluster) if cluster >= 0 else None for cluster in clusters]
+        
+        write_summary = await self._write_cluster_assignments(user_ids, cluster_ids)
+        await self.cluster_popularity.rebuild()
+        result = self._refresh_result(user_matrix, cluster_ids, fit_seconds, write_summary)
+        result.reduction = reduction
+        return result
+    
+    async def cluster_users_KMeans(self, n_clusters=5, mode="full", refit=False, n_components=None, refit_projection=False):
+        # Mode streaming bekerja langsung di ruang job karena centroid-nya disimpan antar refresh
+        if mode == "streaming":
+            return await self._cluster_users_streaming_KMeans(n_clusters, refit)
+        
+        user_ids, user_matrix = await self._get_user_matrix()
+        
+        if not user_ids:
+            logger.warning("No user vectors generated. Check if there's enough view data.")
+            return None
+        
+        # Reduksi dimensi (opsional) dengan proyeksi TruncatedSVD yang disimpan antar refresh
+        reduced_matrix, reduction = await self._reduce_dimensions(user_matrix, n_components, refit_projection)
+        
+        start = time.perf_counter()
+        clusters = await self._run_in_pool(kmeans_labels, reduced_matrix, n_clusters)
+        fit_seconds = time.perf_counter() - start
+        cluster_ids = [int(cluster) for cluster in clusters]
+        
+        write_summary = await self._write_cluster_assignments(user_ids, cluster_ids)
+        await self.cluster_popularity.rebuild()
+        result = self._refresh_result(user_matrix, cluster_ids, fit_seconds, write_summary)
+        result.reduction = reduction
+        return result
+
+    async def _cluster_users_streaming_KMeans(self, n_clusters=5, refit=False):
+        """
+        KMeans streaming: centroid disimpan antar refresh, dan hanya applier yang punya view baru
+        sejak refresh terakhir yang di-assign ke centroid terdekat (centroid ikut bergeser per mini-batch).
+        Fit ulang dari awal hanya jika belum ada centroid, n_clusters berubah, atau refit=True.
+        Vektor applier dinormalisasi L2 agar skala fitur tetap stabil antar refresh.
+        Label terakhir tiap applier ikut disimpan, sehingga kontribusi lama applier yang berubah
+        (baris saat ini dikurangi view baru) dikeluarkan dari centroid sebelum baris barunya ditambahkan.
+        """
+        await self.interaction_matrix.refresh()
+        watermark = self.interaction_matrix.last_log_id
+        state = await self.model_store.load(STREAMING_KMEANS_MODEL)
+        
+        # State lama tanpa label per applier tidak bisa mengeluarkan kontribusi lama, jadi di-fit ulang
+        incremental = (
+            state is not None and not refit and state.get("n_clusters") == n_clusters
+            and "labels" in state["arrays"]
+        )
+        if incremental:
+            view_deltas = await self._get_view_deltas(state.get("last_log_id"), watermark)
+            user_ids, user_matrix, job_ids = self.interaction_matrix.aligned_rows(list(view_deltas), self._state_job_ids(state))
+            previous_matrix = self._previous_rows(user_matrix, user_ids, job_ids, view_deltas)
+            stored_labels = self._state_labels(state)
+            previous_labels = np.array([stored_labels.get(user_id, -1) for user_id in user_ids], dtype=np.int64)
+        else:
+            user_ids = list(self.interaction_matrix.user_ids)
+            user_ids, user_matrix, job_ids = self.interaction_matrix.aligned_rows(user_ids, [])
+        
+        if not incremental and not user_ids:
+            logger.warning("No user vectors generated. Check if there's enough view data.")
+            return None
+        
+        if user_ids:
+            user_matrix = normalize(user_matrix, norm="l2")
+            if incremental:
+                previous_matrix = normalize(previous_matrix, norm="l2")
+        start = time.perf_counter()
+        if incremental:
+            # Job baru yang belum ada saat centroid dibuat mendapat bobot 0 di semua centroid
+            centroids = state["arrays"]["centroids"]
+            centroids = np.pad(centroids, ((0, 0), (0, len(job_ids) - centroids.shape[1])))
+            if user_ids:
+                clusters, centroids, counts = await self._run_in_pool(
+                    minibatch_kmeans_update, user_matrix, centroids, state["arrays"]["counts"], STREAMING_KMEANS_BATCH_SIZE,
+                    previous_matrix, previous_labels
                 )
+            else:
+                clusters, counts = [], state["arrays"]["counts"]
+            labels = {**stored_labels, **dict(zip(user_ids, (int(cluster) for cluster in clusters)))}
+        else:
+            clusters, centroids, counts = await self._run_in_pool(
+                minibatch_kmeans_fit, user_matrix, n_clusters, STREAMING_KMEANS_BATCH_SIZE
+            )
+            labels = dict(zip(user_ids, (int(cluster) for cluster in clusters)))
+        fit_seconds = time.perf_counter() - start
+        cluster_ids = [int(cluster) for cluster in clusters]
+        
+        await self.model_store.save(
+            STREAMING_KMEANS_MODEL,
+            {
+                "centroids": centroids,
+                "counts": counts,
+                "job_ids": np.array(job_ids, dtype=str),
+                "user_ids": np.array(list(labels), dtype=str),
+                "labels": np.array(list(labels.values()), dtype=np.int64)
+            },
+            n_clusters=n_clusters,
+            last_log_id=watermark
+        )
+        
+        write_summary = await self._write_cluster_assignments(user_ids, cluster_ids)
+        await self.cluster_popularity.rebuild()
+        result = self._refresh_result(user_matrix, cluster_ids, fit_seconds, write_summary)
+        result.incremental = incremental
+        return result
+
+    async def _reduce_dimensions(self, user_matrix, n_components=None, refit_projection=False):
+        """
+        Memproyeksikan matriks applier ke ruang berdimensi rendah dengan TruncatedSVD.
+        Proyeksi disimpan di ModelStore dan dipakai ulang, kecuali n_components berubah,
+        refit_projection=True, atau job baru sejak fit terakhir melebihi SVD_REFIT_NEW_JOB_RATIO.
+        
+        Args:
+            user_matrix: Matriks CSR applier x job
+            n_components (int): Jumlah komponen, None untuk melewati reduksi
+            refit_projection (bool): Paksa fit ulang proyeksi
             
-            return True
+        Returns:
+            tuple: (matriks untuk clustering, DimensionReductionStats atau None)
+        """
+        if not n_components:
+            return user_matrix, None
         
-        except Exception as e:
-            logger.error(f"Error in clustering users: {e}")
-            return False
-    
-    async def cluster_users_KMeans(self, n_clusters=5):
+        n_components = min(n_components, user_matrix.shape[1] - 1)
+        if n_components < 1:
+            logger.warning("Not enough jobs for dimensionality reduction, clustering in full space")
+            return user_matrix, None
+        
+        # Komponen SVD (n_components x jumlah job, float64) harus muat di ModelStore, dicek sebelum fit
+        projection_bytes = n_components * user_matrix.shape[1] * 8
+        if projection_bytes > MODEL_STATE_MAX_BYTES:
+            raise ValueError(
+                f"SVD projection with {n_components} components over {user_matrix.shape[1]} jobs "
+                f"({projection_bytes / 2**20:.0f} MB) exceeds MODEL_STATE_MAX_BYTES, use fewer components"
+            )
+
+        start = time.perf_counter()
+        job_ids = self.interaction_matrix.job_ids[:user_matrix.shape[1]]
+        state = await self.model_store.load(SVD_PROJECTION_MODEL)
+        
+        reusable = state is not None and not refit_projection and state.get("n_components") == n_components
+        if reusable:
+            fitted_job_ids = set(self._state_job_ids(state))
+            new_jobs = sum(1 for job_id in job_ids if job_id not in fitted_job_ids)
+            reusable = new_jobs <= SVD_REFIT_NEW_JOB_RATIO * len(job_ids)
+        
+        if reusable:
+            # Job yang muncul setelah proyeksi dibuat tidak ikut diproyeksikan
+            state_job_ids = self._state_job_ids(state)
+            aligned_matrix, _ = self.interaction_matrix.align_columns(user_matrix, state_job_ids)
+            aligned_matrix = aligned_matrix[:, :len(state_job_ids)]
+            reduced_matrix = await self._run_in_pool(svd_transform, aligned_matrix, state["arrays"]["components"])
+        else:
+            reduced_matrix, components = await self._run_in_pool(svd_fit_transform, user_matrix, n_components)
+            await self.model_store.save(
+                SVD_PROJECTION_MODEL,
+                {"components": components, "job_ids": np.array(job_ids, dtype=str)},
+                n_components=n_components
+            )
+        
+        reduction = DimensionReductionStats(
+            input_dim=user_matrix.shape[1],
+            reduced_dim=reduced_matrix.shape[1],
+            input_bytes=user_matrix.data.nbytes + user_matrix.indices.nbytes + user_matrix.indptr.nbytes,
+            reduced_bytes=reduced_matrix.nbytes,
+            reduce_seconds=round(time.perf_counter() - start, 3),
+            projection_reused=reusable
+        )
+        logger.info(f"Dimensionality reduction: {reduction}")
+        return reduced_matrix, reduction
+
+    async def _get_view_deltas(self, since_log_id, until_log_id):
+        """
+        Menghitung view baru per applier di antara dua watermark
+        
+        Returns:
+            dict: Applier ID -> Counter jumlah view baru per job ID
+        """
+        if until_log_id is None:
+            return {}
+        
+        query = {"_id": {"$lte": until_log_id}}
+        if since_log_id is not None:
+            query["_id"]["$gt"] = since_log_id
+        
+        view_deltas = defaultdict(Counter)
+        cursor = self.log_views_collection.find(query, {"applier_id": 1, "job_id": 1}).batch_size(INTERACTION_SYNC_BATCH_SIZE)
+        async for log in cursor:
+            view_deltas[str(log["applier_id"])][str(log["job_id"])] += 1
+        return view_deltas
+
+    @staticmethod
+    def _previous_rows(user_matrix, user_ids: list, job_ids: list, view_deltas: dict):
+        """Baris applier pada refresh sebelumnya: baris saat ini dikurangi view baru sejak watermark lama"""
+        position = {job_id: i for i, job_id in enumerate(job_ids)}
+        rows, cols, data = [], [], []
+        for row, user_id in enumerate(user_ids):
+            for job_id, count in view_deltas[user_id].items():
+                if job_id in position:
+                    rows.append(row)
+                    cols.append(position[job_id])
+                    data.append(count)
+        delta = sparse.csr_matrix((data, (rows, cols)), shape=user_matrix.shape, dtype=user_matrix.dtype)
+        previous = (user_matrix - delta).tocsr()
+        previous.data = np.maximum(previous.data, 0)
+        previous.eliminate_zeros()
+        return previous
+
+    @staticmethod
+    def _state_labels(state: dict) -> dict:
+        """Label terakhir per applier yang tersimpan di state KMeans streaming"""
+        arrays = state["arrays"]
+        return dict(zip(arrays["user_ids"].tolist(), arrays["labels"].tolist()))
+
+    @staticmethod
+    def _state_job_ids(state: dict) -> list:
+        """Urutan job ID kolom model (disimpan sebagai array, state lama menyimpannya di metadata)"""
+        if "job_ids" in state["arrays"]:
+            return state["arrays"]["job_ids"].tolist()
+        return state.get("job_ids", [])
+
+    async def _run_in_pool(self, fn, *args):
+        """
+        Menjalankan fungsi fitting CPU-bound di process pool clustering.
+        Jika worker crash (mis. kehabisan memory saat fit besar), pool dibuang agar refresh
+        berikutnya memakai pool baru; refresh ini tetap gagal dengan BrokenProcessPool.
+        """
+        executor = ProcessPool.get_executor("clustering", CLUSTERING_WORKERS)
+        loop = asyncio.get_running_loop()
         try:
-            all_users = set()
-            all_jobs = set()
-            user_job_view_counts = defaultdict(lambda: defaultdict(int))
-            
-            logs = await self.log_views_collection.find().to_list(length=100000)
-            
-            for log in logs:
-                user_id = str(log["applier_id"])
-                job_id = str(log["job_id"])
-                all_users.add(user_id)
-                all_jobs.add(job_id)
-                user_job_view_counts[user_id][job_id] += 1
-            
-            job_index = {j: i for i, j in enumerate(sorted(all_jobs))}
-            user_vectors = []
-            user_ids = []
-            
-            max_views = 0
-            for user_id, job_counts in user_job_view_counts.items():
-                for job_id, count in job_counts.items():
-                    max_views = max(max_views, count)
-            
-            
-            for user_id, job_counts in user_job_view_counts.items():
-                vector = np.zeros(len(all_jobs))
-                for job_id, count in job_counts.items():
-                    # Option 2: Normalized count (0-1 range)
-                    vector[job_index[job_id]] = count / max_views
-                
-                user_vectors.append(vector)
-                user_ids.append(user_id)
-            
-            if not user_vectors:
-                logger.warning("No user vectors generated. Check if there's enough view data.")
-                return False
-            
-            user_matrix = np.vstack(user_vectors)
-            # logger.info(f"User matrix: {user_matrix}")
-            # n_components = min(10, user_matrix.shape[1])
-            # pca = PCA(n_components=n_components)
-            # reduced_matrix = pca.fit_transform(user_matrix)
-            # logger.info(f"Reduced matrix: {reduced_matrix}")
-            
-            kmeans = KMeans(n_clusters=n_clusters, random_state=42)
-            # clusters = kmeans.fit_predict(reduced_matrix)
-            clusters = kmeans.fit_predict(user_matrix)
-            
-            for i, user_id in enumerate(user_ids):
-                cluster_id = int(clusters[i])
-                await self.applier_collection.update_one(
-                    {"_id": ObjectId(user_id)},
-                    {"$set": {
-                        "cluster_id": cluster_id
-                    }}
-                )
+            return await loop.run_in_executor(executor, partial(fn, *args))
+        except BrokenProcessPool:
+            ProcessPool.reset("clustering", executor)
+            raise
+
+    def _refresh_result(self, user_matrix, cluster_ids, fit_seconds, write_summary) -> ClusterRefreshResult:
+        """Menyusun statistik hasil refresh cluster"""
+        return ClusterRefreshResult(
+            users=user_matrix.shape[0],
+            jobs=user_matrix.shape[1],
+            clusters=len({cluster_id for cluster_id in cluster_ids if cluster_id is not None}),
+            noise=sum(1 for cluster_id in cluster_ids if cluster_id is None),
+            fit_seconds=round(fit_seconds, 3),
+            write=write_summary
+        )
+
+    async def _get_user_matrix(self):
+        """
+        Memperbarui matriks interaksi dengan log_views baru lalu mengambil matriks fitur applier
+        
+        Returns:
+            tuple: (list applier ID, matriks CSR applier x job ternormalisasi)
+        """
+        await self.interaction_matrix.refresh()
+        return self.interaction_matrix.features()
+
+    async def _write_cluster_assignments(self, user_ids, cluster_ids, chunk_size=CLUSTER_WRITE_CHUNK_SIZE) -> ClusterWriteSummary:
+        """
+        Menyimpan hasil clustering ke koleksi appliers dengan bulk_write unordered per chunk.
+        Applier yang cluster_id-nya tidak berubah dilewati.
+        
+        Args:
+            user_ids (list): Applier ID sesuai urutan baris matriks
+            cluster_ids (list): Cluster ID untuk setiap applier (None untuk noise)
+            chunk_size (int): Jumlah operasi per bulk_write
             
-            return True
+        Returns:
+            ClusterWriteSummary: Jumlah dokumen matched, modified, dan skipped
+        """
+        summary = ClusterWriteSummary(total=len(user_ids))
         
-        except Exception as e:
-            logger.error(f"Error in clustering users: {e}")
-            return False
+        for i in range(0, len(user_ids), chunk_size):
+            chunk = {
+                ObjectId(user_id): cluster_id
+                for user_id, cluster_id in zip(user_ids[i:i + chunk_size], cluster_ids[i:i + chunk_size])
+            }
+            
+            current_assignments = self.applier_collection.find(
+                {"_id": {"$in": list(chunk.keys())}},
+                {"cluster_id": 1}
+            )
+            async for applier in current_assignments:
+                if "cluster_id" in applier and applier["cluster_id"] == chunk[applier["_id"]]:
+                    del chunk[applier["_id"]]
+                    summary.skipped += 1
+            
+            if not chunk:
+                continue
+            
+            operations = [
+                UpdateOne({"_id": applier_id}, {"$set": {"cluster_id": cluster_id}})
+                for applier_id, cluster_id in chunk.items()
+            ]
+            result = await self.applier_collection.bulk_write(operations, ordered=False)
+            summary.matched += result.matched_count
+            summary.modified += result.modified_count
+        
+        logger.info(
+            f"Cluster write-back: {summary.total} appliers, {summary.matched} matched, "
+            f"{summary.modified} modified, {summary.skipped} skipped"
+        )
+        return summary
         
     async def get_recommendations_for_user(self, user_id, limit=10, view_weight_factor=0.5): # 0.3 ~ 1.0
         """
@@ -171,41 +387,49 @@ class RecommendationService:
         """
         try:
             user = await self.applier_collection.find_one({"_id": ObjectId(user_id)})            
-            if not user or "cluster_id" not in user:
+            # Applier tanpa cluster (belum di-cluster atau noise DBSCAN) memakai fallback
+            if not user or user.get("cluster_id") is None:
                 return await self._get_fallback_recommendations(user_id, limit, view_weight_factor)
             
             cluster_id = user["cluster_id"]
-            cluster_users = await self.applier_collection.find(
-                {"cluster_id": cluster_id, "_id": {"$ne": ObjectId(user_id)}}
-            ).to_list(length=100)
-            
-            if not cluster_users:
-                return await self._get_fallback_recommendations(user_id, limit, view_weight_factor)           
-            cluster_user_ids = [str(user["_id"]) for user in cluster_users]
             
-            pipeline = [
-                {"$match": {"applier_id": {"$in": [ObjectId(uid) for uid in cluster_user_ids]}}},
-                {"$group": {"_id": "$job_id", "view_count": {"$sum": 1}}},
-                {"$match": {"view_count": {"$gte": self.threshold_view_count}}},
-                {"$sort": {"view_count": -1}},
-                {"$limit": limit * 3}
-            ]
-            
-            popular_jobs = await self.log_views_collection.aggregate(pipeline).to_list(length=None)
             user_viewed_jobs = await self.log_views_collection.find(
-                {"applier_id": ObjectId(user_id)}
+                {"applier_id": ObjectId(user_id)}, {"job_id": 1, "timestamp": 1}
             ).to_list(length=None)
             
             user_view_counts = defaultdict(int)
-            for log in user_viewed_jobs:
+            user_view_scores = defaultdict(float)
+            weights = await self.popularity.weights(log["timestamp"] for log in user_viewed_jobs)
+            for log, weight in zip(user_viewed_jobs, weights):
                 job_id = str(log["job_id"])
                 user_view_counts[job_id] += 1
+                user_view_scores[job_id] += weight
+            
+            # Tabel cluster_popular_jobs menghitung view seluruh anggota cluster termasuk user sendiri,
+            # jadi view milik user dikurangi agar yang tersisa hanya view dari anggota lain.
+            # Ambil kandidat ekstra sebanyak job yang pernah dilihat user karena skornya bisa turun.
+            cluster_jobs = await self.cluster_popularity.get_top_jobs(
+                cluster_id,
+                limit * 3 + len(user_view_counts),
+                min_views=self.threshold_view_count
+            )
+            
+            popular_jobs = []
+            for job in cluster_jobs:
+                job_id = str(job["job_id"])
+                peer_view_count = job["view_count"] - user_view_counts.get(job_id, 0)
+                if peer_view_count >= self.threshold_view_count:
+                    # Skor popularitas meluruh terhadap waktu, view lama bobotnya makin kecil
+                    peer_score = max(job.get("score", 0.0) - user_view_scores.get(job_id, 0.0), 0.0)
+                    popular_jobs.append({"_id": job["job_id"], "score": peer_score})
+            popular_jobs.sort(key=lambda job: job["score"], reverse=True)
+            popular_jobs = popular_jobs[:limit * 3]
             
             # Skoring
             job_scores = []
             for job in popular_jobs:
                 job_id = str(job["_id"])
-                cluster_score = job["view_count"]
+                cluster_score = job["score"]
                 
                 # Weight Reduction
                 if job_id in user_view_counts:
@@ -346,28 +570,15 @@ class RecommendationService:
             if already_recommended:
                 query["_id"] = {"$nin": [ObjectId(jid) for jid in already_recommended]}
             
-            popular_jobs_pipeline = [
-                {"$match": query},
-                {"$lookup": {
-                    "from": "log_views",
-                    "localField": "_id",
-                    "foreignField": "job_id",
-                    "as": "views"
-                }},
-                {"$project": {
-                    "_id": 1,
-                    "view_count": {"$size": "$views"}
-                }},
-                {"$sort": {"view_count": -1}},
-                {"$limit": limit * 2}
-            ]
-            
-            popular_jobs = await self.job_collection.aggregate(popular_jobs_pipeline).to_list(length=None)
+            # Urutkan berdasarkan skor popularitas yang meluruh terhadap waktu (di-update setiap log view) lewat index
+            popular_jobs = await self.job_collection.find(
+                query, {"_id": 1, "popularity_score": 1}
+            ).sort("popularity_score", -1).limit(limit * 2).to_list(length=None)
             
             job_scores = []
             for job in popular_jobs:
                 job_id = str(job["_id"])
-                score = job["view_count"]
+                score = job.get("popularity_score", 0.0)
                 
                 if job_id in user_view_counts:
                     view_count = user_view_counts[job_id]
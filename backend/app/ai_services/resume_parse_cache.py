@@ -0,0 +1,81 @@
+import hashlib
+import logging
+from datetime import datetime
+from typing import Optional
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.models.resume_model import ParserResponse
+from app.utils.cache import TTLCache
+from app.utils import constants
+from app.utils.constants import RESUME_PARSER_VERSION, RESUME_PARSE_CACHE_SIZE, RESUME_PARSE_CACHE_TTL_DAYS
+
+logger = logging.getLogger(__name__)
+
+# Semua konstanta yang ikut menentukan hasil parse; perubahan isinya otomatis mengganti versi cache
+PARSER_CONSTANTS = (
+    "SKILL_PARSING_QUERY",
+    "EDUCATION_PARSING_QUERY",
+    "EXPERIENCE_PARSING_QUERY",
+    "ACHIEVEMENT_PARSING_QUERY",
+    "DESCRIPTION_PARSING_QUERY",
+    "LOCATION_PARSING_QUERY",
+    "RESUME_ONE_SHOT_PARSING_QUERY",
+    "LOCATION_KEYWORDS",
+)
+
+def parser_version() -> str:
+    """Hash dari RESUME_PARSER_VERSION dan semua prompt/keyword parser di constants.py"""
+    digest = hashlib.sha256(str(RESUME_PARSER_VERSION).encode())
+    for name in PARSER_CONSTANTS:
+        digest.update(name.encode())
+        digest.update(repr(getattr(constants, name)).encode())
+    return digest.hexdigest()[:16]
+
+class ResumeParseCache:
+    """
+    Cache hasil parse resume berdasarkan isi file (content-addressed).
+
+    Key = SHA-256 dari isi file + sumber teks (pdf_text / image_text) + mode parse + versi parser,
+    jadi file yang sama yang di-upload ulang langsung mendapat ParserResponse tersimpan tanpa
+    ekstraksi teks maupun panggilan LLM. Hasil disimpan di koleksi `resume_parse_cache`
+    (bertahan antar restart dan dipakai bersama antar worker) dengan LRU in-memory di depannya.
+    Jika prompt di constants.py berubah, versi parser ikut berubah sehingga entri lama tidak
+    pernah cocok lagi, dan dihapus saat startup (initialize).
+    """
+
+    def __init__(self, database: AsyncIOMotorDatabase):
+        self.collection = database.resume_parse_cache
+        self.version = parser_version()
+        self.memory = TTLCache(RESUME_PARSE_CACHE_SIZE, RESUME_PARSE_CACHE_TTL_DAYS * 24 * 3600)
+
+    async def initialize(self):
+        """Menghapus entri dari versi parser sebelumnya"""
+        result = await self.collection.delete_many({"version": {"$ne": self.version}})
+        if result.deleted_count:
+            logger.info(f"Removed {result.deleted_count} resume parse cache entries from older parser versions")
+
+    def key(self, sha256: str, source: str, mode: str) -> str:
+        """Key cache dari hex digest SHA-256 isi file (lihat UploadBuffer.sha256)"""
+        return f"{sha256}:{source}:{mode}:{self.version}"
+
+    async def get(self, key: str) -> Optional[ParserResponse]:
+        """Mendapatkan hasil parse tersimpan, None jika belum ada"""
+        result = self.memory.get(key)
+        if result is not None:
+            return result
+
+        document = await self.collection.find_one({"_id": key}, {"result": 1})
+        if document is None:
+            return None
+        result = ParserResponse(**document["result"])
+        self.memory.set(key, result)
+        return result
+
+    async def set(self, key: str, result: ParserResponse):
+        """Menyimpan hasil parse ke memory dan MongoDB"""
+        self.memory.set(key, result)
+        await self.collection.replace_one(
+            {"_id": key},
+            {"result": result.model_dump(), "version": self.version, "created_at": datetime.now()},
+            upsert=True
+        )
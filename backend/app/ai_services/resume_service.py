@@ -1,6 +1,7 @@
 import os
 import json
 import logging
+from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from app.ai_services.llm import GroqAPI
@@ -12,11 +13,17 @@ from app.utils.constants import RECRUITER_RATE_RESUME_QUERY, APPLIER_RATE_RESUME
 logger = logging.getLogger(__name__)
 
 class ResumeService:
-    def __init__(self, database: AsyncIOMotorDatabase):
+    def __init__(
+        self, 
+        database: AsyncIOMotorDatabase, 
+        applier_controller: Optional[ApplierController] = None, 
+        job_controller: Optional[JobController] = None, 
+        groq: Optional[GroqAPI] = None
+    ):
         self.db = database
-        self.applier_controller = ApplierController(database)
-        self.job_controller = JobController(database)
-        self.groq = GroqAPI(api_key=os.getenv("GROQ_API_KEY"))
+        self.applier_controller = applier_controller or ApplierController(database)
+        self.job_controller = job_controller or JobController(database)
+        self.groq = groq or GroqAPI(api_key=os.getenv("GROQ_API_KEY"))
     
     async def get_resume_score(self, applier_id: str) -> ApplierRateResume:
         applier_data = await self.applier_controller.get_applier(applier_id)
@@ -5,8 +5,13 @@ from fastapi import FastAPI, APIRouter, Depends
 from fastapi.responses import HTMLResponse
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.config.container import Container
 from app.config.db import Database
 from app.config.database_indexes import create_log_view_indexes
+from app.ai_services.popularity import PopularityScores
+from app.utils.job_search_index import JobSearchIndex
+from app.utils.process_pool import ProcessPool
+from app.utils.response_cache import RedisCacheBackend, ResponseCache
 
 from app.routes.applier_routes import router as applier_router
 from app.routes.recruiter_routes import router as recruiter_router
@@ -108,6 +113,18 @@ async def health_check():
         return {"status": "unhealthy", "database": "disconnected", "error": str(e)}
 
 
+@api_router.get("/cache/metrics")
+async def cache_metrics():
+    """Hit/miss response cache per namespace"""
+    return ResponseCache.get_instance().metrics()
+
+
+@api_router.get("/cache/llm/metrics")
+async def llm_cache_metrics():
+    """Hit/miss cache completion LLM (temperature 0)"""
+    return Container.get_instance().completion_cache.metrics()
+
+
 app.include_router(api_router)
 
 
@@ -121,12 +138,25 @@ async def startup_db_client():
     logger.info("Creating database indexes...")
     await create_log_view_indexes(db)
     logger.info("Database indexes created successfully")
+    container = Container.init(db)
+    await container.log_view_controller.backfill_job_view_counts()
+    await container.resume_parse_cache.initialize()
+    await PopularityScores.get_instance(db).initialize()
+    await JobSearchIndex.get_instance().rebuild(db)
+
+    # Response cache memakai memory per proses, atau Redis jika CACHE_REDIS_URL di-set (dipakai bersama antar worker)
+    cache_redis_url = os.getenv("CACHE_REDIS_URL")
+    if cache_redis_url:
+        container.response_cache.use_backend(RedisCacheBackend.from_url(cache_redis_url))
 
     logger.info("Connected to the MongoDB database!")
 
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    ProcessPool.shutdown()
+    if Container.instance is not None:
+        await Container.instance.close()
     await Database.close_db()
     logger.info("Disconnected from the MongoDB database")
 
@@ -0,0 +1,81 @@
+import os
+import logging
+from typing import Optional
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.ai_services.completion_cache import CompletionCache, MongoCompletionStore
+from app.ai_services.llm import GroqAPI
+from app.ai_services.ocr import OCR
+from app.ai_services.recommendation_service import RecommendationService
+from app.ai_services.resume_parse_cache import ResumeParseCache
+from app.ai_services.resume_service import ResumeService
+from app.controllers.applier_controller import ApplierController
+from app.controllers.auth_controller import AuthController
+from app.controllers.job_controller import JobController
+from app.controllers.jobs_application_controller import JobApplicationController
+from app.controllers.logView_controller import LogViewController
+from app.controllers.recruiter_controller import RecruiterController
+from app.utils.response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+class Container:
+    """
+    Service container untuk satu aplikasi.
+
+    Semua controller dan service tidak menyimpan state per request (hanya referensi koleksi,
+    client, dan cache), jadi cukup dibuat sekali saat startup lalu dipakai bersama oleh semua
+    dependency route. Controller yang butuh controller lain (AuthController, ResumeService)
+    memakai instance yang sama.
+    """
+    instance: Optional["Container"] = None
+
+    def __init__(self, database: AsyncIOMotorDatabase):
+        self.db = database
+        self.response_cache = ResponseCache.get_instance()
+        # Cache completion LLM (temperature 0) di memory, dan di MongoDB jika LLM_CACHE_PERSISTENT di-set
+        persistent = os.getenv("LLM_CACHE_PERSISTENT", "").lower() in ("1", "true", "yes")
+        self.completion_cache = CompletionCache(
+            store=MongoCompletionStore(database.llm_completion_cache) if persistent else None
+        )
+        self.groq = GroqAPI(api_key=os.getenv("GROQ_API_KEY"), cache=self.completion_cache)
+        self.ocr = OCR(api_key="helloworld", language="eng", overlay=False)
+
+        self.applier_controller = ApplierController(database)
+        self.recruiter_controller = RecruiterController(database)
+        self.job_controller = JobController(database)
+        self.job_application_controller = JobApplicationController(database)
+        self.log_view_controller = LogViewController(database)
+        self.auth_controller = AuthController(
+            database,
+            applier_controller=self.applier_controller,
+            recruiter_controller=self.recruiter_controller
+        )
+        self.recommendation_service = RecommendationService(database)
+        self.resume_parse_cache = ResumeParseCache(database)
+        self.resume_service = ResumeService(
+            database,
+            applier_controller=self.applier_controller,
+            job_controller=self.job_controller,
+            groq=self.groq
+        )
+
+    @classmethod
+    def init(cls, database: AsyncIOMotorDatabase) -> "Container":
+        """Membuat container (dipanggil sekali saat startup setelah database terhubung)"""
+        cls.instance = cls(database)
+        logger.info("Service container initialized")
+        return cls.instance
+
+    @classmethod
+    def get_instance(cls) -> "Container":
+        """Mendapatkan container aplikasi"""
+        if cls.instance is None:
+            raise Exception("Must call `Container.init` before accessing services")
+        return cls.instance
+
+    async def close(self):
+        """Menutup resource yang dipakai bersama (dipanggil saat shutdown)"""
+        await self.groq.close()
+        await self.response_cache.close()
+        Container.instance = None
@@ -1,6 +1,8 @@
 import logging
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from app.utils.constants import RESUME_PARSE_CACHE_TTL_DAYS, LLM_COMPLETION_CACHE_TTL_SECONDS
+
 logger = logging.getLogger(__name__)
 
 async def create_log_view_indexes(database: AsyncIOMotorDatabase):
@@ -25,17 +27,70 @@ async def create_log_view_indexes(database: AsyncIOMotorDatabase):
         await database.log_views.create_index([("applier_id", 1), ("job_id", 1)])
         logger.info("Created compound index on applier_id and job_id fields in log_views collection")
         
+        # Unique compound index untuk matriks interaksi applier-job (rekomendasi)
+        await database.applier_job_interactions.create_index([("applier_id", 1), ("job_id", 1)], unique=True)
+
+        # Index untuk tabel job populer per cluster (lookup rekomendasi & increment per view)
+        await database.cluster_popular_jobs.create_index([("cluster_id", 1), ("job_id", 1)], unique=True)
+        await database.cluster_popular_jobs.create_index([("cluster_id", 1), ("score", -1)])
+
+        # Chunk array model rekomendasi (ModelStore)
+        await database.recommendation_model_chunks.create_index([("model", 1), ("version", 1), ("array", 1), ("index", 1)])
+
         # Index untuk cluster_id (untuk rekomendasi berbasis cluster)
         await database.appliers.create_index([("cluster_id", 1)])
         
         # Index untuk created_at (untuk query berdasarkan waktu pembuatan)
         await database.jobs.create_index([("created_at", -1)])
 
+        # Index untuk keyset (cursor) pagination: urutan (field waktu, _id) descending
+        await database.jobs.create_index([("created_at", -1), ("_id", -1)])
+        await database.jobs.create_index([("updated_at", -1), ("_id", -1)])
+        await database.jobs.create_index([("recruiter_id", 1), ("created_at", -1), ("_id", -1)])
+        await database.appliers.create_index([("created_at", -1), ("_id", -1)])
+        await database.recruiters.create_index([("created_at", -1), ("_id", -1)])
+        await database.job_applications.create_index([("applier_id", 1), ("created_at", -1), ("_id", -1)])
+
+        # Cache hasil parse resume dan completion LLM kedaluwarsa otomatis (TTL index)
+        await database.resume_parse_cache.create_index(
+            [("created_at", 1)], expireAfterSeconds=RESUME_PARSE_CACHE_TTL_DAYS * 24 * 3600
+        )
+        await database.llm_completion_cache.create_index(
+            [("created_at", 1)], expireAfterSeconds=LLM_COMPLETION_CACHE_TTL_SECONDS
+        )
+
+        # Index untuk view_count (job populer / trending dan fallback rekomendasi)
+        await database.jobs.create_index([("view_count", -1)])
+        await database.jobs.create_index([("popularity_score", -1)])
+
         await database.jobs.create_index("job_title")
         await database.jobs.create_index("company_name")
         await database.jobs.create_index("location")
         await database.jobs.create_index("employment_type")
         await database.jobs.create_index("required_skills")
+
+        # Text index berbobot untuk pencarian job (mode "text"), judul paling berpengaruh.
+        # default_language "none" agar tidak ada stemming/stop word bahasa Inggris pada data berbahasa Indonesia
+        await database.jobs.create_index(
+            [
+                ("job_title", "text"),
+                ("required_skills", "text"),
+                ("company_name", "text"),
+                ("location", "text"),
+                ("employment_type", "text"),
+                ("description", "text"),
+            ],
+            name="job_text_search",
+            weights={
+                "job_title": 10,
+                "required_skills": 5,
+                "company_name": 3,
+                "location": 2,
+                "employment_type": 2,
+                "description": 1,
+            },
+            default_language="none"
+        )
         logger.info("All indexes created successfully for log_views collection")
     except Exception as e:
         logger.error(f"Error creating indexes for log_views collection: {str(e)}")
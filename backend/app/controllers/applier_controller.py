@@ -10,6 +10,8 @@ from app.models.applier_model import ApplierCreate, ApplierUpdate, ApplierInDB,
 from app.models.resume_model import ResumeUpdate, ResumeDeleteOptions
 from app.utils.common_fn import convert_date_to_datetime
 from app.utils.auth_helper import get_password_hash, verify_password
+from app.utils.pagination import keyset_query, keyset_sort
+from app.utils.response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +22,7 @@ class ApplierController:
         self.db = database
         self.collection = database.appliers
         self.recruiter_collection = database.recruiters
+        self.response_cache = ResponseCache.get_instance()
     
     async def create_applier(self, applier: ApplierCreate) -> ApplierResponse:
         """Membuat data applier baru ke database"""
@@ -110,10 +113,11 @@ class ApplierController:
         applier["_id"] = str(applier["_id"])
         return ApplierResponse(**applier)
     
-    async def get_all_appliers(self, skip: int = 0, limit: int = 100) -> List[ApplierResponse]:
-        """Menampilkan semua data applier"""
+    async def get_all_appliers(self, skip: int = 0, limit: int = 100, after: Optional[str] = None) -> List[ApplierResponse]:
+        """Menampilkan semua data applier (terbaru dulu). `after` adalah cursor halaman sebelumnya."""
         appliers = []
-        cursor = self.collection.find().skip(skip).limit(limit)
+        query = keyset_query({}, "created_at", after)
+        cursor = self.collection.find(query).sort(keyset_sort("created_at")).skip(skip).limit(limit)
         
         async for document in cursor:
             document["_id"] = str(document["_id"])
@@ -168,6 +172,7 @@ class ApplierController:
                 {"_id": ObjectId(applier_id)},
                 {"$set": update_dict}
             )
+            await self.response_cache.invalidate(f"applier:{applier_id}")
             
             if result.modified_count == 0 and result.matched_count == 1:
                 # Jika tidak ada field yang diupdate
@@ -206,6 +211,7 @@ class ApplierController:
                 {"_id": ObjectId(applier_id)},
                 {"$set": update_dict}
             )
+            await self.response_cache.invalidate(f"applier:{applier_id}")
             
             if result.modified_count == 0 and result.matched_count == 1:
                 pass
@@ -247,6 +253,7 @@ class ApplierController:
                 {"_id": ObjectId(applier_id)},
                 {"$set": update_dict}
             )
+            await self.response_cache.invalidate(f"applier:{applier_id}")
             
             if result.modified_count == 0 and result.matched_count == 1:
                 pass
@@ -329,6 +336,7 @@ class ApplierController:
             
             # Hapus applier
             result = await self.collection.delete_one({"_id": ObjectId(applier_id)})
+            await self.response_cache.invalidate(f"applier:{applier_id}")
             
             if result.deleted_count == 0:
                 raise HTTPException(
@@ -373,6 +381,7 @@ class ApplierController:
                 {"_id": ObjectId(applier_id)},
                 {"$set": update_dict}
             )
+            await self.response_cache.invalidate(f"applier:{applier_id}")
             
             if result.modified_count == 0 and result.matched_count == 1:
                 pass
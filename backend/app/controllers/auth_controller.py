@@ -24,10 +24,15 @@ from app.controllers.recruiter_controller import RecruiterController
 logger = logging.getLogger(__name__)
 
 class AuthController:
-    def __init__(self, database: AsyncIOMotorDatabase):
+    def __init__(
+        self, 
+        database: AsyncIOMotorDatabase, 
+        applier_controller: Optional[ApplierController] = None, 
+        recruiter_controller: Optional[RecruiterController] = None
+    ):
         self.db = database
-        self.applier_controller = ApplierController(database)
-        self.recruiter_controller = RecruiterController(database)
+        self.applier_controller = applier_controller or ApplierController(database)
+        self.recruiter_controller = recruiter_controller or RecruiterController(database)
 
     async def send_password_reset_email(self, email: str, request: Request) -> bool:
         """
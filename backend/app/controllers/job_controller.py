@@ -1,11 +1,16 @@
 import logging
+import re
 from bson import ObjectId
 from datetime import datetime
 from fastapi import HTTPException, status
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from typing import List, Optional
 
-from app.models.job_model import JobCreate, JobUpdate, JobInDB, JobResponse, JobWithImageResponse
+from app.models.job_model import JobCreate, JobUpdate, JobInDB, JobResponse, JobWithImageResponse, JobSuggestion
+from app.utils.cache import job_count_cache, recruiter_avatar_cache
+from app.utils.job_search_index import JobSearchIndex
+from app.utils.pagination import keyset_query, keyset_sort
+from app.utils.response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +19,8 @@ class JobController:
         self.db = database
         self.collection = database.jobs
         self.recruiter_collection = database.recruiters
+        self.search_index = JobSearchIndex.get_instance()
+        self.response_cache = ResponseCache.get_instance()
 
     async def create_job(self, job: JobCreate) -> JobResponse:
         """Membuat job baru."""
@@ -37,8 +44,12 @@ class JobController:
             job_dict["recruiter_id"] = recruiter_id
             job_dict["created_at"] = datetime.now()
             job_dict["updated_at"] = datetime.now()
+            job_dict["view_count"] = 0
             
             await self.collection.insert_one(job_dict)
+            self.search_index.add_job(job_dict)
+            job_count_cache.clear()
+            await self.response_cache.invalidate("jobs")
             
             job_dict["_id"] = str(job_dict["_id"])
             job_dict["recruiter_id"] = str(job_dict["recruiter_id"])
@@ -53,7 +64,7 @@ class JobController:
             )
         
     async def get_job(self, job_id: str) -> JobResponse:
-        """Mendapatkan job berdasarkan job_id."""
+        """Mendapatkan job berdasarkan job_id (di-cache sampai job diubah/dihapus)."""
         try:
             job_id = ObjectId(job_id)
         except:
@@ -62,6 +73,11 @@ class JobController:
                 detail="Invalid job_id format"
             )
 
+        return await self.response_cache.get_or_set(
+            "job", job_id, lambda: self._find_job(job_id), [f"job:{job_id}"]
+        )
+
+    async def _find_job(self, job_id: ObjectId) -> JobResponse:
         job = await self.collection.find_one({"_id": job_id})
         if not job:
             raise HTTPException(
@@ -73,10 +89,11 @@ class JobController:
         job["recruiter_id"] = str(job["recruiter_id"])
         return JobResponse(**job)
 
-    async def get_jobs(self, skip: int = 0, limit: int = 10) -> List[JobResponse]:
-        """Mendapatkan semua job."""
+    async def get_jobs(self, skip: int = 0, limit: int = 10, after: Optional[str] = None) -> List[JobResponse]:
+        """Mendapatkan semua job (terbaru dulu). `after` adalah cursor halaman sebelumnya (keyset pagination)."""
+        query = keyset_query({}, "created_at", after)
         try:
-            cursor = self.collection.find().skip(skip).limit(limit)
+            cursor = self.collection.find(query).sort(keyset_sort("created_at")).skip(skip).limit(limit)
             jobs = await cursor.to_list(length=limit)
             
             for job in jobs:
@@ -91,8 +108,14 @@ class JobController:
                 detail="Failed to fetch jobs"
             )
         
-    async def get_jobs_by_recruiter(self, recruiter_id: str, skip: int = 0, limit: int = 10) -> List[JobResponse]:
-        """Mendapatkan semua job dari recruiter_id."""
+    async def get_jobs_by_recruiter(
+        self, 
+        recruiter_id: str, 
+        skip: int = 0, 
+        limit: int = 10, 
+        after: Optional[str] = None
+    ) -> List[JobResponse]:
+        """Mendapatkan semua job dari recruiter_id (terbaru dulu). `after` adalah cursor halaman sebelumnya."""
         try:
             recruiter_id = ObjectId(recruiter_id)
         except:
@@ -101,7 +124,8 @@ class JobController:
                 detail="Invalid recruiter_id format"
             )
 
-        cursor = self.collection.find({"recruiter_id": recruiter_id}).skip(skip).limit(limit)
+        query = keyset_query({"recruiter_id": recruiter_id}, "created_at", after)
+        cursor = self.collection.find(query).sort(keyset_sort("created_at")).skip(skip).limit(limit)
         jobs = await cursor.to_list(length=limit)
         
         for job in jobs:
@@ -135,6 +159,9 @@ class JobController:
             )
 
         updated_job = await self.collection.find_one({"_id": job_id})
+        self.search_index.add_job(updated_job)
+        job_count_cache.clear()
+        await self.response_cache.invalidate("jobs", f"job:{job_id}")
         updated_job["_id"] = str(updated_job["_id"])
         updated_job["recruiter_id"] = str(updated_job["recruiter_id"])
         return JobResponse(**updated_job)
@@ -156,31 +183,24 @@ class JobController:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Job not found"
             )
+        self.search_index.remove_job(str(job_id))
+        job_count_cache.clear()
+        await self.response_cache.invalidate("jobs", f"job:{job_id}")
 
-    async def search_jobs(self, query: str, skip: int = 0, limit: int = 100) -> List[JobResponse]:
-        """Cari job berdasarkan query dengan substring matching."""
+    async def search_jobs(
+        self, 
+        query: str, 
+        skip: int = 0, 
+        limit: int = 100, 
+        mode: str = "regex", 
+        after: Optional[str] = None
+    ) -> List[JobResponse]:
+        """Cari job berdasarkan query dengan substring matching (mode "regex") atau full-text search (mode "text")."""
+        search_query = self._build_search_query(query, mode, after)
         try:
             jobs = []
             
-            if query:
-                # Case-insensitive regex search across multiple fields
-                search_query = {
-                    "$or": [
-                        {"job_title": {"$regex": query, "$options": "i"}},
-                        {"company_name": {"$regex": query, "$options": "i"}},
-                        {"location": {"$regex": query, "$options": "i"}},
-                        {"employment_type": {"$regex": query, "$options": "i"}},
-                        {"description": {"$regex": query, "$options": "i"}}
-                    ]
-                }
-                
-                # This adds documents where any array element contains the query string
-                skill_query = {"required_skills": {"$elemMatch": {"$regex": query, "$options": "i"}}}
-                search_query["$or"].append(skill_query)
-            else:
-                search_query = {}
-            
-            cursor = self.collection.find(search_query).skip(skip).limit(limit)
+            cursor = self._sort_search(self.collection.find(search_query), query, mode).skip(skip).limit(limit)
         
             async for document in cursor:
                 document["_id"] = str(document["_id"])
@@ -196,23 +216,85 @@ class JobController:
                 detail="Failed to search jobs"
             )
         
-    async def get_jobs_with_image(self, skip: int = 0, limit: int = 10) -> List[JobWithImageResponse]:
-        """Mendapatkan semua job dengan gambar."""
+    @staticmethod
+    def _build_search_query(query: str, mode: str = "regex", after: Optional[str] = None) -> dict:
+        """
+        Membuat filter pencarian job.
+        
+        Mode "regex": substring matching case-insensitive di beberapa field (input di-escape,
+        jadi karakter seperti "+" atau "(" dicari apa adanya). Tidak bisa memakai index.
+        Hasil diurutkan dari updated_at terbaru dan bisa dipaginasi dengan cursor `after`.
+        Mode "text": memakai text index berbobot di koleksi jobs, hasil diurutkan berdasarkan relevansi
+        (cursor tidak didukung karena urutan relevansi tidak punya key yang stabil).
+        """
+        if query and mode == "text":
+            if after:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Cursor pagination is not supported in text search mode"
+                )
+            return {"$text": {"$search": query}}
+        
+        if not query:
+            return keyset_query({}, "updated_at", after)
+        
+        # Case-insensitive regex search across multiple fields
+        pattern = {"$regex": re.escape(query), "$options": "i"}
+        return keyset_query({
+            "$or": [
+                {"job_title": pattern},
+                {"company_name": pattern},
+                {"location": pattern},
+                {"employment_type": pattern},
+                {"description": pattern},
+                # This adds documents where any array element contains the query string
+                {"required_skills": {"$elemMatch": pattern}}
+            ]
+        }, "updated_at", after)
+
+    @staticmethod
+    def _count_cache_key(query: str, mode: str, max_count: Optional[int]) -> tuple:
+        """
+        Key cache count. Kedua mode tidak membedakan huruf besar/kecil; spasi hanya dirapikan
+        untuk mode "text" karena pada mode "regex" spasi ikut dicocokkan apa adanya.
+        """
+        if not query:
+            return ("", "", max_count)
+        if mode == "text":
+            return (mode, " ".join(query.lower().split()), max_count)
+        return (mode, query.lower(), max_count)
+
+    @staticmethod
+    def _sort_search(cursor, query: str, mode: str):
+        """Mode "text" diurutkan berdasarkan skor relevansi, mode lain berdasarkan (updated_at, _id) terbaru"""
+        if query and mode == "text":
+            return cursor.sort([("score", {"$meta": "textScore"})])
+        return cursor.sort(keyset_sort("updated_at"))
+
+    async def get_jobs_with_image(self, skip: int = 0, limit: int = 10, after: Optional[str] = None) -> List[JobWithImageResponse]:
+        """
+        Mendapatkan semua job dengan gambar (updated_at terbaru dulu). `after` adalah cursor halaman sebelumnya.
+        Halaman di-cache dan dihapus saat ada job yang berubah atau recruiter di halaman itu diubah.
+        """
+        query = keyset_query({}, "updated_at", after)
+        return await self.response_cache.get_or_set(
+            "jobs_image",
+            f"{skip}:{limit}:{after}",
+            lambda: self._find_jobs_with_image(query, skip, limit),
+            lambda jobs: ["jobs", *{f"recruiter:{job.recruiter_id}" for job in jobs}]
+        )
+
+    async def _find_jobs_with_image(self, query: dict, skip: int, limit: int) -> List[JobWithImageResponse]:
         try:
-            cursor = self.collection.find().sort("updated_at", -1).skip(skip).limit(limit)
+            cursor = self.collection.find(query).sort(keyset_sort("updated_at")).skip(skip).limit(limit)
             jobs = await cursor.to_list(length=limit)
             
+            await self._attach_profile_pictures(jobs)
             for job in jobs:
                 job["_id"] = str(job["_id"])
-                recruiter_id = job["recruiter_id"]
                 job["recruiter_id"] = str(job["recruiter_id"])
-                recruiter = await self.db.recruiters.find_one({"_id": recruiter_id})
-                if recruiter and "profile_picture_url" in recruiter:
-                    job["profile_picture_url"] = recruiter["profile_picture_url"]
-                else:
-                    job["profile_picture_url"] = None
 
-            return [JobResponse(**job) for job in jobs]
+            return [JobWithImageResponse(**job) for job in jobs]
         except Exception as e:
             logger.error(f"Error fetching jobs: {str(e)}")
             raise HTTPException(
@@ -224,43 +306,22 @@ class JobController:
         self, 
         query: str = "", 
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        mode: str = "regex",
+        after: Optional[str] = None
     ) -> List[JobWithImageResponse]:
-        """Cari job dengan gambar berdasarkan query dengan substring matching."""
+        """Cari job dengan gambar berdasarkan query dengan substring matching (mode "regex") atau full-text search (mode "text")."""
+        search_query = self._build_search_query(query, mode, after)
         try:
             jobs = []
             
-            if query:
-                # Case-insensitive regex search across multiple fields
-                search_query = {
-                    "$or": [
-                        {"job_title": {"$regex": query, "$options": "i"}},
-                        {"company_name": {"$regex": query, "$options": "i"}},
-                        {"location": {"$regex": query, "$options": "i"}},
-                        {"employment_type": {"$regex": query, "$options": "i"}},
-                        {"description": {"$regex": query, "$options": "i"}}
-                    ]
-                }
-                
-                # This adds documents where any array element contains the query string
-                skill_query = {"required_skills": {"$elemMatch": {"$regex": query, "$options": "i"}}}
-                search_query["$or"].append(skill_query)
-            else:
-                search_query = {}
+            cursor = self._sort_search(self.collection.find(search_query), query, mode).skip(skip).limit(limit)
+            documents = await cursor.to_list(length=limit)
             
-            cursor = self.collection.find(search_query).sort("updated_at", -1).skip(skip).limit(limit)
-        
-            async for document in cursor:
+            await self._attach_profile_pictures(documents)
+            for document in documents:
                 document["_id"] = str(document["_id"])
-                recruiter_id = document["recruiter_id"]
                 document["recruiter_id"] = str(document["recruiter_id"])
-                
-                recruiter = await self.db.recruiters.find_one({"_id": recruiter_id})
-                if recruiter and "profile_picture_url" in recruiter:
-                    document["profile_picture_url"] = recruiter["profile_picture_url"]
-                else:
-                    document["profile_picture_url"] = None
-                
                 jobs.append(JobWithImageResponse(**document))
         
             return jobs
@@ -272,26 +333,32 @@ class JobController:
                 detail="Failed to search jobs"
             )
         
-    async def count_search_jobs(self, query: str = "") -> int:
-        """Count total number of jobs matching the search query without retrieving documents."""
+    async def count_search_jobs(self, query: str = "", mode: str = "regex", max_count: Optional[int] = None) -> int:
+        """
+        Count total number of jobs matching the search query without retrieving documents.
+
+        Hasil disimpan sebentar di job_count_cache (dikosongkan setiap create/update/delete job).
+        Query kosong memakai estimated_document_count (metadata koleksi, tanpa scan).
+        Jika max_count diisi, penghitungan berhenti setelah max_count dokumen, jadi hasil
+        sama dengan max_count berarti "max_count atau lebih".
+        """
+        cache_key = self._count_cache_key(query, mode, max_count)
+        total = job_count_cache.get(cache_key)
+        if total is not None:
+            return total
+
         try:
-            if query:
-                search_query = {
-                    "$or": [
-                        {"job_title": {"$regex": query, "$options": "i"}},
-                        {"company_name": {"$regex": query, "$options": "i"}},
-                        {"location": {"$regex": query, "$options": "i"}},
-                        {"employment_type": {"$regex": query, "$options": "i"}},
-                        {"description": {"$regex": query, "$options": "i"}}
-                    ]
-                }
-                
-                skill_query = {"required_skills": {"$elemMatch": {"$regex": query, "$options": "i"}}}
-                search_query["$or"].append(skill_query)
+            if not query:
+                total = await self.collection.estimated_document_count()
+                if max_count is not None:
+                    total = min(total, max_count)
             else:
-                search_query = {}
-            
-            total = await self.collection.count_documents(search_query)
+                search_query = self._build_search_query(query, mode)
+                if max_count is not None:
+                    total = await self.collection.count_documents(search_query, limit=max_count)
+                else:
+                    total = await self.collection.count_documents(search_query)
+            job_count_cache.set(cache_key, total)
             return total
         except Exception as e:
             logger.error(f"Error counting search results: {str(e)}")
@@ -320,18 +387,78 @@ class JobController:
                 detail="Job not found"
             )
 
+        await self._attach_profile_pictures([job])
         job["_id"] = str(job["_id"])
-        recruiter_id = job["recruiter_id"]
         job["recruiter_id"] = str(job["recruiter_id"])
-        
-        recruiter = await self.db.recruiters.find_one({"_id": recruiter_id})
-        if recruiter and "profile_picture_url" in recruiter:
-            job["profile_picture_url"] = recruiter["profile_picture_url"]
-        else:
-            job["profile_picture_url"] = None
 
         return JobWithImageResponse(**job)
     
+    async def get_trending_jobs(self, skip: int = 0, limit: int = 10) -> List[JobResponse]:
+        """Mendapatkan job dengan view terbanyak (dari counter jobs.view_count)."""
+        try:
+            cursor = self.collection.find().sort([("view_count", -1), ("_id", -1)]).skip(skip).limit(limit)
+            jobs = await cursor.to_list(length=limit)
+            
+            for job in jobs:
+                job["_id"] = str(job["_id"])
+                job["recruiter_id"] = str(job["recruiter_id"])
+                
+            return [JobResponse(**job) for job in jobs]
+        except Exception as e:
+            logger.error(f"Error fetching trending jobs: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to fetch trending jobs"
+            )
+    
+    def suggest_jobs(self, query: str, limit: int = 10) -> List[JobSuggestion]:
+        """Autocomplete judul, perusahaan, lokasi, dan skill dari inverted index in-memory."""
+        return [
+            JobSuggestion(text=text, count=count)
+            for text, count in self.search_index.suggest(query, limit)
+        ]
+
+    async def get_jobs_with_image_by_ids(self, job_ids: List[str]) -> List[JobWithImageResponse]:
+        """
+        Mendapatkan banyak job sekaligus dengan gambar (1 query jobs + 1 query recruiters).
+        Urutan hasil mengikuti job_ids, job yang tidak ditemukan atau ID yang tidak valid dilewati.
+        """
+        object_ids = [ObjectId(job_id) for job_id in job_ids if ObjectId.is_valid(job_id)]
+        if not object_ids:
+            return []
+
+        jobs = await self.collection.find({"_id": {"$in": object_ids}}).to_list(length=None)
+        await self._attach_profile_pictures(jobs)
+        jobs_by_id = {str(job["_id"]): job for job in jobs}
+
+        result = []
+        for job_id in job_ids:
+            job = jobs_by_id.get(job_id)
+            if job is None:
+                continue
+            job = dict(job, _id=job_id, recruiter_id=str(job["recruiter_id"]))
+            result.append(JobWithImageResponse(**job))
+        return result
+
+    async def _attach_profile_pictures(self, jobs: List[dict]):
+        """
+        Mengisi profile_picture_url setiap job dari recruiter-nya.
+        Recruiter yang belum ada di cache avatar diambil dengan satu query $in.
+        """
+        recruiter_ids = {job["recruiter_id"] for job in jobs}
+        profile_pictures = recruiter_avatar_cache.get_many(recruiter_ids)
+        missing_ids = [recruiter_id for recruiter_id in recruiter_ids if recruiter_id not in profile_pictures]
+        if missing_ids:
+            cursor = self.recruiter_collection.find(
+                {"_id": {"$in": missing_ids}}, {"profile_picture_url": 1}
+            )
+            async for recruiter in cursor:
+                profile_pictures[recruiter["_id"]] = recruiter.get("profile_picture_url")
+                recruiter_avatar_cache.set(recruiter["_id"], profile_pictures[recruiter["_id"]])
+
+        for job in jobs:
+            job["profile_picture_url"] = profile_pictures.get(job["recruiter_id"])
+    
     async def count_jobs_by_recruiter(self, recruiter_id: str) -> int:
         """Menghitung jumlah job berdasarkan siapa recruiternya."""
         try:
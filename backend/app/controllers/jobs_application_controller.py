@@ -1,7 +1,7 @@
 import logging
 from bson import ObjectId
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from fastapi import HTTPException, status
 
@@ -11,6 +11,7 @@ from app.models.jobs_application_model import (
     JobApplicationInDB,
     JobApplicationResponse,
 )
+from app.utils.pagination import keyset_query, keyset_sort
 
 logger = logging.getLogger(__name__)
 
@@ -204,13 +205,26 @@ class JobApplicationController:
                 detail=str(e)
             )
     
-    async def get_applier_job_history(self, applier_id: str, skip: int = 0, limit: int = 10):
-        """Get detaiil applier job application history"""
+    async def get_applier_job_history(self, applier_id: str, skip: int = 0, limit: int = 10, after: Optional[str] = None):
+        """
+        Get detaiil applier job application history (terbaru dulu).
+        `after` adalah cursor halaman sebelumnya (keyset pagination pada created_at, _id).
+        """
         try:
+            applier_id = ObjectId(applier_id)
+        except Exception:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid applier_id format"
+            )
+        match = keyset_query({"applier_id": applier_id}, "created_at", after)
+
+        try:
+            # $limit setelah $unwind supaya lamaran yang job-nya sudah dihapus tidak membuat halaman kurang dari limit
             pipeline = [
-                {"$match": {"applier_id": ObjectId(applier_id)}},
+                {"$match": match},
+                {"$sort": dict(keyset_sort("created_at"))},
                 {"$skip": skip},
-                {"$limit": limit},
                 {
                     "$lookup": {
                         "from": "jobs",
@@ -220,6 +234,7 @@ class JobApplicationController:
                     }
                 },
                 {"$unwind": "$job_details"},
+                {"$limit": limit},
                 {
                     "$project": {
                         "_id": 1,
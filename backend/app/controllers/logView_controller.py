@@ -4,9 +4,13 @@ from bson import ObjectId
 from datetime import datetime
 from typing import List, Optional
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
 from fastapi import HTTPException, status
 
+from app.ai_services.cluster_popularity import ClusterPopularJobs
+from app.ai_services.popularity import PopularityScores
 from app.models.logView_model import LogViewCreate, LogViewInDB, LogViewResponse
+from app.utils.response_cache import ResponseCache
 from app.utils.timezone_helper import *
 
 logger = logging.getLogger(__name__)
@@ -15,6 +19,10 @@ class LogViewController:
     def __init__(self, database: AsyncIOMotorDatabase):
         self.db = database
         self.collection = database.log_views
+        self.job_collection = database.jobs
+        self.cluster_popularity = ClusterPopularJobs(database)
+        self.popularity = PopularityScores.get_instance(database)
+        self.response_cache = ResponseCache.get_instance()
     
     async def create_log_view(self, log_view: LogViewCreate) -> LogViewResponse:
         """Membuat log view baru ketika user melihat suatu job"""
@@ -37,6 +45,15 @@ class LogViewController:
         
         result = await self.collection.insert_one(log_view_dict)
         
+        weight = await self.popularity.weight(log_view_dict["timestamp"])
+        await self.job_collection.update_one(
+            {"_id": log_view_dict["job_id"]},
+            {"$inc": {"view_count": 1, "popularity_score": weight}}
+        )
+        await self.cluster_popularity.record_view(log_view_dict["applier_id"], log_view_dict["job_id"], weight)
+        # Job yang sudah dilihat tidak lagi direkomendasikan ke applier ini
+        await self.response_cache.invalidate(f"applier:{log_view_dict['applier_id']}")
+        
         created_log_view = await self.collection.find_one({"_id": result.inserted_id})
         if created_log_view is None:
             raise HTTPException(
@@ -91,6 +108,34 @@ class LogViewController:
     async def count_logs_by_job(self, job_id: str) -> int:
         """Menghitung jumlah log view berdasarkan job_id"""
         job_obj_id = ObjectId(job_id)
+        job = await self.job_collection.find_one({"_id": job_obj_id}, {"view_count": 1})
+        if job and "view_count" in job:
+            return job["view_count"]
+        
+        # Job sudah dihapus atau belum punya counter, hitung langsung dari log
         count = await self.collection.count_documents({"job_id": job_obj_id})
         return count
+    
+    async def backfill_job_view_counts(self) -> int:
+        """
+        Mengisi counter jobs.view_count dari log_views (sekali, untuk data lama sebelum counter ada).
+        Dilewati jika sudah ada job yang memiliki view_count.
+        
+        Returns:
+            int: Jumlah job yang counter-nya diisi dari log
+        """
+        if await self.job_collection.find_one({"view_count": {"$exists": True}}, {"_id": 1}):
+            return 0
+        
+        pipeline = [{"$group": {"_id": "$job_id", "view_count": {"$sum": 1}}}]
+        operations = [
+            UpdateOne({"_id": job["_id"]}, {"$set": {"view_count": job["view_count"]}})
+            async for job in self.collection.aggregate(pipeline)
+        ]
+        for i in range(0, len(operations), 1000):
+            await self.job_collection.bulk_write(operations[i:i + 1000], ordered=False)
+        
+        await self.job_collection.update_many({"view_count": {"$exists": False}}, {"$set": {"view_count": 0}})
+        logger.info(f"Backfilled view counters for {len(operations)} jobs from log_views")
+        return len(operations)
     
\ No newline at end of file
@@ -1,7 +1,7 @@
 import logging
 from bson import ObjectId
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from fastapi import HTTPException, status
 
@@ -12,6 +12,9 @@ from app.models.recruiter_model import (
     RecruiterResponse,
 )
 from app.utils.auth_helper import get_password_hash, verify_password
+from app.utils.cache import recruiter_avatar_cache
+from app.utils.pagination import keyset_query, keyset_sort
+from app.utils.response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +24,7 @@ class RecruiterController:
         self.db = database
         self.collection = database.recruiters
         self.applier_collection = database.appliers
+        self.response_cache = ResponseCache.get_instance()
 
     async def create_recruiter(self, recruiter: RecruiterCreate) -> RecruiterResponse:
         """Membuat data recruiter baru ke database"""
@@ -61,7 +65,12 @@ class RecruiterController:
         return RecruiterResponse(**created_recruiter)
 
     async def get_recruiter(self, recruiter_id: str) -> RecruiterResponse:
-        """Mengambil data recruiter berdasarkan ID"""
+        """Mengambil data recruiter berdasarkan ID (di-cache sampai recruiter diubah/dihapus)"""
+        return await self.response_cache.get_or_set(
+            "recruiter", recruiter_id, lambda: self._find_recruiter(recruiter_id), [f"recruiter:{recruiter_id}"]
+        )
+
+    async def _find_recruiter(self, recruiter_id: str) -> RecruiterResponse:
         try:
             recruiter = await self.collection.find_one({"_id": ObjectId(recruiter_id)})
         except Exception as e:
@@ -104,11 +113,12 @@ class RecruiterController:
         return RecruiterResponse(**recruiter)
 
     async def get_all_recruiters(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, after: Optional[str] = None
     ) -> List[RecruiterResponse]:
-        """Menampilkan semua data recruiter"""
+        """Menampilkan semua data recruiter (terbaru dulu). `after` adalah cursor halaman sebelumnya."""
         recruiters = []
-        cursor = self.collection.find().skip(skip).limit(limit)
+        query = keyset_query({}, "created_at", after)
+        cursor = self.collection.find(query).sort(keyset_sort("created_at")).skip(skip).limit(limit)
 
         async for document in cursor:
             document["_id"] = str(document["_id"])
@@ -166,6 +176,8 @@ class RecruiterController:
             result = await self.collection.update_one(
                 {"_id": ObjectId(recruiter_id)}, {"$set": update_dict}
             )
+            recruiter_avatar_cache.pop(ObjectId(recruiter_id))
+            await self.response_cache.invalidate(f"recruiter:{recruiter_id}")
 
             if result.modified_count == 0 and result.matched_count == 1:
                 pass
@@ -202,6 +214,8 @@ class RecruiterController:
                 {"_id": ObjectId(recruiter_id)},
                 {"$set": {"profile_picture_url": None, "updated_at": datetime.now()}},
             )
+            recruiter_avatar_cache.pop(ObjectId(recruiter_id))
+            await self.response_cache.invalidate(f"recruiter:{recruiter_id}")
 
             if result.modified_count == 0 and result.matched_count == 1:
                 pass
@@ -255,6 +269,7 @@ class RecruiterController:
                     }
                 },
             )
+            await self.response_cache.invalidate(f"recruiter:{recruiter_id}")
 
             if result.modified_count == 0:
                 raise HTTPException(
@@ -278,6 +293,8 @@ class RecruiterController:
                 )
 
             result = await self.collection.delete_one({"_id": ObjectId(recruiter_id)})
+            recruiter_avatar_cache.pop(ObjectId(recruiter_id))
+            await self.response_cache.invalidate(f"recruiter:{recruiter_id}")
 
             if result.deleted_count == 0:
                 raise HTTPException(
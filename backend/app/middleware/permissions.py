@@ -1,14 +1,13 @@
 from fastapi import Depends, HTTPException, Path, status
 
-from app.config.db import Database
+from app.config.container import Container
 from app.utils.auth_helper import oauth2_scheme
 from app.controllers.auth_controller import AuthController
 
 # Membuat dependency permission
 async def get_auth_controller() -> AuthController:
     """Dependency untuk mendapatkan instance AuthController."""
-    db = Database.get_db()
-    return AuthController(db)
+    return Container.get_instance().auth_controller
 
 async def get_current_active_user(
     token: str = Depends(oauth2_scheme),
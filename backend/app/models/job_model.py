@@ -46,12 +46,18 @@ class JobInDB(JobBase):
 class JobResponse(JobBase):
     id: PyObjectId = Field(alias="_id")
     recruiter_id: PyObjectId
+    view_count: int = 0
 
     model_config = {"populate_by_name": True, "arbitrary_types_allowed": True}
 
 class JobWithImageResponse(JobBase):
     id: PyObjectId = Field(alias="_id")
     recruiter_id: PyObjectId
+    view_count: int = 0
     profile_picture_url: Optional[str] = None
 
-    model_config = {"populate_by_name": True, "arbitrary_types_allowed": True}
\ No newline at end of file
+    model_config = {"populate_by_name": True, "arbitrary_types_allowed": True}
+
+class JobSuggestion(BaseModel):
+    text: str
+    count: int
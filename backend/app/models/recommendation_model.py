@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, Field
+
+class ClusterWriteSummary(BaseModel):
+    total: int = 0      # Jumlah applier yang di-cluster
+    matched: int = 0    # Dokumen yang cocok dengan filter update
+    modified: int = 0   # Dokumen yang benar-benar berubah
+    skipped: int = 0    # Applier yang cluster_id-nya tidak berubah (tidak dikirim ke MongoDB)
+
+class DimensionReductionStats(BaseModel):
+    input_dim: int = 0          # Jumlah kolom sebelum reduksi (jumlah job)
+    reduced_dim: int = 0        # Jumlah komponen SVD
+    input_bytes: int = 0        # Ukuran matriks sparse sebelum reduksi
+    reduced_bytes: int = 0      # Ukuran matriks dense setelah reduksi
+    reduce_seconds: float = 0.0
+    projection_reused: bool = False  # True jika proyeksi tersimpan dipakai ulang (tanpa fit)
+
+class ClusterRefreshResult(BaseModel):
+    users: int = 0          # Jumlah applier (baris matriks)
+    jobs: int = 0           # Jumlah job (kolom matriks)
+    clusters: int = 0       # Jumlah cluster yang terbentuk (tanpa noise)
+    noise: int = 0          # Applier tanpa cluster (hanya DBSCAN)
+    fit_seconds: float = 0.0
+    incremental: bool = False  # True jika hanya applier yang berubah yang di-assign (KMeans streaming)
+    reduction: Optional[DimensionReductionStats] = None
+    write: ClusterWriteSummary = Field(default_factory=ClusterWriteSummary)
+
+class ClusteringJobResponse(BaseModel):
+    job_id: str
+    algorithm: str
+    params: Dict[str, Any] = Field(default_factory=dict)
+    status: str = "pending"  # pending | running | completed | failed
+    submitted_at: datetime = Field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    duration_seconds: Optional[float] = None
+    result: Optional[ClusterRefreshResult] = None
+    error: Optional[str] = None
@@ -1,12 +1,12 @@
 from typing import List, Optional
-from motor.motor_asyncio import AsyncIOMotorDatabase
 from pydantic import BaseModel, Field
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi import APIRouter, Depends, Query, HTTPException, Response, status
 
-from app.config.db import Database
+from app.config.container import Container
 from app.controllers.applier_controller import ApplierController
 from app.models.applier_model import ApplierCreate, ApplierUpdate, ApplierResponse
 from app.models.resume_model import ResumeDeleteOptions, ResumeUpdate
+from app.utils.pagination import set_next_cursor
 from app.middleware.permissions import *
 
 router = APIRouter(prefix="/appliers", tags=["Appliers"])
@@ -17,8 +17,7 @@ class PasswordChange(BaseModel):
 
 async def get_applier_controller() -> ApplierController:
     """Dependency untuk mendapatkan instance ApplierController"""
-    db = Database.get_db()
-    return ApplierController(db)
+    return Container.get_instance().applier_controller
 
 @router.post("/", response_model=ApplierResponse, status_code=status.HTTP_201_CREATED)
 async def create_applier(
@@ -38,12 +37,19 @@ async def get_applier(
 
 @router.get("/", response_model=List[ApplierResponse])
 async def get_all_appliers(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     controller: ApplierController = Depends(get_applier_controller)
 ):
-    """API untuk mendapatkan semua data applier dengan batasan jumlah untuk Pagination."""
-    return await controller.get_all_appliers(skip, limit)
+    """
+    API untuk mendapatkan semua data applier dengan batasan jumlah untuk Pagination.
+    Halaman berikutnya bisa diambil dengan mengirim header X-Next-Cursor sebagai `cursor`.
+    """
+    appliers = await controller.get_all_appliers(skip, limit, cursor)
+    set_next_cursor(response, appliers, "created_at", limit)
+    return appliers
 
 @router.get("/username/{username}", response_model=ApplierResponse)
 async def get_applier_by_username(
@@ -1,9 +1,8 @@
 from typing import List, Optional
-from motor.motor_asyncio import AsyncIOMotorDatabase
 from pydantic import BaseModel, Field
 from fastapi import APIRouter, Depends, Request, HTTPException, status, Body
 from fastapi.security import OAuth2PasswordRequestForm
-from app.config.db import Database
+from app.config.container import Container
 from app.controllers.auth_controller import AuthController
 from app.models.auth_model import *
 from app.utils.auth_helper import oauth2_scheme
@@ -12,8 +11,7 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 async def get_auth_controller() -> AuthController:
     """Dependency untuk mendapatkan instance AuthController."""
-    db = Database.get_db()
-    return AuthController(db)
+    return Container.get_instance().auth_controller
 
 @router.post("/login", response_model=Token)
 async def login(
@@ -1,21 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from typing import List, Optional
 
-from app.config.db import Database
+from app.config.container import Container
 from app.controllers.job_controller import JobController
+from app.utils.pagination import set_next_cursor
 from app.models.job_model import (
     JobCreate,
     JobUpdate,
     JobResponse,
-    JobWithImageResponse
+    JobWithImageResponse,
+    JobSuggestion
 )
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
 async def get_job_controller() -> JobController:
-    db = Database.get_db()
-    return JobController(db)
+    return Container.get_instance().job_controller
 
 @router.post("/", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
 async def create_job(
@@ -25,6 +25,15 @@ async def create_job(
     """Membuat job posting baru"""
     return await controller.create_job(job)
 
+@router.get("/suggest", response_model=List[JobSuggestion])
+async def suggest_jobs(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+    controller: JobController = Depends(get_job_controller)
+):
+    """Autocomplete (search-as-you-type) judul, perusahaan, lokasi, dan skill job"""
+    return controller.suggest_jobs(q, limit)
+
 @router.get("/{job_id}", response_model=JobResponse)
 async def get_job(
     job_id: str,
@@ -35,22 +44,33 @@ async def get_job(
 
 @router.get("/", response_model=List[JobResponse])
 async def get_jobs(
+    response: Response,
     skip: int = 0,
     limit: int = 10,
+    cursor: Optional[str] = None,
     controller: JobController = Depends(get_job_controller)
 ):
-    """Mendapatkan semua data job dengan batasan jumlah untuk Pagination"""
-    return await controller.get_jobs(skip, limit)
+    """
+    Mendapatkan semua data job dengan batasan jumlah untuk Pagination.
+    Halaman berikutnya bisa diambil dengan mengirim header X-Next-Cursor sebagai `cursor`.
+    """
+    jobs = await controller.get_jobs(skip, limit, cursor)
+    set_next_cursor(response, jobs, "created_at", limit)
+    return jobs
 
 @router.get("/recruiter/{recruiter_id}", response_model=List[JobResponse])
 async def get_jobs_by_recruiter(
     recruiter_id: str,
+    response: Response,
     skip: int = 0,
     limit: int = 10,
+    cursor: Optional[str] = None,
     controller: JobController = Depends(get_job_controller)
 ):
-    """Mendapatkan semua job posting dari recruiter tertentu"""
-    return await controller.get_jobs_by_recruiter(recruiter_id, skip, limit)
+    """Mendapatkan semua job posting dari recruiter tertentu (mendukung cursor seperti GET /jobs/)"""
+    jobs = await controller.get_jobs_by_recruiter(recruiter_id, skip, limit, cursor)
+    set_next_cursor(response, jobs, "created_at", limit)
+    return jobs
 
 @router.put("/{job_id}", response_model=JobResponse)
 async def update_job(
@@ -71,40 +91,81 @@ async def delete_job(
 
 @router.get("/search/", response_model=List[JobResponse])
 async def search_jobs(
+    response: Response,
     query: str = "",
     skip: int = 0,
     limit: int = 100,
+    mode: str = Query("regex", pattern="^(regex|text)$"),
+    cursor: Optional[str] = None,
     controller: JobController = Depends(get_job_controller)
 ):
-    """Mencari job berdasarkan query dengan substring matching"""
-    return await controller.search_jobs(query, skip, limit)
+    """
+    Mencari job berdasarkan query dengan substring matching (regex) atau full-text search berdasarkan relevansi (text).
+    Cursor hanya tersedia untuk mode regex.
+    """
+    jobs = await controller.search_jobs(query, skip, limit, mode, cursor)
+    if not (query and mode == "text"):
+        set_next_cursor(response, jobs, "updated_at", limit)
+    return jobs
 
 @router.get("/search/image/", response_model=List[JobWithImageResponse])
 async def search_jobs(
+    response: Response,
     query: str = "",
     skip: int = 0,
     limit: int = 100,
+    mode: str = Query("regex", pattern="^(regex|text)$"),
+    cursor: Optional[str] = None,
+    controller: JobController = Depends(get_job_controller)
+):
+    """
+    Mencari job berdasarkan query dengan substring matching (regex) atau full-text search berdasarkan relevansi (text).
+    Cursor hanya tersedia untuk mode regex.
+    """
+    jobs = await controller.search_jobs_with_image(query, skip, limit, mode, cursor)
+    if not (query and mode == "text"):
+        set_next_cursor(response, jobs, "updated_at", limit)
+    return jobs
+
+@router.get("/trending/", response_model=List[JobResponse])
+async def get_trending_jobs(
+    skip: int = 0,
+    limit: int = 10,
     controller: JobController = Depends(get_job_controller)
 ):
-    """Mencari job berdasarkan query dengan substring matching"""
-    return await controller.search_jobs_with_image(query, skip, limit)
+    """Mendapatkan job dengan jumlah view terbanyak"""
+    return await controller.get_trending_jobs(skip, limit)
 
 @router.get("/image/", response_model=List[JobWithImageResponse])
 async def get_jobs_with_image(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     controller: JobController = Depends(get_job_controller)
 ):
-    """Mendapatkan semua data job dengan gambar profil recruiter"""
-    return await controller.get_jobs_with_image(skip, limit)
+    """Mendapatkan semua data job dengan gambar profil recruiter (mendukung cursor seperti GET /jobs/)"""
+    jobs = await controller.get_jobs_with_image(skip, limit, cursor)
+    set_next_cursor(response, jobs, "updated_at", limit)
+    return jobs
 
 @router.get("/image/count", response_model=int)
 async def get_jobs_with_image_count(
+    response: Response,
     query: str = "",
+    mode: str = Query("regex", pattern="^(regex|text)$"),
+    max_count: Optional[int] = Query(None, ge=1),
     controller: JobController = Depends(get_job_controller)
 ):
-    """Mendapatkan jumlah semua data job dengan gambar profil recruiter"""
-    return await controller.count_search_jobs(query)
+    """
+    Mendapatkan jumlah semua data job dengan gambar profil recruiter.
+    Jika max_count diisi, penghitungan berhenti di max_count dan header X-Count-Approximate
+    bernilai "true" saat hasilnya mencapai batas tersebut (artinya "max_count atau lebih").
+    """
+    total = await controller.count_search_jobs(query, mode, max_count)
+    if max_count is not None and total >= max_count:
+        response.headers["X-Count-Approximate"] = "true"
+    return total
 
 @router.get("/recruiter/{recruiter_id}/count", response_model=int)
 async def get_jobs_by_recruiter_count(
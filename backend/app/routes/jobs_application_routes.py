@@ -1,20 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List, Dict
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from typing import List, Dict, Optional
 
-from app.config.db import Database
+from app.config.container import Container
 from app.controllers.jobs_application_controller import JobApplicationController
 from app.models.jobs_application_model import (
     JobApplicationCreate,
     JobApplicationUpdate,
     JobApplicationResponse
 )
+from app.utils.pagination import set_next_cursor
 
 router = APIRouter(prefix="/applications", tags=["Job Applications"])
 
 async def get_application_controller() -> JobApplicationController:
-    db = Database.get_db()
-    return JobApplicationController(db)
+    return Container.get_instance().job_application_controller
 
 @router.post("/", response_model=JobApplicationResponse, status_code=status.HTTP_201_CREATED)
 async def create_application(
@@ -35,12 +34,19 @@ async def get_application(
 @router.get("/history/{applier_id}", response_model=List[Dict])
 async def get_applier_job_history(
     applier_id: str,
+    response: Response,
     skip: int = 0,
     limit: int = 10,
+    cursor: Optional[str] = None,
     controller: JobApplicationController = Depends(get_application_controller)
 ):
-    """Mendapatkan history job application dengan detail job"""
-    return await controller.get_applier_job_history(applier_id, skip, limit)
+    """
+    Mendapatkan history job application dengan detail job (terbaru dulu).
+    Halaman berikutnya bisa diambil dengan mengirim header X-Next-Cursor sebagai `cursor`.
+    """
+    applications = await controller.get_applier_job_history(applier_id, skip, limit, cursor)
+    set_next_cursor(response, applications, "created_at", limit)
+    return applications
 
 @router.get("/job/{job_id}/appliers", response_model=List[Dict])
 async def get_applications_by_job_id(
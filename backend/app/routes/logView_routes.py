@@ -1,7 +1,7 @@
 from typing import List
 from fastapi import APIRouter, Depends, Query, HTTPException, status
 
-from app.config.db import Database
+from app.config.container import Container
 from app.controllers.logView_controller import LogViewController
 from app.models.logView_model import LogViewCreate, LogViewResponse
 
@@ -9,8 +9,7 @@ router = APIRouter(prefix="/log-views", tags=["LogViews"])
 
 async def get_log_view_controller() -> LogViewController:
     """Dependency untuk mendapatkan instance LogViewController"""
-    db = Database.get_db()
-    return LogViewController(db)
+    return Container.get_instance().log_view_controller
 
 @router.post("/", response_model=LogViewResponse, status_code=status.HTTP_201_CREATED)
 async def create_log_view(
@@ -1,38 +1,82 @@
-from typing import List
-from fastapi import APIRouter, Depends, Query, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from app.config.db import Database
+from app.config.container import Container
+from app.ai_services.clustering_jobs import ClusteringJobManager
 from app.ai_services.recommendation_service import RecommendationService
 from app.controllers.job_controller import JobController
 from app.models.job_model import JobResponse, JobWithImageResponse
+from app.models.recommendation_model import ClusteringJobResponse
+from app.utils.response_cache import ResponseCache
 
 router = APIRouter(prefix="/recommendations", tags=["Recommendations"])
 
 async def get_recommendation_service() -> RecommendationService:
     """Dependency untuk mendapatkan instance ApplierController"""
-    db = Database.get_db()
-    return RecommendationService(db)
+    return Container.get_instance().recommendation_service
 
 async def get_job_controller() -> JobController:
-    db = Database.get_db()
-    return JobController(db)
+    return Container.get_instance().job_controller
 
-@router.post("/cluster/applierdbscan", response_model=bool, status_code=status.HTTP_200_OK)
+async def get_clustering_job_manager() -> ClusteringJobManager:
+    return ClusteringJobManager.get_instance()
+
+@router.post("/cluster/applierdbscan", response_model=ClusteringJobResponse, status_code=status.HTTP_202_ACCEPTED)
 async def refresh_applier_cluster_dbscan(
     epsilon: float = Query(0.5, ge=0.0, le=1.0),
     min_samples: int = Query(5, ge=1),
-    controller: RecommendationService = Depends(get_recommendation_service)
+    mode: str = Query("neighbors", pattern="^(neighbors|precomputed)$"),
+    n_components: Optional[int] = Query(None, ge=2, le=1000, description="Jumlah komponen TruncatedSVD (kosong = tanpa reduksi)"),
+    refit_projection: bool = Query(False, description="Fit ulang proyeksi SVD yang tersimpan"),
+    manager: ClusteringJobManager = Depends(get_clustering_job_manager)
 ):
-    """API untuk merefresh cluster applier"""
-    return await controller.cluster_users_DBSCAN(epsilon, min_samples)
+    """API untuk merefresh cluster applier (berjalan di background, cek status dengan job_id)"""
+    return manager.submit("dbscan", {
+        "eps": epsilon,
+        "min_samples": min_samples,
+        "mode": mode,
+        "n_components": n_components,
+        "refit_projection": refit_projection
+    })
 
-@router.post("/cluster/applierkmeans", response_model=bool, status_code=status.HTTP_200_OK)
+@router.post("/cluster/applierkmeans", response_model=ClusteringJobResponse, status_code=status.HTTP_202_ACCEPTED)
 async def refresh_applier_cluster_kmeans(
     n_clusters: int = Query(5, ge=1),
-    controller: RecommendationService = Depends(get_recommendation_service)
+    mode: str = Query("full", pattern="^(full|streaming)$"),
+    refit: bool = Query(False, description="Mode streaming: fit ulang centroid dari awal"),
+    n_components: Optional[int] = Query(None, ge=2, le=1000, description="Mode full: jumlah komponen TruncatedSVD (kosong = tanpa reduksi)"),
+    refit_projection: bool = Query(False, description="Fit ulang proyeksi SVD yang tersimpan"),
+    manager: ClusteringJobManager = Depends(get_clustering_job_manager)
+):
+    """API untuk merefresh cluster applier (berjalan di background, cek status dengan job_id)"""
+    return manager.submit("kmeans", {
+        "n_clusters": n_clusters,
+        "mode": mode,
+        "refit": refit,
+        "n_components": n_components,
+        "refit_projection": refit_projection
+    })
+
+@router.get("/cluster/jobs", response_model=List[ClusteringJobResponse])
+async def get_clustering_jobs(
+    manager: ClusteringJobManager = Depends(get_clustering_job_manager)
 ):
-    """API untuk merefresh cluster applier"""
-    return await controller.cluster_users_KMeans(n_clusters)
+    """API untuk mendapatkan semua job refresh cluster"""
+    return manager.list_jobs()
+
+@router.get("/cluster/jobs/{job_id}", response_model=ClusteringJobResponse)
+async def get_clustering_job(
+    job_id: str,
+    manager: ClusteringJobManager = Depends(get_clustering_job_manager)
+):
+    """API untuk mendapatkan status, durasi, dan hasil job refresh cluster"""
+    job = manager.get_job(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Clustering job {job_id} not found"
+        )
+    return job
 
 @router.get("/applier/{applier_id}", response_model=List[JobWithImageResponse])
 async def get_applier_recommendations(
@@ -42,11 +86,17 @@ async def get_applier_recommendations(
     controller: RecommendationService = Depends(get_recommendation_service),
     job_controller: JobController = Depends(get_job_controller)
 ):
-    """API untuk mendapatkan rekomendasi pekerjaan untuk applier tertentu"""
-    top_job_ids = await controller.get_recommendations_for_user(applier_id, limit, weight)
-    jobs = []
-    for job_id in top_job_ids:
-        job = await job_controller.get_job_with_image(job_id)
-        if job:
-            jobs.append(job)
-    return jobs
+    """API untuk mendapatkan rekomendasi pekerjaan untuk applier tertentu (di-cache per applier)"""
+    async def load_recommendations():
+        top_job_ids = await controller.get_recommendations_for_user(applier_id, limit, weight)
+        return await job_controller.get_jobs_with_image_by_ids(top_job_ids)
+
+    return await ResponseCache.get_instance().get_or_set(
+        "recommendations",
+        f"{applier_id}:{limit}:{weight}",
+        load_recommendations,
+        lambda jobs: [
+            "jobs", "recommendations", f"applier:{applier_id}",
+            *{f"recruiter:{job.recruiter_id}" for job in jobs}
+        ]
+    )
@@ -1,8 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from typing import List, Optional
 
-from app.config.db import Database
+from app.config.container import Container
 from app.controllers.recruiter_controller import RecruiterController
 from app.models.recruiter_model import (
     RecruiterCreate, 
@@ -10,13 +9,13 @@ from app.models.recruiter_model import (
     RecruiterResponse,
     ChangePasswordRequest
 )
+from app.utils.pagination import set_next_cursor
 from app.middleware.permissions import *
 
 router = APIRouter(prefix="/recruiters", tags=["Recruiters"])
 
 async def get_recruiter_controller() -> RecruiterController:
-    db = Database.get_db()
-    return RecruiterController(db)
+    return Container.get_instance().recruiter_controller
 
 @router.post("/", response_model=RecruiterResponse, status_code=status.HTTP_201_CREATED)
 async def create_recruiter(
@@ -52,12 +51,19 @@ async def get_recruiter_by_email(
 
 @router.get("/", response_model=List[RecruiterResponse])
 async def get_recruiters(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     controller: RecruiterController = Depends(get_recruiter_controller)
 ):
-    """Mendapatkan semua data recruiter dengan batasan jumlah untuk Pagination"""
-    return await controller.get_all_recruiters(skip, limit)
+    """
+    Mendapatkan semua data recruiter dengan batasan jumlah untuk Pagination.
+    Halaman berikutnya bisa diambil dengan mengirim header X-Next-Cursor sebagai `cursor`.
+    """
+    recruiters = await controller.get_all_recruiters(skip, limit, cursor)
+    set_next_cursor(response, recruiters, "created_at", limit)
+    return recruiters
 
 @router.put("/{recruiter_id}", response_model=RecruiterResponse)
 async def update_recruiter(
@@ -1,60 +1,77 @@
-import os
-import shutil
 from typing import List
-import uuid
 from fastapi import APIRouter, Depends, File, Query, UploadFile, status
 
+from app.ai_services.llm import GroqAPI
 from app.ai_services.ocr import OCR
 from app.ai_services.pdf_parser import *
+from app.ai_services.resume_parse_cache import ResumeParseCache
 from app.ai_services.resume_service import ResumeService
-from app.config.db import Database
+from app.config.container import Container
+from app.utils.upload_buffer import UploadBuffer
 
 router = APIRouter(prefix="/resume", tags=["Resume"])
 
 async def get_resume_controller() -> ResumeService:
-    db = Database.get_db()
-    return ResumeService(db)
+    return Container.get_instance().resume_service
 
 async def get_ocr_controller() -> OCR:
-    api_key = 'helloworld'
-    language = 'eng'
-    overlay = False
-    return OCR(api_key, language, overlay)
+    return Container.get_instance().ocr
+
+async def get_groq_client() -> GroqAPI:
+    return Container.get_instance().groq
+
+async def get_resume_parse_cache() -> ResumeParseCache:
+    return Container.get_instance().resume_parse_cache
 
 @router.post("/parse/image_text", response_model=ParserResponse, status_code=status.HTTP_200_OK)
 async def extract_text_from_pdf(
     file: UploadFile = File(...),
-    controller: OCR = Depends(get_ocr_controller)
+    mode: str = Query("sections", pattern="^(sections|one_shot)$", description="sections: satu prompt per bagian, one_shot: satu prompt untuk semua bagian"),
+    controller: OCR = Depends(get_ocr_controller),
+    groq: GroqAPI = Depends(get_groq_client),
+    cache: ResumeParseCache = Depends(get_resume_parse_cache)
 ):
-    """API untuk mengekstrak teks dari file PDF menggunakan OCR"""
-    temp_filename = f"/tmp/{uuid.uuid4()}.pdf"
-    with open(temp_filename, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    """API untuk mengekstrak teks dari file PDF menggunakan OCR (file yang sama langsung diambil dari cache)"""
+    async with UploadBuffer() as upload:
+        await upload.read_from(file)
+        cache_key = cache.key(upload.sha256, "image_text", mode)
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-    OCR_result = await controller.ocr_space_file(temp_filename)
+        if upload.path is not None:
+            OCR_result = await controller.ocr_space_file(upload.path)
+        else:
+            OCR_result = await controller.ocr_space_bytes(upload.content)
     OCR_result_clean = OCR_result.strip()
-    parser = ResumeParser(text=OCR_result_clean)
-    result = await parser.parse()
-
-    os.remove(temp_filename)
+    parser = await ResumeParser.create(text=OCR_result_clean, groq=groq)
+    result = await parser.parse(mode)
 
+    if not parser.failed_sections:
+        await cache.set(cache_key, result)
     return result    
     
 
 @router.post("/parse/pdf_text", response_model=ParserResponse, status_code=status.HTTP_200_OK)
 async def parse_pdf_text(
     file: UploadFile = File(...),
+    mode: str = Query("sections", pattern="^(sections|one_shot)$", description="sections: satu prompt per bagian, one_shot: satu prompt untuk semua bagian"),
+    groq: GroqAPI = Depends(get_groq_client),
+    cache: ResumeParseCache = Depends(get_resume_parse_cache)
 ):
-    """API untuk mengekstrak teks dari file PDF yang dapat dideteksi teksnya"""
-    temp_filename = f"/tmp/{uuid.uuid4()}.pdf"
-    with open(temp_filename, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-    
-    controller = ResumeParser(filepath=temp_filename)
-    result = await controller.parse()
+    """API untuk mengekstrak teks dari file PDF yang dapat dideteksi teksnya (file yang sama langsung diambil dari cache)"""
+    async with UploadBuffer() as upload:
+        await upload.read_from(file)
+        cache_key = cache.key(upload.sha256, "pdf_text", mode)
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-    os.remove(temp_filename)
+        controller = await ResumeParser.create(filepath=upload.path, content=upload.content, groq=groq)
+    result = await controller.parse(mode)
 
+    if not controller.failed_sections:
+        await cache.set(cache_key, result)
     return result
 
 @router.get("/applier/rate", response_model=ApplierRateResume, status_code=status.HTTP_200_OK)
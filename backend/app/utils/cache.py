@@ -0,0 +1,75 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List
+
+from app.utils.constants import (
+    RECRUITER_AVATAR_CACHE_SIZE,
+    RECRUITER_AVATAR_CACHE_TTL_SECONDS,
+    JOB_COUNT_CACHE_SIZE,
+    JOB_COUNT_CACHE_TTL_SECONDS
+)
+
+class TTLCache:
+    """
+    Cache in-memory sederhana dengan batas ukuran (LRU) dan masa berlaku per entri (TTL).
+    Nilai None juga di-cache, jadi gunakan `key in cache` / get_many untuk membedakan miss.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._lookup(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Mendapatkan nilai yang belum kedaluwarsa, atau default jika tidak ada"""
+        entry = self._lookup(key)
+        return entry[1] if entry is not None else default
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """Mendapatkan semua key yang ada di cache (key yang miss tidak ikut dikembalikan)"""
+        hits = {}
+        for key in keys:
+            entry = self._lookup(key)
+            if entry is not None:
+                hits[key] = entry[1]
+        return hits
+
+    def set(self, key: Hashable, value: Any):
+        """Menyimpan nilai, entri yang paling lama tidak dipakai dibuang jika cache penuh"""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable):
+        """Menghapus satu key (dipakai untuk invalidasi saat data berubah)"""
+        self._data.pop(key, None)
+
+    def clear(self):
+        self._data.clear()
+
+    def keys(self) -> List[Hashable]:
+        """Semua key yang tersimpan (bisa termasuk yang sudah kedaluwarsa), tanpa mengubah urutan LRU"""
+        return list(self._data)
+
+    def _lookup(self, key: Hashable):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return entry
+
+# Cache profile_picture_url recruiter untuk listing job (key: recruiter ObjectId)
+recruiter_avatar_cache = TTLCache(RECRUITER_AVATAR_CACHE_SIZE, RECRUITER_AVATAR_CACHE_TTL_SECONDS)
+
+# Cache hasil count pencarian job (key: mode, query ternormalisasi, max_count), dikosongkan setiap ada job yang berubah
+job_count_cache = TTLCache(JOB_COUNT_CACHE_SIZE, JOB_COUNT_CACHE_TTL_SECONDS)
@@ -4,6 +4,44 @@ REFRESH_TOKEN_EXPIRE_DAYS = 7
 OTP_EXPIRED_MINUTES = 15
 
 POPULAR_VIEWS_THRESHOLD = 3
+INTERACTION_SYNC_BATCH_SIZE = 5000
+# Log view yang lebih baru dari ini belum dimasukkan ke matriks interaksi, agar ObjectId dari
+# beberapa worker (urutan dalam satu detik tidak pasti) dan insert yang sedikit terlambat tidak terlewat
+INTERACTION_WATERMARK_LAG_SECONDS = 60
+CLUSTER_WRITE_CHUNK_SIZE = 1000
+CLUSTERING_WORKERS = 1
+CLUSTERING_JOB_HISTORY = 50
+STREAMING_KMEANS_BATCH_SIZE = 1024
+SVD_REFIT_NEW_JOB_RATIO = 0.2
+# Array model rekomendasi dipecah per chunk (di bawah batas 16 MB dokumen BSON)
+MODEL_CHUNK_SIZE_BYTES = 8 * 1024 * 1024
+MODEL_STATE_MAX_BYTES = 512 * 1024 * 1024
+POPULARITY_HALF_LIFE_HOURS = 72
+POPULARITY_WINDOW_DAYS = 30
+RECRUITER_AVATAR_CACHE_SIZE = 5000
+RECRUITER_AVATAR_CACHE_TTL_SECONDS = 300
+JOB_COUNT_CACHE_SIZE = 1000
+JOB_COUNT_CACHE_TTL_SECONDS = 30
+RESPONSE_CACHE_SIZE = 10000
+RESPONSE_CACHE_TTL_SECONDS = 60
+GROQ_TIMEOUT_SECONDS = 60
+GROQ_CONNECT_TIMEOUT_SECONDS = 5
+GROQ_MAX_CONNECTIONS = 20
+GROQ_MAX_KEEPALIVE_CONNECTIONS = 10
+GROQ_KEEPALIVE_EXPIRY_SECONDS = 30
+LLM_COMPLETION_CACHE_SIZE = 5000
+LLM_COMPLETION_CACHE_TTL_SECONDS = 7 * 24 * 3600
+RESUME_PARSE_CONCURRENCY = 4
+RESUME_SECTION_TIMEOUT_SECONDS = 30
+# Jumlah proses untuk ekstraksi teks PDF dan identifikasi section resume
+RESUME_PARSING_WORKERS = 2
+# Naikkan jika logika ResumeParser berubah agar hasil parse lama di cache tidak dipakai lagi
+RESUME_PARSER_VERSION = 1
+RESUME_PARSE_CACHE_SIZE = 256
+RESUME_PARSE_CACHE_TTL_DAYS = 30
+# Upload resume dibaca ke memory sampai batas ini, lebih besar dari itu dipindah ke file sementara
+UPLOAD_MEMORY_LIMIT_BYTES = 10 * 1024 * 1024
+UPLOAD_CHUNK_SIZE_BYTES = 64 * 1024
 
 CATEGORIES_EN = [
     {
@@ -713,6 +751,60 @@ Now extract the location from this resume text:
 Return only the location name as a raw string. No other text, labels, or explanation.
 """
 
+RESUME_ONE_SHOT_PARSING_QUERY = """Extract structured data from the following resume sections and return a single JSON object.
+The text might be written in English or Indonesian, so please extract them accordingly.
+Return only the JSON object. Do not add any explanation or text before or after it.
+If a section is empty, return an empty string or an empty list for it. Do not invent data.
+
+Fields:
+- description: the INTRODUCTION text cleaned from names, addresses, and unrelated prefixes, as a plain string
+- location: only the location name from the LOCATION text, as a plain string
+- skills: list of technical or soft skill names from the SKILLS text
+- achievements: list of entries with achievement, date
+- educations: list of entries with institution, degree, field_of_study, start_date, end_date, gpa (null if not available)
+- experiences: list of entries with company, location (empty if not available), position, start_date, end_date, responsibilities (list of strings)
+
+INTRODUCTION:
+\"\"\"
+{description_text}
+\"\"\"
+
+LOCATION:
+\"\"\"
+{location_text}
+\"\"\"
+
+SKILLS:
+\"\"\"
+{skills_text}
+\"\"\"
+
+ACHIEVEMENTS:
+\"\"\"
+{achievements_text}
+\"\"\"
+
+EDUCATION:
+\"\"\"
+{educations_text}
+\"\"\"
+
+EXPERIENCE:
+\"\"\"
+{experiences_text}
+\"\"\"
+
+Return the result in this exact JSON format:
+{{
+  "description": "...",
+  "location": "...",
+  "skills": ["..."],
+  "achievements": [{{"achievement": "...", "date": "..."}}],
+  "educations": [{{"institution": "...", "degree": "...", "field_of_study": "...", "start_date": "...", "end_date": "...", "gpa": null}}],
+  "experiences": [{{"company": "...", "location": "...", "position": "...", "start_date": "...", "end_date": "...", "responsibilities": ["..."]}}]
+}}
+"""
+
 LOCATION_KEYWORDS = [
             "jakarta", "bandung", "yogyakarta", "indonesia", "singapore", 
             "street", "jalan", "city", "provinsi", "kode pos", "semarang",
@@ -0,0 +1,216 @@
+import bisect
+import heapq
+import logging
+import re
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+")
+INDEXED_FIELDS = ("job_title", "company_name", "location", "required_skills")
+# Prefix yang cocok dengan lebih dari HEAVY_PREFIX_TERMS term memakai daftar top-k yang disimpan,
+# prefix lain cukup di-scan langsung dari array terurut
+HEAVY_PREFIX_TERMS = 256
+MAX_SUGGESTIONS = 50
+
+def normalize_term(text: str) -> str:
+    """Lowercase dan rapikan spasi agar "Software  Engineer" dan "software engineer" jadi satu term"""
+    return " ".join(text.lower().split())
+
+class JobSearchIndex:
+    """
+    Inverted index in-memory untuk autocomplete job.
+
+    Term = token (kata) dan frasa utuh (judul, perusahaan, lokasi, skill) dari setiap job.
+    Setiap term menyimpan posting berupa set job ID, dan semua term disimpan dalam array terurut
+    sehingga completion untuk sebuah prefix cukup dicari dengan bisect (O(log n)) lalu diambil
+    top-k berdasarkan jumlah job. Untuk prefix pendek yang cocok dengan banyak term, top-k
+    disimpan di `heavy_prefixes` (maksimal 2 x MAX_SUGGESTIONS term) dan diperbarui secara
+    inkremental saat jumlah job sebuah term berubah.
+    """
+    instance: Optional["JobSearchIndex"] = None
+
+    def __init__(self):
+        self.postings: Dict[str, Set[str]] = {}
+        self.display: Dict[str, str] = {}
+        self.sorted_terms: List[str] = []
+        self.job_terms: Dict[str, Set[str]] = {}
+        self.heavy_prefixes: Dict[str, List[str]] = {}
+
+    @classmethod
+    def get_instance(cls) -> "JobSearchIndex":
+        """Mendapatkan index yang dipakai bersama dalam satu proses"""
+        if cls.instance is None:
+            cls.instance = cls()
+        return cls.instance
+
+    async def rebuild(self, database: AsyncIOMotorDatabase):
+        """Membangun ulang index dari koleksi jobs"""
+        start = time.perf_counter()
+        self.postings, self.display, self.job_terms = {}, {}, {}
+        cursor = database.jobs.find({}, {field: 1 for field in INDEXED_FIELDS})
+        async for job in cursor:
+            job_id = str(job["_id"])
+            terms = self._extract_terms(job)
+            for term, display in terms.items():
+                self.postings.setdefault(term, set()).add(job_id)
+                self.display.setdefault(term, display)
+            self.job_terms[job_id] = set(terms)
+
+        self.sorted_terms = sorted(self.postings)
+        self._build_heavy_prefixes()
+        logger.info(
+            f"Job search index built: {len(self.job_terms)} jobs, {len(self.sorted_terms)} terms, "
+            f"{len(self.heavy_prefixes)} heavy prefixes in {time.perf_counter() - start:.2f}s"
+        )
+
+    def add_job(self, job: dict):
+        """Menambahkan (atau mengganti) satu job di index. Hanya term yang berubah yang disentuh."""
+        job_id = str(job["_id"])
+        terms = self._extract_terms(job)
+        old_terms = self.job_terms.get(job_id, set())
+        self.job_terms[job_id] = set(terms)
+
+        self._remove_postings(job_id, old_terms - terms.keys())
+        added = terms.keys() - old_terms
+        for term in added:
+            if term not in self.postings:
+                self.postings[term] = set()
+                self.display[term] = terms[term]
+                bisect.insort(self.sorted_terms, term)
+            self.postings[term].add(job_id)
+        self._promote_terms(added)
+
+    def remove_job(self, job_id: str):
+        """Menghapus job dari index, term yang tidak lagi dipakai job mana pun ikut dihapus"""
+        terms = self.job_terms.pop(str(job_id), None)
+        if terms:
+            self._remove_postings(str(job_id), terms)
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[Tuple[str, int]]:
+        """
+        Mendapatkan top-k completion untuk prefix.
+
+        Returns:
+            list: (teks completion, jumlah job) terurut dari job terbanyak
+        """
+        # Spasi di akhir dipertahankan: "pt " hanya melengkapi frasa, bukan kata "pt" itu sendiri
+        trailing_space = prefix[-1:].isspace()
+        prefix = normalize_term(prefix)
+        if not prefix:
+            return []
+        if trailing_space:
+            prefix += " "
+
+        top_terms = self.heavy_prefixes.get(prefix)
+        if top_terms is None:
+            start, end = self._prefix_range(prefix)
+            if end - start > HEAVY_PREFIX_TERMS:
+                top_terms = self.heavy_prefixes[prefix] = self._top_terms(start, end)
+            else:
+                top_terms = self._top_terms(start, end, limit)
+        return [(self.display[term], len(self.postings[term])) for term in top_terms[:limit]]
+
+    def _rank(self, term: str) -> Tuple[int, str]:
+        return (-len(self.postings[term]), term)
+
+    def _prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """Rentang index di sorted_terms untuk semua term yang diawali prefix"""
+        start = bisect.bisect_left(self.sorted_terms, prefix)
+        end = bisect.bisect_left(self.sorted_terms, prefix + "\uffff", lo=start)
+        return start, end
+
+    def _top_terms(self, start: int, end: int, limit: int = 2 * MAX_SUGGESTIONS) -> List[str]:
+        """Term dengan jumlah job terbanyak di rentang sorted_terms[start:end]"""
+        return heapq.nsmallest(limit, self.sorted_terms[start:end], key=self._rank)
+
+    def _build_heavy_prefixes(self):
+        """Menghitung top-k untuk semua prefix yang cocok dengan lebih dari HEAVY_PREFIX_TERMS term"""
+        self.heavy_prefixes = {}
+        depth = 1
+        while True:
+            found = False
+            start = 0
+            while start < len(self.sorted_terms):
+                term = self.sorted_terms[start]
+                if len(term) < depth:
+                    start += 1
+                    continue
+                _, end = self._prefix_range(term[:depth])
+                if end - start > HEAVY_PREFIX_TERMS:
+                    self.heavy_prefixes[term[:depth]] = self._top_terms(start, end)
+                    found = True
+                start = end
+            if not found:
+                break
+            depth += 1
+
+    def _heavy_prefixes_of(self, term: str) -> List[str]:
+        return [term[:depth] for depth in range(1, len(term) + 1) if term[:depth] in self.heavy_prefixes]
+
+    def _remove_postings(self, job_id: str, terms: Iterable[str]):
+        """Mengurangi jumlah job untuk term-term ini dan menjaga top-k prefix berat tetap benar"""
+        for term in terms:
+            postings = self.postings[term]
+            postings.discard(job_id)
+            removed = not postings
+
+            for prefix in self._heavy_prefixes_of(term):
+                top_terms = self.heavy_prefixes[prefix]
+                if term not in top_terms:
+                    continue
+                top_terms.remove(term)
+                # Term yang turun hanya boleh tetap di daftar jika masih di atas elemen terakhir,
+                # karena term di luar daftar dijamin tidak lebih tinggi dari elemen terakhir
+                if not removed and top_terms and self._rank(term) < self._rank(top_terms[-1]):
+                    top_terms.append(term)
+                    top_terms.sort(key=self._rank)
+
+            if removed:
+                del self.postings[term]
+                del self.display[term]
+                self.sorted_terms.pop(bisect.bisect_left(self.sorted_terms, term))
+
+            # Daftar yang tidak lagi penuh dihitung ulang dari array terurut, karena term di luar
+            # daftar hanya dijamin tidak lebih tinggi dari elemen terakhir selama daftar penuh
+            for prefix in self._heavy_prefixes_of(term):
+                if len(self.heavy_prefixes[prefix]) < 2 * MAX_SUGGESTIONS:
+                    start, end = self._prefix_range(prefix)
+                    if len(self.heavy_prefixes[prefix]) < min(end - start, 2 * MAX_SUGGESTIONS):
+                        self.heavy_prefixes[prefix] = self._top_terms(start, end)
+
+    def _promote_terms(self, terms: Iterable[str]):
+        """Memasukkan term yang jumlah job-nya naik ke top-k prefix berat jika peringkatnya cukup tinggi"""
+        for term in terms:
+            for prefix in self._heavy_prefixes_of(term):
+                top_terms = self.heavy_prefixes[prefix]
+                if term in top_terms:
+                    top_terms.remove(term)
+                elif len(top_terms) >= 2 * MAX_SUGGESTIONS and self._rank(term) > self._rank(top_terms[-1]):
+                    continue
+                top_terms.append(term)
+                top_terms.sort(key=self._rank)
+                del top_terms[2 * MAX_SUGGESTIONS:]
+
+    @staticmethod
+    def _extract_terms(job: dict) -> Dict[str, str]:
+        """Mengambil term ternormalisasi -> teks tampilan dari field yang di-index"""
+        values = []
+        for field in INDEXED_FIELDS:
+            value = job.get(field)
+            if isinstance(value, list):
+                values.extend(item for item in value if isinstance(item, str))
+            elif isinstance(value, str):
+                values.append(value)
+
+        terms = {}
+        for value in values:
+            phrase = normalize_term(value)
+            if not phrase:
+                continue
+            terms.setdefault(phrase, " ".join(value.split()))
+            for token in TOKEN_PATTERN.findall(phrase):
+                terms.setdefault(token, token)
+        return terms
@@ -0,0 +1,67 @@
+import base64
+import json
+from bson import ObjectId
+from datetime import datetime
+from fastapi import HTTPException, Response, status
+from typing import Any, List, Optional, Tuple
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(sort_value: Optional[datetime], object_id: Any) -> str:
+    """Membuat cursor opaque (base64) dari nilai field urutan dan _id dokumen terakhir di halaman"""
+    payload = {"v": sort_value.isoformat() if sort_value else None, "id": str(object_id)}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], ObjectId]:
+    """Membaca cursor yang dibuat encode_cursor"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        sort_value = datetime.fromisoformat(payload["v"]) if payload["v"] else None
+        return sort_value, ObjectId(payload["id"])
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+def keyset_sort(sort_field: str) -> List[Tuple[str, int]]:
+    """Urutan (sort_field, _id) descending yang dipakai bersama dengan cursor"""
+    return [(sort_field, -1), ("_id", -1)]
+
+def keyset_query(query: dict, sort_field: str, cursor: Optional[str]) -> dict:
+    """
+    Menambahkan kondisi "setelah cursor" ke query, sehingga halaman berikutnya langsung
+    dimulai dari posisi cursor di index (sort_field, _id) tanpa melewati dokumen sebelumnya.
+    """
+    if not cursor:
+        return query
+
+    sort_value, last_id = decode_cursor(cursor)
+    if sort_value is None:
+        # Dokumen tanpa sort_field berada paling akhir pada urutan descending
+        after_cursor = {sort_field: None, "_id": {"$lt": last_id}}
+    else:
+        after_cursor = {"$or": [
+            {sort_field: {"$lt": sort_value}},
+            {sort_field: sort_value, "_id": {"$lt": last_id}},
+            {sort_field: None},
+        ]}
+    return {"$and": [query, after_cursor]} if query else after_cursor
+
+def set_next_cursor(response: Response, items: List[Any], sort_field: str, limit: int):
+    """
+    Mengisi header X-Next-Cursor dari item terakhir jika halaman penuh (masih ada halaman berikutnya).
+    Nilai cursor harus sama dengan isi dokumen di database: field created_at/updated_at pada model
+    response punya default datetime.now, jadi untuk model hanya field yang benar-benar ada di dokumen
+    (model_fields_set) yang dipakai, selain itu cursor berisi None seperti dokumen tanpa field tersebut.
+    """
+    if not items or len(items) < limit:
+        return
+    last = items[-1]
+    if isinstance(last, dict):
+        sort_value, object_id = last.get(sort_field), last.get("_id")
+    else:
+        sort_value = getattr(last, sort_field, None) if sort_field in last.model_fields_set else None
+        object_id = last.id
+    response.headers[NEXT_CURSOR_HEADER] = encode_cursor(sort_value, object_id)
@@ -0,0 +1,42 @@
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+class ProcessPool:
+    """Process pool bersama untuk pekerjaan CPU-bound agar tidak memblokir event loop"""
+    executors: Dict[str, ProcessPoolExecutor] = {}
+
+    @classmethod
+    def get_executor(cls, name: str, max_workers: int = 1) -> ProcessPoolExecutor:
+        """Fungsi untuk mendapatkan (atau membuat) process pool berdasarkan nama"""
+        if name not in cls.executors:
+            # "spawn" agar worker tidak mewarisi thread dan koneksi MongoDB dari proses utama
+            cls.executors[name] = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"Started process pool '{name}' with {max_workers} worker(s)")
+        return cls.executors[name]
+
+    @classmethod
+    def reset(cls, name: str, executor: ProcessPoolExecutor):
+        """
+        Fungsi untuk membuang process pool yang rusak (BrokenProcessPool, mis. worker crash),
+        sehingga get_executor berikutnya membuat pool baru. Pool hanya dibuang jika masih sama
+        dengan `executor`, agar pool baru yang sudah dibuat request lain tidak ikut dimatikan.
+        """
+        if cls.executors.get(name) is executor:
+            del cls.executors[name]
+            logger.warning(f"Process pool '{name}' is broken, it will be restarted on next use")
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def shutdown(cls):
+        """Fungsi untuk mematikan semua process pool"""
+        for name, executor in cls.executors.items():
+            executor.shutdown(wait=False, cancel_futures=True)
+            logger.info(f"Shut down process pool '{name}'")
+        cls.executors.clear()
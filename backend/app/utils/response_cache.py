@@ -0,0 +1,230 @@
+import logging
+import math
+import pickle
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set
+
+from app.utils.cache import TTLCache
+from app.utils.constants import RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+MISSING = object()
+
+class MemoryCacheBackend:
+    """Backend in-process (LRU + TTL). Nilai disimpan apa adanya tanpa serialisasi."""
+    name = "memory"
+
+    def __init__(self, maxsize: int = RESPONSE_CACHE_SIZE, ttl: float = RESPONSE_CACHE_TTL_SECONDS):
+        self.entries = TTLCache(maxsize, ttl)
+        self.tags: Dict[str, Set[str]] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.entries.get(key, MISSING)
+
+    async def set(self, key: str, value: Any, tags: Iterable[str]):
+        self.entries.set(key, value)
+        for tag in tags:
+            keys = self.tags.setdefault(tag, set())
+            keys.add(key)
+            # Key yang sudah dibuang LRU tetap tercatat di tag sampai dibersihkan di sini
+            if len(keys) > self.entries.maxsize:
+                keys.intersection_update(self.entries.keys())
+
+    async def delete_tags(self, tags: Iterable[str]):
+        for tag in tags:
+            for key in self.tags.pop(tag, ()):
+                self.entries.pop(key)
+
+    async def clear(self):
+        self.entries.clear()
+        self.tags.clear()
+
+    async def close(self):
+        pass
+
+    def size(self) -> Optional[int]:
+        return len(self.entries)
+
+class RedisCacheBackend:
+    """
+    Backend Redis untuk cache yang dipakai bersama oleh beberapa worker.
+
+    Client cukup kompatibel dengan redis.asyncio.Redis untuk perintah get, set (dengan ex),
+    sadd, expire, smembers, dan delete, jadi bisa diganti stand-in lokal (misalnya fakeredis)
+    saat development. Nilai diserialisasi dengan pickle.
+    """
+    name = "redis"
+
+    def __init__(self, client, ttl: float = RESPONSE_CACHE_TTL_SECONDS, prefix: str = "getajob:cache"):
+        self.client = client
+        self.ttl = max(1, math.ceil(ttl))
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisCacheBackend":
+        """Membuat backend dari URL Redis (butuh package `redis`, tidak wajib jika memakai backend memory)"""
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            raise RuntimeError("Package `redis` belum terinstall, dibutuhkan untuk CACHE_REDIS_URL")
+        return cls(redis.from_url(url), **kwargs)
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:key:{key}"
+
+    def _tag(self, tag: str) -> str:
+        return f"{self.prefix}:tag:{tag}"
+
+    async def get(self, key: str) -> Any:
+        data = await self.client.get(self._key(key))
+        return MISSING if data is None else pickle.loads(data)
+
+    async def set(self, key: str, value: Any, tags: Iterable[str]):
+        await self.client.set(self._key(key), pickle.dumps(value), ex=self.ttl)
+        for tag in tags:
+            # Set tag kedaluwarsa bersama entri terakhir yang ditambahkan (TTL semua entri sama)
+            await self.client.sadd(self._tag(tag), self._key(key))
+            await self.client.expire(self._tag(tag), self.ttl)
+
+    async def delete_tags(self, tags: Iterable[str]):
+        for tag in tags:
+            keys = await self.client.smembers(self._tag(tag))
+            await self.client.delete(self._tag(tag), *keys)
+
+    async def clear(self):
+        async for key in self.client.scan_iter(match=f"{self.prefix}:*"):
+            await self.client.delete(key)
+
+    async def close(self):
+        close = getattr(self.client, "aclose", None) or getattr(self.client, "close", None)
+        if close is not None:
+            await close()
+
+    def size(self) -> Optional[int]:
+        return None
+
+class ResponseCache:
+    """
+    Cache untuk hasil endpoint baca yang sering dipanggil (detail job, listing job dengan gambar,
+    detail recruiter, rekomendasi).
+
+    Setiap entri diberi tag (misalnya "job:<id>", "recruiter:<id>", "jobs") dan controller
+    menghapus tag yang terdampak setiap kali menulis data. Backend bisa diganti dengan
+    use_backend (memory secara default, Redis jika CACHE_REDIS_URL di-set). Error dari backend
+    tidak menggagalkan request: data langsung diambil dari database.
+    """
+    instance: Optional["ResponseCache"] = None
+
+    def __init__(self, backend=None):
+        self.backend = backend or MemoryCacheBackend()
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self.invalidations = 0
+        self.errors = 0
+        # Naik setiap invalidasi. Hasil loader tidak disimpan jika salah satu tag entri tersebut
+        # diinvalidasi (tag_generations) setelah loader dimulai, tag lain tidak berpengaruh
+        self.generation = 0
+        self.tag_generations: Dict[str, int] = {}
+        self.cleared_generation = 0
+        self.loading = 0
+
+    @classmethod
+    def get_instance(cls) -> "ResponseCache":
+        """Mendapatkan cache yang dipakai bersama dalam satu proses"""
+        if cls.instance is None:
+            cls.instance = cls()
+        return cls.instance
+
+    def use_backend(self, backend):
+        """Mengganti backend cache (dipanggil saat startup)"""
+        self.backend = backend
+        logger.info(f"Response cache backend: {backend.name}")
+
+    async def get_or_set(
+        self,
+        namespace: str,
+        key: Any,
+        loader: Callable[[], Awaitable[Any]],
+        tags: Iterable[str] = ()
+    ) -> Any:
+        """
+        Mengambil nilai dari cache, atau memanggil loader lalu menyimpan hasilnya.
+        `tags` boleh berupa callable yang menerima hasil loader (untuk tag yang bergantung pada hasil).
+        """
+        full_key = f"{namespace}:{key}"
+        try:
+            value = await self.backend.get(full_key)
+        except Exception as e:
+            self._backend_error("get", e)
+            value = MISSING
+
+        if value is not MISSING:
+            self.hits[namespace] += 1
+            return value
+
+        self.misses[namespace] += 1
+        generation = self.generation
+        self.loading += 1
+        try:
+            value = await loader()
+            entry_tags = tags(value) if callable(tags) else list(tags)
+            if not self._invalidated_since(generation, entry_tags):
+                try:
+                    await self.backend.set(full_key, value, entry_tags)
+                except Exception as e:
+                    self._backend_error("set", e)
+        finally:
+            self.loading -= 1
+            # Generasi per tag hanya dibutuhkan selama ada loader yang berjalan
+            if not self.loading:
+                self.tag_generations.clear()
+        return value
+
+    async def invalidate(self, *tags: str):
+        """Menghapus semua entri yang memiliki salah satu tag"""
+        self.generation += 1
+        self.invalidations += 1
+        if self.loading:
+            for tag in tags:
+                self.tag_generations[tag] = self.generation
+        try:
+            await self.backend.delete_tags(tags)
+        except Exception as e:
+            self._backend_error("invalidate", e)
+
+    async def clear(self):
+        self.generation += 1
+        self.cleared_generation = self.generation
+        await self.backend.clear()
+
+    async def close(self):
+        await self.backend.close()
+
+    def metrics(self) -> dict:
+        """Jumlah hit/miss per namespace beserta hit ratio"""
+        namespaces = {}
+        for namespace in sorted(set(self.hits) | set(self.misses)):
+            hits, misses = self.hits[namespace], self.misses[namespace]
+            namespaces[namespace] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            }
+        return {
+            "backend": self.backend.name,
+            "entries": self.backend.size(),
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+            "namespaces": namespaces,
+        }
+
+    def _invalidated_since(self, generation: int, tags: Iterable[str]) -> bool:
+        """True jika cache dikosongkan atau salah satu tag diinvalidasi setelah `generation`"""
+        if self.cleared_generation > generation:
+            return True
+        return any(self.tag_generations.get(tag, 0) > generation for tag in tags)
+
+    def _backend_error(self, operation: str, error: Exception):
+        self.errors += 1
+        logger.warning(f"Response cache {operation} failed: {error}")
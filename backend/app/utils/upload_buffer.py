@@ -0,0 +1,75 @@
+import hashlib
+import logging
+import os
+import tempfile
+from typing import Optional
+from fastapi import UploadFile
+
+from app.utils.constants import UPLOAD_MEMORY_LIMIT_BYTES, UPLOAD_CHUNK_SIZE_BYTES
+
+logger = logging.getLogger(__name__)
+
+class UploadBuffer:
+    """
+    Membaca UploadFile secara bertahap (per chunk) ke memory tanpa menulis file sementara.
+
+    Selama ukuran upload masih di bawah `max_memory`, isi file tersedia di `content` dan bisa
+    langsung dibuka dengan fitz.open(stream=...) atau dikirim ke OCR. Jika melewati batas,
+    data dipindahkan ke file sementara (`path`) dan `content` bernilai None. File sementara
+    selalu dihapus saat keluar dari blok `async with`, termasuk ketika parsing gagal.
+    SHA-256 dihitung sambil membaca sehingga tidak perlu membaca ulang file untuk key cache.
+    """
+
+    def __init__(self, max_memory: int = UPLOAD_MEMORY_LIMIT_BYTES, chunk_size: int = UPLOAD_CHUNK_SIZE_BYTES):
+        self.max_memory = max_memory
+        self.chunk_size = chunk_size
+        self.content: Optional[bytes] = None
+        self.path: Optional[str] = None
+        self.size = 0
+        self.sha256 = ""
+
+    async def __aenter__(self) -> "UploadBuffer":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+    async def read_from(self, file: UploadFile) -> "UploadBuffer":
+        """Membaca seluruh isi upload ke memory (atau ke file sementara jika melewati batas)"""
+        digest = hashlib.sha256()
+        buffer = bytearray()
+        spill = None
+        try:
+            while True:
+                chunk = await file.read(self.chunk_size)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                self.size += len(chunk)
+                if spill is None and self.size > self.max_memory:
+                    fd, self.path = tempfile.mkstemp(suffix=".pdf")
+                    spill = os.fdopen(fd, "wb")
+                    spill.write(buffer)
+                    buffer = None
+                    logger.info(f"Upload {file.filename} exceeded {self.max_memory} bytes, spilled to temporary file")
+                if spill is not None:
+                    spill.write(chunk)
+                else:
+                    buffer.extend(chunk)
+        finally:
+            if spill is not None:
+                spill.close()
+
+        self.content = bytes(buffer) if spill is None else None
+        self.sha256 = digest.hexdigest()
+        return self
+
+    def close(self):
+        """Menghapus file sementara (jika ada) dan melepas buffer"""
+        self.content = None
+        if self.path is not None:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            self.path = None
@@ -0,0 +1,71 @@
+"""
+Benchmark DBSCAN: matriks jarak penuh ("precomputed") vs graph tetangga sparse ("neighbors").
+
+Data sintetis: setiap applier melihat beberapa job dari kelompok minat tertentu,
+sehingga bentuknya mirip matriks interaksi applier x job di production.
+
+Jalankan dari folder backend:
+    python -m benchmarks.bench_dbscan_neighbors --sizes 1000 10000 100000
+"""
+import argparse
+import time
+import tracemalloc
+import numpy as np
+from scipy import sparse
+from sklearn.metrics import adjusted_rand_score
+
+from app.ai_services.clustering import dbscan_labels
+
+def make_user_matrix(n_users: int, n_jobs: int, users_per_group: int = 200, views_per_user: int = 8, seed: int = 42):
+    """Membuat matriks interaksi sintetis berbentuk CSR (nilai view dinormalisasi 0-1)"""
+    rng = np.random.default_rng(seed)
+    n_groups = max(1, n_users // users_per_group)
+    jobs_per_group = max(1, n_jobs // n_groups)
+    groups = rng.integers(0, n_groups, size=n_users)
+
+    rows = np.repeat(np.arange(n_users), views_per_user)
+    offsets = rng.integers(0, jobs_per_group, size=n_users * views_per_user)
+    cols = (np.repeat(groups, views_per_user) * jobs_per_group + offsets) % n_jobs
+    data = rng.integers(1, 5, size=n_users * views_per_user).astype(np.float32)
+
+    matrix = sparse.csr_matrix((data, (rows, cols)), shape=(n_users, n_jobs), dtype=np.float32)
+    matrix.data /= matrix.data.max()
+    return matrix
+
+def run(user_matrix, eps: float, min_samples: int, mode: str):
+    tracemalloc.start()
+    start = time.perf_counter()
+    labels = dbscan_labels(user_matrix, eps, min_samples, mode)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return labels, elapsed, peak
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--eps", type=float, default=0.5)
+    parser.add_argument("--min-samples", type=int, default=5)
+    parser.add_argument("--max-dense-gb", type=float, default=2.0,
+                        help="Lewati mode precomputed jika matriks n x n melebihi batas ini")
+    args = parser.parse_args()
+
+    print(f"{'users':>8} {'mode':>12} {'time (s)':>10} {'peak MB':>10} {'clusters':>9} {'ARI vs full':>12}")
+    for n_users in args.sizes:
+        user_matrix = make_user_matrix(n_users, n_jobs=max(500, n_users // 5))
+        results = {}
+        for mode in ("precomputed", "neighbors"):
+            dense_gb = n_users * n_users * 8 / 1e9
+            if mode == "precomputed" and dense_gb > args.max_dense_gb:
+                print(f"{n_users:>8} {mode:>12} {'skipped':>10} {f'~{dense_gb * 1000:.0f}':>10} {'-':>9} {'-':>12}")
+                continue
+            labels, elapsed, peak = run(user_matrix, args.eps, args.min_samples, mode)
+            results[mode] = labels
+            n_clusters = len(set(labels.tolist()) - {-1})
+            same = "-"
+            if mode == "neighbors" and "precomputed" in results:
+                same = f"{adjusted_rand_score(results['precomputed'], labels):.4f}"
+            print(f"{n_users:>8} {mode:>12} {elapsed:>10.2f} {peak / 1e6:>10.1f} {n_clusters:>9} {same:>12}")
+
+if __name__ == "__main__":
+    main()
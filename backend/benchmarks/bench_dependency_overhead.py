@@ -0,0 +1,127 @@
+"""
+Microbenchmark overhead dependency per request: controller dibuat ulang di setiap request
+(pola lama) vs instance bersama dari Container.
+
+Bagian pertama memanggil fungsi dependency langsung. Bagian kedua mengirim request ke app
+FastAPI kecil lewat httpx.ASGITransport (tanpa jaringan), dengan endpoint yang hanya
+bergantung pada dependency tersebut, sehingga overhead resolusi Depends ikut terukur.
+Tidak butuh MongoDB: membuat controller hanya mengambil referensi koleksi, belum ada query.
+
+Jalankan dari folder backend:
+    python -m benchmarks.bench_dependency_overhead --iterations 20000 --requests 2000
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+import httpx
+from fastapi import Depends, FastAPI
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.ai_services.recommendation_service import RecommendationService
+from app.ai_services.resume_service import ResumeService
+from app.config.container import Container
+from app.controllers.auth_controller import AuthController
+from app.controllers.job_controller import JobController
+from app.middleware.permissions import get_auth_controller
+from app.routes.job_routes import get_job_controller
+from app.routes.recommendation_route import get_recommendation_service
+from app.routes.resume_routes import get_resume_controller
+
+BENCH_DB = "getajob_bench_dependency"
+
+def legacy_providers(db):
+    """Dependency versi lama: setiap pemanggilan membuat object baru"""
+    async def legacy_job_controller():
+        return JobController(db)
+
+    async def legacy_auth_controller():
+        return AuthController(db)
+
+    async def legacy_recommendation_service():
+        return RecommendationService(db)
+
+    async def legacy_resume_controller():
+        return ResumeService(db)
+
+    return {
+        "job_controller": legacy_job_controller,
+        "auth_controller": legacy_auth_controller,
+        "recommendation_service": legacy_recommendation_service,
+        "resume_service": legacy_resume_controller,
+    }
+
+CONTAINER_PROVIDERS = {
+    "job_controller": get_job_controller,
+    "auth_controller": get_auth_controller,
+    "recommendation_service": get_recommendation_service,
+    "resume_service": get_resume_controller,
+}
+
+async def time_calls(provider, iterations: int) -> float:
+    """Rata-rata mikrodetik per pemanggilan dependency"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await provider()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+def make_app(providers) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/probe")
+    async def probe(
+        job_controller=Depends(providers["job_controller"]),
+        auth_controller=Depends(providers["auth_controller"]),
+        recommendation_service=Depends(providers["recommendation_service"]),
+        resume_service=Depends(providers["resume_service"])
+    ):
+        return {"ok": True}
+
+    return app
+
+async def time_requests(app: FastAPI, n_requests: int) -> list:
+    """Latency (ms) per request ke endpoint /probe"""
+    latencies = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(n_requests):
+            start = time.perf_counter()
+            response = await client.get("/probe")
+            latencies.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200
+    return latencies
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    os.environ.setdefault("GROQ_API_KEY", "bench")
+    client = AsyncIOMotorClient("mongodb://localhost:27017", connect=False)
+    db = client[BENCH_DB]
+    Container.init(db)
+    legacy = legacy_providers(db)
+
+    print(f"{'dependency':>24} {'per request us':>15} {'container us':>13} {'speedup':>8}")
+    for name in CONTAINER_PROVIDERS:
+        before = await time_calls(legacy[name], args.iterations)
+        after = await time_calls(CONTAINER_PROVIDERS[name], args.iterations)
+        print(f"{name:>24} {before:>15.2f} {after:>13.2f} {before / after:>7.1f}x")
+
+    rows = []
+    for label, providers in (("per request", legacy), ("container", CONTAINER_PROVIDERS)):
+        latencies = await time_requests(make_app(providers), args.requests)
+        rows.append((label, statistics.median(latencies), sorted(latencies)[int(len(latencies) * 0.99) - 1]))
+
+    print(f"\nGET /probe via ASGITransport ({args.requests} requests, 4 dependencies)")
+    print(f"{'variant':>12} {'p50 ms':>8} {'p99 ms':>8}")
+    for label, p50, p99 in rows:
+        print(f"{label:>12} {p50:>8.3f} {p99:>8.3f}")
+
+    await Container.get_instance().close()
+    client.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
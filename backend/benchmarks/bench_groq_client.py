@@ -0,0 +1,97 @@
+"""
+Benchmark latency GroqAPI.get_response terhadap stub server lokal.
+
+Membandingkan pola lama (httpx.AsyncClient baru untuk setiap completion) dengan GroqAPI yang
+memakai satu client ber-pool dan keep-alive. Stub server (uvicorn, HTTP/1.1 tanpa TLS) membalas
+format chat completion setelah delay opsional, dan mencatat port client yang berbeda untuk
+menghitung jumlah koneksi TCP yang dibuka. Karena stub tidak memakai TLS, selisih ke API Groq
+asli (handshake TLS lewat internet) akan lebih besar dari angka di sini.
+
+Jalankan dari folder backend:
+    python -m benchmarks.bench_groq_client --calls 200 --concurrency 6
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+
+from app.ai_services.llm import GroqAPI
+
+def make_stub(delay_ms: float, client_ports: set) -> FastAPI:
+    stub = FastAPI()
+
+    @stub.post("/openai/v1/chat/completions")
+    async def chat_completions(request: Request):
+        client_ports.add(request.scope["client"][1])
+        await request.json()
+        if delay_ms:
+            await asyncio.sleep(delay_ms / 1000)
+        return {"choices": [{"message": {"role": "assistant", "content": "{\"skills\": []}"}}]}
+
+    return stub
+
+async def legacy_get_response(url: str, prompt: str) -> str:
+    """Pola lama GroqAPI.get_response: client baru (dan koneksi baru) setiap pemanggilan"""
+    data = {"model": "stub", "messages": [{"role": "user", "content": prompt}], "temperature": 0}
+    async with httpx.AsyncClient() as client:
+        response = await client.post(url, headers={"Authorization": "Bearer stub"}, json=data)
+        return response.json()['choices'][0]['message']['content']
+
+async def run(call, calls: int, concurrency: int):
+    """Latency per pemanggilan (ms) dan total waktu, dikirim dalam batch sebanyak concurrency"""
+    latencies = []
+
+    async def timed():
+        start = time.perf_counter()
+        await call()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    for i in range(0, calls, concurrency):
+        await asyncio.gather(*(timed() for _ in range(min(concurrency, calls - i))))
+    return latencies, time.perf_counter() - start
+
+def percentile(values, q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=6, help="Jumlah call paralel (ResumeParser.parse memanggil sampai 6)")
+    parser.add_argument("--delay-ms", type=float, default=0.0, help="Delay respons stub (simulasi waktu inferensi)")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    client_ports: set = set()
+    server = uvicorn.Server(uvicorn.Config(make_stub(args.delay_ms, client_ports), port=args.port, log_level="warning"))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    url = f"http://127.0.0.1:{args.port}/openai/v1/chat/completions"
+    groq = GroqAPI(api_key="stub", base_url=url)
+    variants = [
+        ("new client per call", lambda: legacy_get_response(url, "resume")),
+        ("pooled GroqAPI", lambda: groq.get_response("resume", model="stub", temperature=0)),
+    ]
+
+    try:
+        print(f"{args.calls} calls, concurrency {args.concurrency}, stub delay {args.delay_ms}ms, http2={groq.http2}")
+        print(f"{'variant':>22} {'p50 ms':>8} {'p95 ms':>8} {'total s':>8} {'connections':>12}")
+        for name, call in variants:
+            await call()  # warm up (import, koneksi pertama)
+            client_ports.clear()
+            latencies, total = await run(call, args.calls, args.concurrency)
+            print(f"{name:>22} {statistics.median(latencies):>8.2f} {percentile(latencies, 0.95):>8.2f} "
+                  f"{total:>8.2f} {len(client_ports):>12}")
+    finally:
+        await groq.close()
+        server.should_exit = True
+        await server_task
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,120 @@
+"""
+Benchmark jumlah round trip database per halaman listing job dengan gambar recruiter.
+
+Membandingkan pola lama (find_one recruiter per baris) dengan JobController yang memakai
+satu query $in ke recruiters dan cache avatar. Setiap perintah yang dikirim ke MongoDB
+(find, getMore, aggregate, ...) dihitung lewat pymongo CommandListener.
+
+Butuh MongoDB (data ditulis ke database terpisah yang dihapus setelah selesai).
+Jalankan dari folder backend:
+    MONGODB_URI=mongodb://localhost:27017 python -m benchmarks.bench_job_listing_round_trips --page-size 100
+"""
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+
+from app.controllers.job_controller import JobController
+from app.utils.cache import recruiter_avatar_cache
+
+BENCH_DB = "getajob_bench_listing"
+
+class CommandCounter(monitoring.CommandListener):
+    def __init__(self):
+        self.count = 0
+
+    def started(self, event):
+        if event.database_name == BENCH_DB:
+            self.count += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+async def seed(db, n_jobs: int, n_recruiters: int):
+    recruiter_ids = [ObjectId() for _ in range(n_recruiters)]
+    await db.recruiters.insert_many([
+        {"_id": recruiter_id, "profile_picture_url": f"https://example.com/{recruiter_id}.png"}
+        for recruiter_id in recruiter_ids
+    ])
+    await db.jobs.insert_many([
+        {
+            "job_title": f"Job {i}",
+            "company_name": f"Company {i % n_recruiters}",
+            "location": "Jakarta",
+            "employment_type": "Full-time",
+            "minimum_education": "S1",
+            "required_skills": ["python"],
+            "recruiter_id": recruiter_ids[i % n_recruiters],
+            "created_at": datetime.now(),
+            "updated_at": datetime.now(),
+        }
+        for i in range(n_jobs)
+    ])
+
+async def legacy_page(db, skip: int, limit: int):
+    """Pola lama: satu find_one recruiter untuk setiap job di halaman"""
+    jobs = await db.jobs.find().sort("updated_at", -1).skip(skip).limit(limit).to_list(length=limit)
+    for job in jobs:
+        recruiter = await db.recruiters.find_one({"_id": job["recruiter_id"]})
+        job["profile_picture_url"] = recruiter.get("profile_picture_url") if recruiter else None
+    return jobs
+
+async def measure(counter: CommandCounter, coroutine):
+    counter.count = 0
+    start = time.perf_counter()
+    await coroutine
+    return counter.count, (time.perf_counter() - start) * 1000
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--recruiters", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    db_url = os.getenv("MONGODB_URI")
+    if not db_url:
+        raise SystemExit("MONGODB_URI belum di-set")
+
+    counter = CommandCounter()
+    client = AsyncIOMotorClient(db_url, event_listeners=[counter])
+    db = client[BENCH_DB]
+    await client.drop_database(BENCH_DB)
+    await seed(db, args.jobs, args.recruiters)
+    controller = JobController(db)
+
+    try:
+        recruiter_avatar_cache.clear()
+        rows = [
+            ("legacy (find_one per row)", *await measure(counter, legacy_page(db, 0, args.page_size))),
+            ("get_jobs_with_image (cold)", *await measure(counter, controller.get_jobs_with_image(0, args.page_size))),
+            ("get_jobs_with_image (warm)", *await measure(counter, controller.get_jobs_with_image(0, args.page_size))),
+        ]
+        recruiter_avatar_cache.clear()
+        rows += [
+            ("search_jobs_with_image (cold)", *await measure(counter, controller.search_jobs_with_image("job", 0, args.page_size))),
+            ("search_jobs_with_image (warm)", *await measure(counter, controller.search_jobs_with_image("job", 0, args.page_size))),
+        ]
+
+        print(f"page size {args.page_size}, {args.jobs} jobs, {args.recruiters} recruiters")
+        print(f"{'variant':>32} {'round trips':>12} {'ms':>8}")
+        for name, round_trips, elapsed in rows:
+            print(f"{name:>32} {round_trips:>12} {elapsed:>8.1f}")
+
+        # Regression guard: listing dengan gambar tidak boleh lagi bergantung pada ukuran halaman
+        for name, round_trips, _ in rows[1:]:
+            limit = 1 if "warm" in name else 2
+            assert round_trips <= limit, f"{name}: {round_trips} round trips (max {limit})"
+    finally:
+        await client.drop_database(BENCH_DB)
+        client.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
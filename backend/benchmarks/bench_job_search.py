@@ -0,0 +1,119 @@
+"""
+Benchmark pencarian job: regex $or (mode "regex") vs text index berbobot (mode "text").
+
+Untuk setiap ukuran koleksi, job sintetis di-seed ke database terpisah, index dibuat dengan
+create_log_view_indexes (sama seperti saat startup), lalu beberapa query dijalankan lewat
+JobController.search_jobs dan count_search_jobs. Dilaporkan median latency dan jumlah dokumen
+yang diperiksa MongoDB (dari explain). Count diukur dua kali: cold (job_count_cache dikosongkan
+sebelum setiap pengukuran, jadi query benar-benar sampai ke MongoDB) dan warm (hit cache).
+
+Butuh MongoDB (database benchmark dihapus setelah selesai).
+Jalankan dari folder backend:
+    MONGODB_URI=mongodb://localhost:27017 python -m benchmarks.bench_job_search --sizes 10000 100000 1000000
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+from datetime import datetime
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.config.database_indexes import create_log_view_indexes
+from app.controllers.job_controller import JobController
+from app.utils.cache import job_count_cache
+
+BENCH_DB = "getajob_bench_search"
+SEED_BATCH_SIZE = 10000
+
+TITLES = ["Software Engineer", "Data Analyst", "Marketing Staff", "Akuntan", "Desainer Grafis",
+          "Customer Service", "Guru Bahasa Inggris", "Admin Gudang", "Perawat", "Sales Executive"]
+SKILLS = ["python", "excel", "sql", "komunikasi", "photoshop", "akuntansi", "negosiasi",
+          "react", "mengajar", "kepemimpinan", "figma", "java"]
+CITIES = ["Jakarta", "Bandung", "Surabaya", "Yogyakarta", "Medan", "Semarang", "Makassar", "Denpasar"]
+TYPES = ["Full-time", "Part-time", "Internship", "Contract"]
+WORDS = ["tim", "dinamis", "berpengalaman", "kantor", "pelanggan", "laporan", "proyek", "target",
+         "jadwal", "fleksibel", "gaji", "kompetitif", "lingkungan", "kerja", "profesional"]
+QUERIES = ["python", "engineer", "Bandung", "akuntan", "customer service", "figma"]
+
+def make_job(rng: random.Random, i: int, recruiter_id: ObjectId) -> dict:
+    return {
+        "job_title": rng.choice(TITLES),
+        "company_name": f"PT Contoh {i % 5000}",
+        "location": rng.choice(CITIES),
+        "employment_type": rng.choice(TYPES),
+        "minimum_education": "S1",
+        "required_skills": rng.sample(SKILLS, 3),
+        "description": " ".join(rng.choices(WORDS, k=30)),
+        "recruiter_id": recruiter_id,
+        "created_at": datetime.now(),
+        "updated_at": datetime.now(),
+    }
+
+async def seed(db, n_jobs: int):
+    rng = random.Random(42)
+    recruiter_id = ObjectId()
+    await db.recruiters.insert_one({"_id": recruiter_id})
+    for start in range(0, n_jobs, SEED_BATCH_SIZE):
+        batch = [make_job(rng, i, recruiter_id) for i in range(start, min(n_jobs, start + SEED_BATCH_SIZE))]
+        await db.jobs.insert_many(batch, ordered=False)
+    await create_log_view_indexes(db)
+
+async def docs_examined(db, controller: JobController, query: str, mode: str, limit: int) -> int:
+    search_query = controller._build_search_query(query, mode)
+    cursor = controller._sort_search(db.jobs.find(search_query), query, mode).limit(limit)
+    plan = await cursor.explain()
+    return plan.get("executionStats", {}).get("totalDocsExamined", -1)
+
+async def run_size(client, n_jobs: int, limit: int, repeats: int):
+    await client.drop_database(BENCH_DB)
+    db = client[BENCH_DB]
+    start = time.perf_counter()
+    await seed(db, n_jobs)
+    print(f"\n{n_jobs} jobs (seed {time.perf_counter() - start:.1f}s)")
+    print(f"{'query':>18} {'mode':>6} {'search ms':>10} {'count ms':>10} {'warm ms':>8} {'hits':>9} {'docs examined':>14}")
+
+    controller = JobController(db)
+    for query in QUERIES:
+        for mode in ("regex", "text"):
+            search_times, count_times, warm_count_times = [], [], []
+            for _ in range(repeats):
+                job_count_cache.clear()
+                t0 = time.perf_counter()
+                await controller.search_jobs(query, 0, limit, mode)
+                t1 = time.perf_counter()
+                hits = await controller.count_search_jobs(query, mode)
+                t2 = time.perf_counter()
+                await controller.count_search_jobs(query, mode)
+                t3 = time.perf_counter()
+                search_times.append((t1 - t0) * 1000)
+                count_times.append((t2 - t1) * 1000)
+                warm_count_times.append((t3 - t2) * 1000)
+            examined = await docs_examined(db, controller, query, mode, limit)
+            print(f"{query:>18} {mode:>6} {statistics.median(search_times):>10.1f} "
+                  f"{statistics.median(count_times):>10.1f} {statistics.median(warm_count_times):>8.2f} "
+                  f"{hits:>9} {examined:>14}")
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    db_url = os.getenv("MONGODB_URI")
+    if not db_url:
+        raise SystemExit("MONGODB_URI belum di-set")
+
+    client = AsyncIOMotorClient(db_url)
+    try:
+        for n_jobs in args.sizes:
+            await run_size(client, n_jobs, args.limit, args.repeats)
+    finally:
+        await client.drop_database(BENCH_DB)
+        client.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
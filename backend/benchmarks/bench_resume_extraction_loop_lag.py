@@ -0,0 +1,113 @@
+"""
+Benchmark event-loop stall (loop lag) saat ekstraksi teks dan identifikasi section resume PDF besar.
+
+Membandingkan ResumeParser(content=...) yang berjalan sinkron di event loop dengan
+ResumeParser.create(content=...) yang menjalankan fitz dan identifikasi section di process pool.
+Selama parsing berjalan, sebuah monitor mengukur keterlambatan tick asyncio.sleep (loop lag) dan
+traffic API tiruan (request ringan yang hanya menunggu I/O 1ms) mengukur latency per request.
+PDF sintetis dibuat dengan fitz (banyak halaman berisi header section dan bullet pengalaman).
+
+Jalankan dari folder backend:
+    python -m benchmarks.bench_resume_extraction_loop_lag --pages 20 --parses 8 --concurrency 4
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import fitz
+
+from app.ai_services.pdf_parser import ResumeParser
+from app.utils.constants import RESUME_PARSING_WORKERS
+from app.utils.process_pool import ProcessPool
+
+class NoopGroq:
+    """Parser hanya dibuat (tanpa parse), jadi client LLM tidak pernah dipanggil"""
+
+def make_pdf(pages: int) -> bytes:
+    doc = fitz.open()
+    headers = ["Experience", "Skills", "Education", "Achievements", "Organisasi"]
+    for page_number in range(pages):
+        page = doc.new_page()
+        lines = [f"{headers[page_number % len(headers)]}:"]
+        for line in range(45):
+            lines.append(f"- Mengerjakan proyek {page_number}-{line} dengan Python, FastAPI, dan MongoDB untuk tim produk")
+        page.insert_text((36, 36), "\n".join(lines), fontsize=8)
+    return doc.tobytes()
+
+def percentile(values, q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))] if values else 0.0
+
+async def monitor_lag(stop: asyncio.Event, interval: float, lags: list):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append((time.perf_counter() - start - interval) * 1000)
+
+async def api_traffic(stop: asyncio.Event, rate: float, latencies: list):
+    """Request tiruan: setiap request menunggu I/O 1ms, latency di atas itu adalah antrian event loop"""
+    async def request():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    tasks = []
+    while not stop.is_set():
+        tasks.append(asyncio.create_task(request()))
+        await asyncio.sleep(1 / rate)
+    await asyncio.gather(*tasks)
+
+async def run_variant(name: str, build, content: bytes, parses: int, concurrency: int, rate: float):
+    stop = asyncio.Event()
+    lags, latencies = [], []
+    background = [
+        asyncio.create_task(monitor_lag(stop, 0.005, lags)),
+        asyncio.create_task(api_traffic(stop, rate, latencies)),
+    ]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            parser = await build(content)
+            return len(parser.sections)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(parses)))
+    total = time.perf_counter() - start
+    stop.set()
+    await asyncio.gather(*background)
+
+    print(f"{name:>18} {total:>8.2f} {max(lags):>10.1f} {percentile(lags, 0.99):>10.1f} "
+          f"{statistics.median(latencies):>9.2f} {percentile(latencies, 0.99):>9.2f}")
+
+async def build_sync(content: bytes) -> ResumeParser:
+    return ResumeParser(content=content, groq=NoopGroq())
+
+async def build_pool(content: bytes) -> ResumeParser:
+    return await ResumeParser.create(content=content, groq=NoopGroq())
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--parses", type=int, default=8, help="Jumlah PDF yang diproses per varian")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--rate", type=float, default=500, help="Request tiruan per detik")
+    args = parser.parse_args()
+
+    content = make_pdf(args.pages)
+    sync_parser = await build_sync(content)
+    # Warm up: spawn semua worker dan import modul di worker sebelum diukur
+    pool_parser, *_ = await asyncio.gather(*(build_pool(content) for _ in range(RESUME_PARSING_WORKERS * 2)))
+    assert (sync_parser.text, sync_parser.sections) == (pool_parser.text, pool_parser.sections)
+
+    print(f"PDF {args.pages} halaman ({len(content) // 1024} KB), {args.parses} parse, concurrency {args.concurrency}, "
+          f"{args.rate:.0f} req/s")
+    print(f"{'variant':>18} {'total s':>8} {'max lag ms':>10} {'p99 lag ms':>10} {'req p50 ms':>9} {'req p99 ms':>9}")
+    try:
+        await run_variant("sync (event loop)", build_sync, content, args.parses, args.concurrency, args.rate)
+        await run_variant("process pool", build_pool, content, args.parses, args.concurrency, args.rate)
+    finally:
+        ProcessPool.shutdown()
+
+if __name__ == "__main__":
+    asyncio.run(main())
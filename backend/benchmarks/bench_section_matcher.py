@@ -0,0 +1,165 @@
+"""
+Benchmark dan uji kesetaraan identifikasi section resume.
+
+Membandingkan implementasi lama (satu regex dikompilasi dan dijalankan per keyword, rfind/find
+per match) dengan SectionHeaderMatcher (regex dikompilasi sekali, satu kali pindai kandidat baris).
+Korpus berisi contoh resume dengan variasi format header (bullet, titik dua, huruf besar/kecil,
+CRLF, header berturut-turut, keyword di dalam kalimat) ditambah resume acak dari generator
+ber-seed, dan opsional teks dari folder PDF. Setiap dokumen di korpus wajib menghasilkan
+dictionary section yang identik, jika tidak benchmark berhenti dengan AssertionError.
+
+Jalankan dari folder backend:
+    python -m benchmarks.bench_section_matcher --random 2000 --repeats 5
+    python -m benchmarks.bench_section_matcher --pdf-dir ./contoh_cv
+"""
+import argparse
+import asyncio
+import random
+import re
+import statistics
+import time
+from pathlib import Path
+
+from app.ai_services.pdf_parser import SECTION_KEYWORDS, extract_pdf_text, identify_sections
+
+def legacy_identify_sections(text: str, section_keywords: dict = SECTION_KEYWORDS) -> dict:
+    """Implementasi _identify_sections sebelum SectionHeaderMatcher (acuan kesetaraan)"""
+    section_positions = []
+    for section_name, keywords in section_keywords.items():
+        for keyword in keywords:
+            pattern = re.compile(
+                rf'(?:^|\n)[ \t]*'
+                rf'(?:\S{{0,3}}[ \t]*)?'
+                rf'({re.escape(keyword)})'
+                rf'[ \t]*(?::|●|•|\*|-|–|\.|\s|$)',
+                re.IGNORECASE
+            )
+            for match in pattern.finditer(text):
+                pos = match.start(1)
+                line_start = max(0, text.rfind('\n', 0, pos) + 1)
+                line_end = text.find('\n', pos)
+                if line_end == -1:
+                    line_end = len(text)
+                full_line = text[line_start:line_end].strip()
+                word_count = len(full_line.split())
+                if len(text[line_start:pos].strip()) <= 3 and word_count <= 4:
+                    section_positions.append((pos, section_name))
+
+    section_positions.sort()
+    if not section_positions:
+        return {"personal": [(0, len(text))]}
+
+    sections = {}
+    for i, (pos, section_name) in enumerate(section_positions):
+        header_end = text.find('\n', pos)
+        if header_end == -1:
+            header_end = len(text)
+        start = header_end + 1
+        if i + 1 < len(section_positions):
+            next_header_pos = section_positions[i+1][0]
+            end = max(0, text.rfind('\n', 0, next_header_pos) + 1)
+        else:
+            end = len(text)
+        sections.setdefault(section_name, []).append((start, end))
+
+    first_line_start = max(0, text.rfind('\n', 0, section_positions[0][0]) + 1)
+    sections["personal"] = [(0, first_line_start)]
+    return sections
+
+HANDWRITTEN_CORPUS = [
+    "",
+    "Budi Santoso\nbudi@example.com",
+    "Skills\nPython, SQL",
+    "\nSkills\nPython",
+    "Skills\nSkills\nPython",
+    "Skills:\nSkills:\nPython",
+    "Skills  \nSkills\t\nPython",
+    "SKILLS AND ABILITIES\nKomunikasi\nEDUCATION •\nUGM",
+    "  ● Pengalaman Kerja\n- PT Contoh\n• Pendidikan:\nSMA 3",
+    "1. Experience\n2. Education\n3. Achievements.",
+    "Work Experience\r\nPT Contoh\r\nEducation\r\nUGM\r\n",
+    "Saya punya pengalaman di bidang backend dan experience di data\nSkill: Python",
+    "Organizationorganisasi\nHIMA\nOrganisasi\nBEM\nOrganizational Experience\nPanitia",
+    "Riwayat Pendidikan\nUGM\nRiwayat Jabatan\nKetua\nRiwayat Pekerjaan\nStaff",
+    "Sertifikat – AWS\nPenghargaan - Juara 1\nPrestasi\nFinalis",
+    "xxSkills\nabcEducation\nabcdEducation\n",
+    "Skills",
+    "Skills\n",
+    "Skills and abilities and more words\nExperience",
+    "Experience Experience\nExperienceExperience\nexperiences:",
+    "Technical Skills: Python\nSoft skills - komunikasi",
+    "Keahlian\n\n\nKemampuan\n\nKecakapan\nAbility\nAbilities",
+    "\n\n\nEducation\n",
+    "Education \nUGM\nEducation :\nUI",
+    "Certifications\nCertification\nAchievement\nAchievements\nPencapaian",
+]
+
+WORDS = ["Python", "FastAPI", "MongoDB", "membangun", "layanan", "untuk", "tim", "produk", "dan", "data",
+         "Universitas", "Gadjah", "Mada", "Jakarta", "2021", "sekarang", "IPK", "3.72", "PT", "Contoh"]
+PREFIXES = ["", "", "", "- ", "• ", "● ", "* ", "1. ", "A) ", "  ", "\t", "xx", "abcd ", "II "]
+SUFFIXES = ["", "", ":", " :", " -", " –", ".", " •", " ●", "*", "  ", "\t", " Kerja", " dan Prestasi", "s", "x"]
+
+def random_resume(rng: random.Random) -> str:
+    keywords = [keyword for keywords in SECTION_KEYWORDS.values() for keyword in keywords]
+    lines = [rng.choice(WORDS) + " " + rng.choice(WORDS)]
+    for _ in range(rng.randint(0, 40)):
+        roll = rng.random()
+        if roll < 0.3:
+            keyword = rng.choice(keywords)
+            keyword = rng.choice([keyword, keyword.upper(), keyword.title()])
+            lines.append(rng.choice(PREFIXES) + keyword + rng.choice(SUFFIXES))
+        elif roll < 0.4:
+            lines.append("")
+        else:
+            sentence = [rng.choice(WORDS) for _ in range(rng.randint(1, 14))]
+            if rng.random() < 0.2:
+                sentence.insert(rng.randint(0, len(sentence)), rng.choice(keywords))
+            lines.append(rng.choice(["", "- ", "• "]) + " ".join(sentence))
+    separator = rng.choice(["\n", "\n", "\n", "\r\n"])
+    text = separator.join(lines)
+    return rng.choice(["", "\n", " "]) + text + rng.choice(["", "\n", " \n"])
+
+def build_corpus(random_count: int, seed: int, pdf_dir: str = None):
+    rng = random.Random(seed)
+    corpus = list(HANDWRITTEN_CORPUS)
+    corpus += [random_resume(rng) for _ in range(random_count)]
+    if pdf_dir:
+        corpus += [extract_pdf_text(str(path)) for path in sorted(Path(pdf_dir).glob("*.pdf"))]
+    return corpus
+
+def assert_equivalent(corpus):
+    for index, text in enumerate(corpus):
+        expected, actual = legacy_identify_sections(text), identify_sections(text)
+        assert actual == expected, f"Dokumen #{index} berbeda:\n{text!r}\nlama: {expected}\nbaru: {actual}"
+
+def time_corpus(fn, corpus, repeats: int) -> float:
+    """Median waktu (ms) untuk memproses seluruh korpus"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for text in corpus:
+            fn(text)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--random", type=int, default=2000, help="Jumlah resume acak di korpus")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--pdf-dir", help="Folder berisi PDF resume untuk ditambahkan ke korpus")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.random, args.seed, args.pdf_dir)
+    assert_equivalent(corpus)
+    # Dokumen panjang: gabungan seluruh korpus (mirip CV banyak halaman)
+    long_text = "\n".join(corpus)
+    assert_equivalent([long_text])
+    print(f"{len(corpus)} dokumen + 1 dokumen gabungan ({len(long_text) // 1024} KB) identik")
+
+    print(f"{'variant':>16} {'corpus ms':>10} {'long doc ms':>12}")
+    for name, fn in (("legacy", legacy_identify_sections), ("single pass", identify_sections)):
+        print(f"{name:>16} {time_corpus(fn, corpus, args.repeats):>10.1f} {time_corpus(fn, [long_text], args.repeats):>12.1f}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,55 @@
+import random
+
+from app.utils.job_search_index import JobSearchIndex, normalize_term
+
+ALPHABET = "abc"
+
+def random_job(rng: random.Random, job_id: int) -> dict:
+    def word():
+        return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(1, 6)))
+
+    return {
+        "_id": str(job_id),
+        "job_title": " ".join(word() for _ in range(rng.randint(1, 3))),
+        "company_name": word(),
+        "location": word(),
+        "required_skills": [word() for _ in range(rng.randint(0, 3))],
+    }
+
+def brute_force_suggest(index: JobSearchIndex, prefix: str, limit: int):
+    """Scan semua term yang diawali prefix, urut jumlah job terbanyak lalu alfabetis"""
+    trailing_space = prefix[-1:].isspace()
+    prefix = normalize_term(prefix) + (" " if trailing_space else "")
+    terms = sorted((term for term in index.postings if term.startswith(prefix)), key=index._rank)
+    return [(index.display[term], len(index.postings[term])) for term in terms[:limit]]
+
+def test_suggest_matches_brute_force_scan_under_random_updates():
+    rng = random.Random(13)
+    index = JobSearchIndex()
+    jobs = {}
+    next_id = 0
+    prefixes = ["a", "b", "c", "ab", "ba", "cc", "abc", "a ", "b "]
+
+    for step in range(6000):
+        # Fase tumbuh dan menyusut bergantian, agar prefix berat sempat punya daftar yang tidak penuh
+        add_ratio = 0.7 if (step // 1000) % 2 == 0 else 0.1
+        action = rng.random()
+        if action < add_ratio or len(jobs) < 5:
+            jobs[next_id] = random_job(rng, next_id)
+            index.add_job(jobs[next_id])
+            next_id += 1
+        elif action < add_ratio + 0.15:
+            job_id = rng.choice(list(jobs))
+            jobs[job_id] = random_job(rng, job_id)
+            index.add_job(jobs[job_id])
+        else:
+            job_id = rng.choice(list(jobs))
+            del jobs[job_id]
+            index.remove_job(str(job_id))
+
+        if step % 25 == 0:
+            for prefix in prefixes:
+                limit = rng.choice([5, 10, 50])
+                assert index.suggest(prefix, limit) == brute_force_suggest(index, prefix, limit), (step, prefix)
+
+    assert index.heavy_prefixes, "korpus uji harus cukup besar untuk memakai daftar top-k prefix berat"
@@ -0,0 +1,20 @@
+import random
+
+import pytest
+
+from app.ai_services.pdf_parser import identify_sections
+from benchmarks.bench_section_matcher import HANDWRITTEN_CORPUS, legacy_identify_sections, random_resume
+
+@pytest.mark.parametrize("text", HANDWRITTEN_CORPUS)
+def test_handwritten_corpus_matches_legacy(text):
+    assert identify_sections(text) == legacy_identify_sections(text)
+
+def test_random_resumes_match_legacy():
+    rng = random.Random(25)
+    corpus = [random_resume(rng) for _ in range(2000)]
+    for index, text in enumerate(corpus):
+        assert identify_sections(text) == legacy_identify_sections(text), f"Dokumen #{index} berbeda:\n{text!r}"
+
+    # Dokumen panjang: gabungan seluruh korpus (mirip CV banyak halaman)
+    long_text = "\n".join(corpus)
+    assert identify_sections(long_text) == legacy_identify_sections(long_text)